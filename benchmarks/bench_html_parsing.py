@@ -0,0 +1,64 @@
+"""
+Compare the BeautifulSoup tree builders available to ``parse_html``, by parsing each of the Statsguru player page
+fixtures into career rows with each of them, and checking that every builder gives the same rows.
+
+``selectolax`` is not compared, because it isn't a BeautifulSoup tree builder, so the extractors can't run on it.
+
+Run from the repository root with:
+
+    python -m benchmarks.bench_html_parsing
+"""
+
+import time
+from argparse import ArgumentParser
+from pathlib import Path
+from statistics import median
+from unittest import mock
+
+from pycricinfo import html_parsing
+from pycricinfo.models.source.pages.player import CareerBattingRow, CareerBowlingRow, CareerFieldingRow
+from pycricinfo.player_stats_pages import _parse_career_summary_rows
+
+FIXTURES_FOLDER = Path(__file__).parent.parent / "tests" / "test_files" / "player"
+ROW_MODELS = {"batting": CareerBattingRow, "bowling": CareerBowlingRow, "fielding": CareerFieldingRow}
+
+
+def available_backends() -> list[str]:
+    return ["html.parser"] + (["lxml"] if html_parsing.lxml is not None else [])
+
+
+def measure(backend: str, html: str, row_model: type, repeats: int) -> tuple[float, list]:
+    """Return the median duration in milliseconds of parsing the page, and the rows parsed from it."""
+    with mock.patch.object(html_parsing, "get_html_parser_backend", return_value=backend):
+        durations = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            rows = _parse_career_summary_rows(html, row_model)
+            durations.append((time.perf_counter() - start) * 1000)
+
+    return median(durations), rows
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument("--repeats", type=int, default=10, help="How many times to parse each fixture")
+    args = parser.parse_args()
+
+    backends = available_backends()
+    if len(backends) == 1:
+        print("lxml is not installed, so only html.parser is measured")
+
+    print(f"{'fixture':<40}{'backend':<14}{'median ms':>12}{'same rows':>12}")
+    for fixture in sorted(FIXTURES_FOLDER.glob("*.html")):
+        html = fixture.read_text(encoding="utf-8")
+        row_model = next((model for name, model in ROW_MODELS.items() if name in fixture.name), CareerBattingRow)
+
+        baseline_rows = None
+        for backend in backends:
+            duration, rows = measure(backend, html, row_model, args.repeats)
+            baseline_rows = rows if baseline_rows is None else baseline_rows
+            print(f"{fixture.name:<40}{backend:<14}{duration:>12.1f}{str(rows == baseline_rows):>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Compare the two ways of turning a raw JSON response into a model, over the match summary fixtures:
+
+* ``dict``: decode to a dictionary, rebuild it with ``replace_empty_objects_with_null``, then ``model_validate``
+* ``json``: ``validate_json_to_model``, which decodes with pydantic's parser and only copies what it nulls out
+
+Run from the repository root with:
+
+    python -m benchmarks.bench_json_parsing
+"""
+
+import json
+import time
+import tracemalloc
+from argparse import ArgumentParser
+from pathlib import Path
+from statistics import median
+from typing import Callable
+
+from pycricinfo.models.source import Match
+from pycricinfo.utils import replace_empty_objects_with_null, validate_json_to_model
+
+FIXTURES_FOLDER = Path(__file__).parent.parent / "tests" / "test_files" / "match"
+
+
+def parse_via_dict(content: bytes) -> Match:
+    return Match.model_validate(replace_empty_objects_with_null(json.loads(content)))
+
+
+def parse_via_json(content: bytes) -> Match:
+    return validate_json_to_model(content, Match)
+
+
+def measure(parse: Callable[[bytes], Match], content: bytes, repeats: int) -> tuple[float, float]:
+    """Return the median duration in milliseconds, and the peak memory allocated in MB, of parsing the content."""
+    durations = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        parse(content)
+        durations.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    parse(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return median(durations), peak / 1024 / 1024
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument("--repeats", type=int, default=10, help="How many times to parse each fixture")
+    args = parser.parse_args()
+
+    print(f"{'fixture':<20}{'path':<8}{'median ms':>12}{'peak MB':>12}")
+    for fixture in sorted(FIXTURES_FOLDER.glob("*.json")):
+        content = fixture.read_bytes()
+        for name, parse in (("dict", parse_via_dict), ("json", parse_via_json)):
+            duration, peak = measure(parse, content, args.repeats)
+            print(f"{fixture.name:<20}{name:<8}{duration:>12.1f}{peak:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
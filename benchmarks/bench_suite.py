@@ -0,0 +1,241 @@
+"""
+Time and memory profile the CPU-bound hot paths over the fixtures in ``tests/test_files``, and compare the results
+with a saved baseline, so that a change which slows parsing or rendering down is noticed:
+
+* ``load_dict_to_model`` for every ``Match`` and ``MatchBasic`` fixture
+* ``load_json_to_model`` for every ``APIResponseCommentary`` page
+* ``CricinfoScorecard`` construction, and ``Scorecard.show`` rendering, for every ``Match`` fixture
+* ``_parse_career_summary_rows`` for every Statsguru page
+
+Each benchmark is timed over ``--repeats`` runs after a warm-up run, and then run once more under ``tracemalloc`` to
+measure its peak memory allocation.
+
+Run from the repository root, saving a baseline, then later comparing against it with:
+
+    python -m benchmarks.bench_suite --save
+    python -m benchmarks.bench_suite --compare
+
+``--compare`` exits with status 1 if any benchmark is more than ``--threshold`` slower than its baseline, or
+allocates that much more memory at its peak.
+
+The baseline in ``benchmarks/baselines/bench_suite.json`` is committed, along with the Python version, platform and
+processor it was recorded on. Timings from a different machine are not comparable with it, so to compare on another
+machine, such as a CI runner, first save a baseline there from the commit being compared against:
+
+    git checkout main && python -m benchmarks.bench_suite --save
+    git checkout - && python -m benchmarks.bench_suite --compare
+"""
+
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from argparse import ArgumentParser
+from datetime import UTC, datetime
+from pathlib import Path
+from statistics import median
+from typing import Callable, Iterator
+
+from pydantic import BaseModel
+
+from pycricinfo.models.output.scorecard import CricinfoScorecard
+from pycricinfo.models.source import Match, MatchBasic
+from pycricinfo.models.source.api.commentary import APIResponseCommentary
+from pycricinfo.models.source.pages.player import CareerBattingRow, CareerBowlingRow, CareerFieldingRow
+from pycricinfo.player_stats_pages import _parse_career_summary_rows
+from pycricinfo.utils import load_dict_to_model, load_json_to_model
+
+FIXTURES_FOLDER = Path(__file__).parent.parent / "tests" / "test_files"
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "bench_suite.json"
+ROW_MODELS = {"batting": CareerBattingRow, "bowling": CareerBowlingRow, "fielding": CareerFieldingRow}
+
+
+class BenchmarkResult(BaseModel):
+    median_ms: float
+    min_ms: float
+    peak_mb: float
+
+
+class BenchmarkRun(BaseModel):
+    """The results of a run of the suite, with enough about where it ran to tell whether two runs are comparable."""
+
+    created_at: datetime
+    python_version: str
+    platform: str
+    machine: str = ""
+    repeats: int
+    results: dict[str, BenchmarkResult]
+
+
+def benchmarks() -> Iterator[tuple[str, Callable[[], object]]]:
+    """Yield the name of each benchmark, and a function which runs it once, with its fixture already loaded."""
+    for fixture in sorted((FIXTURES_FOLDER / "match").glob("*.json")):
+        data = json.loads(fixture.read_bytes())
+        match = load_dict_to_model(data, Match)
+        scorecard = CricinfoScorecard(match=match)
+        yield f"load_dict_to_model[Match:{fixture.stem}]", lambda data=data: load_dict_to_model(data, Match)
+        yield f"CricinfoScorecard[{fixture.stem}]", lambda match=match: CricinfoScorecard(match=match)
+        yield f"Scorecard.show[{fixture.stem}]", lambda scorecard=scorecard: _show_quietly(scorecard)
+
+    for fixture in sorted((FIXTURES_FOLDER / "match_basic").glob("*.json")):
+        data = json.loads(fixture.read_bytes())
+        yield f"load_dict_to_model[MatchBasic:{fixture.stem}]", lambda data=data: load_dict_to_model(data, MatchBasic)
+
+    for fixture in sorted((FIXTURES_FOLDER / "ball_by_ball").glob("*.json")):
+        content = fixture.read_bytes()
+        yield (
+            f"APIResponseCommentary[{fixture.stem}]",
+            lambda content=content: load_json_to_model(content, APIResponseCommentary),
+        )
+
+    for fixture in sorted((FIXTURES_FOLDER / "player").glob("*.html")):
+        html = fixture.read_text(encoding="utf-8")
+        row_model = next((model for name, model in ROW_MODELS.items() if name in fixture.name), CareerBattingRow)
+        yield (
+            f"_parse_career_summary_rows[{fixture.stem}]",
+            lambda html=html, row_model=row_model: _parse_career_summary_rows(html, row_model),
+        )
+
+
+def _show_quietly(scorecard: CricinfoScorecard) -> None:
+    with contextlib.redirect_stdout(io.StringIO()):
+        scorecard.show(include_batting_minutes=True, include_bowling_dots=True)
+
+
+def _describe_machine() -> str:
+    """Describe the processor which the suite is running on, with its number of CPUs."""
+    processor = platform.processor()
+    with contextlib.suppress(OSError):
+        with open("/proc/cpuinfo") as cpuinfo:
+            processor = next((line.split(":", 1)[1].strip() for line in cpuinfo if line.startswith("model name")), "")
+    return f"{processor or platform.machine()}, {os.cpu_count()} CPUs"
+
+
+def measure(run: Callable[[], object], repeats: int) -> BenchmarkResult:
+    """Time a benchmark over a number of runs after a warm-up run, then measure its peak memory allocation."""
+    run()
+
+    durations = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        durations.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return BenchmarkResult(median_ms=median(durations), min_ms=min(durations), peak_mb=peak / 1024 / 1024)
+
+
+def run_suite(repeats: int, name_filter: str | None = None) -> BenchmarkRun:
+    results = {}
+    for name, run in benchmarks():
+        if name_filter and name_filter not in name:
+            continue
+        results[name] = measure(run, repeats)
+        print(f"{name:<60}{results[name].median_ms:>12.2f} ms{results[name].peak_mb:>10.2f} MB", file=sys.stderr)
+
+    return BenchmarkRun(
+        created_at=datetime.now(UTC),
+        python_version=platform.python_version(),
+        platform=platform.platform(),
+        machine=_describe_machine(),
+        repeats=repeats,
+        results=results,
+    )
+
+
+def compare(baseline: BenchmarkRun, current: BenchmarkRun, threshold: float) -> list[str]:
+    """
+    Print a report comparing each benchmark with its baseline.
+
+    Returns
+    -------
+    list[str]
+        The names of the benchmarks which are more than ``threshold`` slower, or peak at that much more memory
+    """
+    if (baseline.python_version, baseline.platform, baseline.machine) != (
+        current.python_version,
+        current.platform,
+        current.machine,
+    ):
+        print(
+            f"Warning: the baseline is from Python {baseline.python_version} on {baseline.platform} "
+            f"({baseline.machine or 'unknown machine'}), so timings may not be comparable"
+        )
+
+    regressions = []
+    print(f"{'benchmark':<60}{'base ms':>10}{'now ms':>10}{'change':>9}{'base MB':>10}{'now MB':>10}{'change':>9}")
+    for name, result in current.results.items():
+        base = baseline.results.get(name)
+        if base is None:
+            print(f"{name:<60}{'-':>10}{result.median_ms:>10.2f}{'new':>9}{'-':>10}{result.peak_mb:>10.2f}{'new':>9}")
+            continue
+
+        time_change = _change(base.median_ms, result.median_ms)
+        memory_change = _change(base.peak_mb, result.peak_mb)
+        regressed = time_change > threshold or memory_change > threshold
+        if regressed:
+            regressions.append(name)
+        print(
+            f"{name:<60}{base.median_ms:>10.2f}{result.median_ms:>10.2f}{time_change:>+9.0%}"
+            f"{base.peak_mb:>10.2f}{result.peak_mb:>10.2f}{memory_change:>+9.0%}{'  REGRESSION' if regressed else ''}"
+        )
+
+    for name in baseline.results.keys() - current.results.keys():
+        print(f"{name:<60}{'missing from this run':>20}")
+
+    return regressions
+
+
+def _change(base: float, now: float) -> float:
+    return (now - base) / base if base else 0.0
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument("--repeats", type=int, default=10, help="How many times to time each benchmark")
+    parser.add_argument("--filter", default=None, help="Only run benchmarks whose name contains this")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="The baseline file")
+    parser.add_argument("--save", action="store_true", help="Save the results as the baseline")
+    parser.add_argument("--compare", action="store_true", help="Compare the results with the baseline")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="The fractional slowdown to report as a regression"
+    )
+    args = parser.parse_args()
+
+    current = run_suite(args.repeats, args.filter)
+
+    baseline = BenchmarkRun.model_validate_json(args.baseline.read_bytes()) if args.baseline.exists() else None
+
+    regressions = []
+    if args.compare:
+        if baseline is None:
+            sys.exit(f"No baseline at {args.baseline}: save one with --save")
+        compared = baseline.model_copy(
+            update={"results": {name: result for name, result in baseline.results.items() if name in current.results}}
+            if args.filter
+            else {}
+        )
+        regressions = compare(compared, current, args.threshold)
+    if args.save:
+        # Saving a filtered run only replaces the baseline of the benchmarks which were run
+        if args.filter and baseline is not None:
+            current.results = baseline.results | current.results
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(current.model_dump_json(indent=2))
+        print(f"Saved baseline to {args.baseline}")
+
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+Load test the transport layer against the local stub server in ``benchmarks.stub_server``, and report throughput and
+latency percentiles. One of three scenarios is driven, each with a fixed number of requests in flight:
+
+* ``get_request``: raw match summaries (``match_basic``) through ``get_request``
+* ``get_match``: parsed match summaries through ``get_match``
+* ``api``: match summaries through the FastAPI app, served by uvicorn on the same event loop as the load generator
+
+Response caching, archiving and rate limiting are switched off by default, so that every request reaches the stub.
+Requests are spread over ``--distinct-ids`` match IDs, so that concurrent identical requests, which are coalesced,
+are only as common as you choose.
+
+Run from the repository root with:
+
+    python -m benchmarks.load_test --scenario get_match --requests 2000 --concurrency 50 --latency 0.02
+"""
+
+import asyncio
+import time
+from argparse import ArgumentParser
+from collections import Counter
+from statistics import quantiles
+from typing import Awaitable, Callable
+
+import aiohttp
+
+from benchmarks.stub_server import StubSettings, start_stub_server, use_stub_server
+from pycricinfo.api_helper import get_request, shared_session_lifespan
+from pycricinfo.call_cricinfo_api import get_match
+from pycricinfo.config import BaseRoute, RateLimit, RateLimits, get_settings
+
+SERIES_ID = 1
+FIRST_MATCH_ID = 1_000_000
+
+
+def _driver(scenario: str, api_url: str | None, client: aiohttp.ClientSession | None) -> Callable[[int], Awaitable]:
+    """Get the function which makes one request for a match ID, in a scenario."""
+    if scenario == "get_request":
+        route = get_settings().routes.match_basic
+        return lambda match_id: get_request(route, params={"match_id": match_id}, base_route=BaseRoute.core)
+    if scenario == "get_match":
+        return lambda match_id: get_match(SERIES_ID, match_id)
+
+    async def request_api(match_id: int) -> None:
+        async with client.get(f"{api_url}/match/summary/{SERIES_ID}/{match_id}") as response:
+            await response.read()
+            if response.status != 200:
+                raise RuntimeError(f"API status {response.status}")
+
+    return request_api
+
+
+async def run_load(
+    request: Callable[[int], Awaitable], total: int, concurrency: int, distinct_ids: int
+) -> tuple[float, list[float], Counter]:
+    """
+    Make ``total`` requests, ``concurrency`` at a time.
+
+    Returns
+    -------
+    tuple[float, list[float], Counter]
+        The elapsed time in seconds, the latency of each successful request in milliseconds, and a count of the
+        errors raised, by type
+    """
+    latencies: list[float] = []
+    errors: Counter = Counter()
+    next_request = iter(range(total))
+
+    async def worker() -> None:
+        for index in next_request:
+            start = time.perf_counter()
+            try:
+                await request(FIRST_MATCH_ID + index % distinct_ids)
+            except Exception as ex:
+                errors[type(ex).__name__] += 1
+            else:
+                latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    async with asyncio.TaskGroup() as task_group:
+        for _ in range(concurrency):
+            task_group.create_task(worker())
+    return time.perf_counter() - start, latencies, errors
+
+
+def print_report(scenario: str, total: int, elapsed: float, latencies: list[float], errors: Counter) -> None:
+    print(f"scenario:     {scenario}")
+    print(f"requests:     {total} in {elapsed:.2f}s, {total / elapsed:.1f} req/s")
+    print(f"errors:       {sum(errors.values())} {dict(errors) if errors else ''}")
+    if len(latencies) >= 2:
+        percentiles = quantiles(latencies, n=100, method="inclusive")
+        print(
+            f"latency (ms): p50 {percentiles[49]:.1f}  p95 {percentiles[94]:.1f}  p99 {percentiles[98]:.1f}  "
+            f"max {max(latencies):.1f}"
+        )
+
+
+async def main_async(args) -> None:
+    stub_settings = StubSettings(
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        bot_page_rate=args.bot_page_rate,
+        seed=args.seed,
+    )
+    stub_runner, stub_url = await start_stub_server(stub_settings)
+
+    settings = get_settings()
+    use_stub_server(stub_url)
+    settings.archive_responses = False
+    settings.cache_enabled = args.cache
+    if not args.rate_limits:
+        settings.rate_limits = RateLimits(**{name: RateLimit(rate=0, burst=1) for name in RateLimits.model_fields})
+
+    api_server = api_task = client = api_url = None
+    try:
+        if args.scenario == "api":
+            import uvicorn
+
+            from pycricinfo.api.server import app
+
+            api_server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=args.api_port, log_level="warning"))
+            api_task = asyncio.create_task(api_server.serve())
+            while not api_server.started:
+                await asyncio.sleep(0.01)
+            api_url = f"http://127.0.0.1:{args.api_port}"
+            client = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=args.concurrency))
+            request = _driver(args.scenario, api_url, client)
+            elapsed, latencies, errors = await run_load(request, args.requests, args.concurrency, args.distinct_ids)
+        else:
+            async with shared_session_lifespan():
+                request = _driver(args.scenario, None, None)
+                elapsed, latencies, errors = await run_load(request, args.requests, args.concurrency, args.distinct_ids)
+    finally:
+        if client is not None:
+            await client.close()
+        if api_server is not None:
+            api_server.should_exit = True
+            await api_task
+        await stub_runner.cleanup()
+
+    print_report(args.scenario, args.requests, elapsed, latencies, errors)
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument("--scenario", choices=["get_request", "get_match", "api"], default="get_request")
+    parser.add_argument("--requests", type=int, default=1000, help="How many requests to make in total")
+    parser.add_argument("--concurrency", type=int, default=20, help="How many requests to have in flight at once")
+    parser.add_argument("--distinct-ids", type=int, default=1000, help="How many different match IDs to request")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds the stub delays every response by")
+    parser.add_argument("--latency-jitter", type=float, default=0.0, help="Up to how many more seconds to delay by")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of stub responses to fail with a 503")
+    parser.add_argument("--bot-page-rate", type=float, default=0.0, help="Fraction of stub page responses to block")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--cache", action="store_true", help="Leave response caching on")
+    parser.add_argument("--rate-limits", action="store_true", help="Leave rate limiting on")
+    parser.add_argument("--api-port", type=int, default=8095, help="The port to serve the API on, for the api scenario")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
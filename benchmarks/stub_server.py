@@ -0,0 +1,264 @@
+"""
+A local stand-in for the Cricinfo APIs and pages, which serves the fixtures in ``tests/test_files`` on the same route
+shapes as ``CoreAPIRoutes`` and ``PageRoutes``, so the transport layer can be exercised without touching ESPN.
+
+Each base route is served under its own prefix, ``/core/``, ``/site/``, ``/page/`` and ``/stats/``. A request for an ID
+with no fixture of its own is served the first fixture of that kind, so that load tests can spread requests over as
+many distinct routes as they like. Routes with no fixtures at all return a 404.
+
+Latency, 5xx errors and Akamai-style 403 bot protection pages (on the page and Statsguru routes only, as upstream) can
+be injected with ``StubSettings``.
+
+Run from the repository root with:
+
+    python -m benchmarks.stub_server --port 8090 --latency 0.05 --error-rate 0.01
+
+then point another process at it with the environment variables it prints.
+"""
+
+import asyncio
+import random
+import re
+from argparse import ArgumentParser
+from pathlib import Path
+from typing import Optional
+
+from aiohttp import web
+from pydantic import BaseModel
+
+from pycricinfo.config import BaseRoute, get_settings
+
+FIXTURES_FOLDER = Path(__file__).parent.parent / "tests" / "test_files"
+
+BOT_PROTECTION_PAGE = (
+    "<html><head><title>Access Denied</title></head><body><h1>Access Denied</h1>"
+    "You don't have permission to access this server. Reference: https://errors.edgesuite.net/</body></html>"
+)
+
+# The setting holding the base URL of each base route, and the prefix it is served under by the stub
+BASE_ROUTE_SETTINGS = {
+    BaseRoute.core: "core_base_route_v2",
+    BaseRoute.site: "site_base_route_v2",
+    BaseRoute.page: "cricinfo_base_route",
+    BaseRoute.stats: "stats_base_route",
+}
+
+
+class StubSettings(BaseModel):
+    """
+    The faults to inject into every response: a delay of ``latency`` seconds, plus up to ``latency_jitter`` seconds
+    more, and a ``error_rate`` fraction of 503 responses. A ``bot_page_rate`` fraction of page and Statsguru requests
+    are answered with a 403 bot protection page instead.
+    """
+
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    error_rate: float = 0.0
+    bot_page_rate: float = 0.0
+    seed: Optional[int] = None
+
+
+class _Fixtures:
+    """The fixtures of one kind, loaded into memory, looked up by the name of their file without its extension."""
+
+    def __init__(self, pattern: Optional[str] = None, content_type: str = "application/json"):
+        self.content_type = content_type
+        paths = sorted(FIXTURES_FOLDER.glob(pattern)) if pattern else []
+        self.by_name = {path.stem: path.read_bytes() for path in paths}
+
+    def response(self, *names: str) -> web.Response:
+        if not self.by_name:
+            return web.json_response({"code": 404, "message": "No fixture for this route"}, status=404)
+        body = next((self.by_name[name] for name in names if name in self.by_name), next(iter(self.by_name.values())))
+        return web.Response(body=body, content_type=self.content_type)
+
+
+def create_stub_app(settings: Optional[StubSettings] = None) -> web.Application:
+    """
+    Create the stub server application.
+
+    Parameters
+    ----------
+    settings : Optional[StubSettings], optional
+        The faults to inject, by default none
+
+    Returns
+    -------
+    web.Application
+        The application, to be run with an ``aiohttp.web.AppRunner``
+    """
+    settings = settings or StubSettings()
+    rng = random.Random(settings.seed)
+    routes = get_settings().routes
+    page_routes = get_settings().page_routes
+
+    match_basic = _Fixtures("match_basic/*.json", "application/json")
+    match_summary = _Fixtures("match/*.json", "application/json")
+    play_by_play = _Fixtures("ball_by_ball/*.json", "application/json")
+    player = _Fixtures("player/*.json", "application/json")
+    stats_pages = {
+        stat_type: _Fixtures(f"player/*_stats_page_{stat_type}_*.html", "text/html")
+        for stat_type in ("batting", "bowling", "fielding")
+    }
+    no_fixtures = _Fixtures()
+
+    async def homepage(_: web.Request) -> web.Response:
+        return web.Response(text="<html><head><title>ESPNcricinfo</title></head></html>", content_type="text/html")
+
+    async def core(request: web.Request) -> web.Response:
+        name = request.match_info.route.name
+        if name == "match_basic":
+            return match_basic.response(f"{request.match_info['match_id']}_basic")
+        if name == "player":
+            return player.response(request.match_info["player_id"])
+        return no_fixtures.response()
+
+    async def site_summary(request: web.Request) -> web.Response:
+        return match_summary.response(_query_params(request).get("event", ""))
+
+    async def site_play_by_play(request: web.Request) -> web.Response:
+        query = _query_params(request)
+        return play_by_play.response(f"{query.get('event')}_{query.get('period')}_{query.get('page')}")
+
+    async def player_stats(request: web.Request) -> web.Response:
+        stat_type = _query_params(request).get("type", "batting")
+        fixtures = stats_pages.get(stat_type, no_fixtures)
+        return fixtures.response(f"{request.match_info['player_id']}_stats_page_{stat_type}_all")
+
+    async def page(_: web.Request) -> web.Response:
+        return no_fixtures.response()
+
+    @web.middleware
+    async def inject_faults(request: web.Request, handler) -> web.StreamResponse:
+        if settings.latency or settings.latency_jitter:
+            await asyncio.sleep(settings.latency + rng.uniform(0, settings.latency_jitter))
+        if settings.error_rate and rng.random() < settings.error_rate:
+            return web.json_response({"code": 503, "message": "Injected error"}, status=503)
+        is_page = request.path.startswith(("/page/", "/stats/"))
+        if is_page and settings.bot_page_rate and rng.random() < settings.bot_page_rate:
+            return web.Response(text=BOT_PROTECTION_PAGE, status=403, content_type="text/html")
+        return await handler(request)
+
+    app = web.Application(middlewares=[inject_faults])
+    app.router.add_get("/page/", homepage)
+    app.router.add_get(f"/site/{_path_of(routes.match_summary)}", site_summary)
+    app.router.add_get(f"/site/{_path_of(routes.play_by_play_page)}", site_play_by_play)
+    for name, route in routes.model_dump().items():
+        if name not in ("match_summary", "play_by_play_page"):
+            app.router.add_get(f"/core/{_path_of(route)}", core, name=name)
+    app.router.add_get(f"/stats/{_path_of(page_routes.player_stats)}", player_stats)
+    for name, route in page_routes.model_dump().items():
+        if name != "player_stats":
+            app.router.add_get(f"/page/{_path_of(route)}", page)
+    return app
+
+
+def stub_base_routes(base_url: str) -> dict[str, str]:
+    """
+    Get the settings which point the client at a stub server.
+
+    Parameters
+    ----------
+    base_url : str
+        The URL of the stub server, such as ``http://127.0.0.1:8090``
+
+    Returns
+    -------
+    dict[str, str]
+        The value of each base route setting
+    """
+    return {
+        setting: f"{base_url.rstrip('/')}/{base_route.name}/" for base_route, setting in BASE_ROUTE_SETTINGS.items()
+    }
+
+
+def use_stub_server(base_url: str) -> None:
+    """
+    Point this process's settings at a stub server.
+
+    Parameters
+    ----------
+    base_url : str
+        The URL of the stub server
+    """
+    for setting, value in stub_base_routes(base_url).items():
+        setattr(get_settings(), setting, value)
+
+
+async def start_stub_server(
+    settings: Optional[StubSettings] = None, host: str = "127.0.0.1", port: int = 0
+) -> tuple[web.AppRunner, str]:
+    """
+    Start the stub server on the running event loop.
+
+    Parameters
+    ----------
+    settings : Optional[StubSettings], optional
+        The faults to inject, by default none
+    host : str, optional
+        The interface to listen on, by default 127.0.0.1
+    port : int, optional
+        The port to listen on, by default any free port
+
+    Returns
+    -------
+    tuple[web.AppRunner, str]
+        The runner, to be cleaned up when finished with, and the URL of the server
+    """
+    runner = web.AppRunner(create_stub_app(settings), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    bound_port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://{host}:{bound_port}"
+
+
+def _path_of(route: str) -> str:
+    """
+    Get the path of a route template without its query string, as an aiohttp route pattern. A parameter which appears
+    more than once, like the match ID in the core API routes, only captures its first appearance.
+    """
+    seen = set()
+
+    def rename_repeat(placeholder: re.Match) -> str:
+        name = placeholder.group(1)
+        if name in seen:
+            return "{" + f"{name}_{len(seen)}" + "}"
+        seen.add(name)
+        return placeholder.group(0)
+
+    return re.sub(r"\{(\w+)\}", rename_repeat, route.split("?", 1)[0])
+
+
+def _query_params(request: web.Request) -> dict[str, str]:
+    """Parse the query string of a request, which on the page routes uses ";" as well as "&" between parameters."""
+    return dict(part.split("=", 1) for part in re.split(r"[;&]", request.query_string) if "=" in part)
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds to delay every response by")
+    parser.add_argument("--latency-jitter", type=float, default=0.0, help="Up to how many more seconds to delay by")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of responses to fail with a 503")
+    parser.add_argument("--bot-page-rate", type=float, default=0.0, help="Fraction of page responses to block")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    settings = StubSettings(
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        bot_page_rate=args.bot_page_rate,
+        seed=args.seed,
+    )
+    base_url = f"http://{args.host}:{args.port}"
+    print("Point a client at the stub server with:")
+    for setting, value in stub_base_routes(base_url).items():
+        print(f"    {setting.upper()}={value}")
+    web.run_app(create_stub_app(settings), host=args.host, port=args.port, access_log=None, print=None)
+
+
+if __name__ == "__main__":
+    main()
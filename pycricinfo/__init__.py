@@ -1,8 +1,20 @@
 # ruff: noqa: F401, F403
 from pycricinfo.search import *
 
+from .api_helper import close_shared_session as close_shared_session
 from .api_helper import create_session as create_session
+from .api_helper import get_shared_session as get_shared_session
+from .api_helper import shared_session_lifespan as shared_session_lifespan
 from .call_cricinfo_api import *
+from .commentary import get_innings_commentary as get_innings_commentary
+from .commentary import get_match_commentary as get_match_commentary
+from .commentary import stream_deliveries as stream_deliveries
+from .crawler import SeasonCrawler as SeasonCrawler
+from .instrumentation import add_span_hook as add_span_hook
+from .instrumentation import get_request_counts as get_request_counts
+from .instrumentation import remove_span_hook as remove_span_hook
+from .live import LivePoller as LivePoller
 from .models.output import *
-from .player_stats_pages import get_player_career
+from .player_stats_pages import get_player_career, get_player_careers
+from .scheduler import PollScheduler as PollScheduler
 from .types import *
@@ -0,0 +1,66 @@
+from contextlib import asynccontextmanager
+from typing import Annotated, Any, AsyncIterator, Optional
+
+import aiohttp
+from fastapi import Depends, Request
+
+from pycricinfo.api_helper import get_request, shared_session_lifespan
+from pycricinfo.cache import ResponseCache, create_response_cache, set_response_cache
+from pycricinfo.config import BaseRoute
+from pycricinfo.rate_limit import RateLimiter, create_rate_limiter, set_rate_limiter
+
+
+class UpstreamClient:
+    """
+    The pooled upstream HTTP session, response cache and rate limiter which the API shares between all of its
+    requests, created by the app's lifespan and handed to endpoints with ``get_upstream_client``.
+    """
+
+    def __init__(self, session: aiohttp.ClientSession, cache: ResponseCache, rate_limiter: RateLimiter):
+        self.session = session
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+
+    @property
+    def request_options(self) -> dict[str, Any]:
+        """
+        The ``session``, ``cache`` and ``rate_limiter`` keyword arguments which make any of the functions which call
+        Cricinfo, such as ``get_match``, use this client.
+        """
+        return {"session": self.session, "cache": self.cache, "rate_limiter": self.rate_limiter}
+
+    async def get_request(
+        self, route: str, params: Optional[dict[str, str]] = None, base_route: BaseRoute = BaseRoute.core
+    ) -> dict | str:
+        """Make a GET request with ``api_helper.get_request``, through this client's session, cache and limiter."""
+        return await get_request(route, params, base_route, **self.request_options)
+
+
+@asynccontextmanager
+async def upstream_client_lifespan() -> AsyncIterator[UpstreamClient]:
+    """
+    Create the upstream client for the lifetime of the app, and install its session, cache and rate limiter as the
+    process-wide defaults, so that anything called without them, such as the live feeds, shares them too.
+
+    Yields
+    ------
+    UpstreamClient
+        The upstream client
+    """
+    cache = create_response_cache()
+    rate_limiter = create_rate_limiter()
+    set_response_cache(cache)
+    set_rate_limiter(rate_limiter)
+    try:
+        async with shared_session_lifespan() as session:
+            yield UpstreamClient(session, cache, rate_limiter)
+    finally:
+        set_response_cache(None)
+        set_rate_limiter(None)
+
+
+def get_upstream_client(request: Request) -> UpstreamClient:
+    return request.app.state.upstream_client
+
+
+Upstream = Annotated[UpstreamClient, Depends(get_upstream_client)]
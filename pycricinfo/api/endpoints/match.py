@@ -2,7 +2,7 @@ from typing import Annotated
 
 from fastapi import APIRouter, Path, status
 
-from pycricinfo.api_helper import get_request
+from pycricinfo.api.dependencies import Upstream
 from pycricinfo.call_cricinfo_api import get_match, get_match_basic
 from pycricinfo.config import BaseRoute, get_settings
 from pycricinfo.models.source.api.match import Match, MatchBasic
@@ -15,8 +15,10 @@ router = APIRouter(prefix="/match", tags=["match"])
     responses={status.HTTP_200_OK: {"description": "The basic match data"}},
     summary="Get basic match data from the '/events' API",
 )
-async def match_basic(match_id: Annotated[int, Path(description="The ID of the Match")]) -> MatchBasic:
-    return await get_match_basic(match_id)
+async def match_basic(
+    match_id: Annotated[int, Path(description="The ID of the Match")], upstream: Upstream
+) -> MatchBasic:
+    return await get_match_basic(match_id, **upstream.request_options)
 
 
 @router.get(
@@ -27,8 +29,9 @@ async def match_basic(match_id: Annotated[int, Path(description="The ID of the M
 async def get_match_team(
     match_id: Annotated[int, Path(description="The ID of the Match")],
     team_id: Annotated[int, Path(description="The ID of the Team")],
+    upstream: Upstream,
 ):
-    return await get_request(
+    return await upstream.get_request(
         get_settings().routes.match_team,
         params={"match_id": match_id, "team_id": team_id},
         base_route=BaseRoute.core,
@@ -43,5 +46,6 @@ async def get_match_team(
 async def match_api(
     series_id: Annotated[int, Path(description="The Series ID")],
     match_id: Annotated[int, Path(description="The Match ID")],
+    upstream: Upstream,
 ) -> Match:
-    return await get_match(series_id, match_id)
+    return await get_match(series_id, match_id, **upstream.request_options)
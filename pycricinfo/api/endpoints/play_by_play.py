@@ -1,9 +1,14 @@
-from typing import Annotated
+import asyncio
+from typing import Annotated, AsyncIterator
 
 from fastapi import APIRouter, Depends, Path, status
+from fastapi.responses import StreamingResponse
 
+from pycricinfo.api.dependencies import Upstream
 from pycricinfo.api.utils import PageAndInningsQueryParameters
 from pycricinfo.call_cricinfo_api import get_play_by_play
+from pycricinfo.config import get_settings
+from pycricinfo.live import get_live_feed_hub
 from pycricinfo.models.source.api.commentary import Commentary
 
 router = APIRouter(prefix="", tags=["play_by_play"])
@@ -15,6 +20,46 @@ router = APIRouter(prefix="", tags=["play_by_play"])
     summary="Get a page of ball-by-ball data",
 )
 async def match_play_by_play_api(
-    match_id: Annotated[int, Path(description="The Match ID")], pi: PageAndInningsQueryParameters = Depends()
+    match_id: Annotated[int, Path(description="The Match ID")],
+    upstream: Upstream,
+    pi: PageAndInningsQueryParameters = Depends(),
 ) -> Commentary:
-    return await get_play_by_play(match_id, pi.innings, pi.page)
+    return await get_play_by_play(match_id, pi.innings, pi.page, **upstream.request_options)
+
+
+@router.get(
+    "/match/{match_id}/play_by_play/live",
+    response_class=StreamingResponse,
+    responses={status.HTTP_200_OK: {"description": "A stream of new deliveries", "content": {"text/event-stream": {}}}},
+    summary="Stream new deliveries as Server-Sent Events",
+)
+async def match_play_by_play_live_api(match_id: Annotated[int, Path(description="The Match ID")]):
+    return StreamingResponse(
+        _delivery_events(match_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _delivery_events(match_id: int) -> AsyncIterator[str]:
+    """
+    Generate a Server-Sent Event for each new delivery of a match, from the match's shared live feed. A comment is
+    sent when there have been no deliveries for a while, so that idle connections aren't closed by proxies.
+    """
+    hub = get_live_feed_hub()
+    heartbeat = get_settings().live_feed_heartbeat
+    queue = hub.subscribe(match_id)
+    try:
+        while True:
+            try:
+                delivery = await asyncio.wait_for(queue.get(), timeout=heartbeat)
+            except TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+
+            if delivery is None:
+                yield "event: end\ndata: {}\n\n"
+                return
+            yield f"event: delivery\nid: {delivery.sequence}\ndata: {delivery.model_dump_json()}\n\n"
+    finally:
+        hub.unsubscribe(match_id, queue)
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Path, status
 
+from pycricinfo.api.dependencies import Upstream
 from pycricinfo.call_cricinfo_api import get_player
 from pycricinfo.models.source.api.player import Player
 from pycricinfo.models.source.pages.player import Career
@@ -9,8 +10,8 @@ router = APIRouter(prefix="/player", tags=["player"])
 
 
 @router.get("/{player_id}", responses={status.HTTP_200_OK: {"description": "The Player"}}, summary="Get Player")
-async def player(player_id: int = Path(description="The Player ID")) -> Player:
-    return await get_player(player_id)
+async def player(upstream: Upstream, player_id: int = Path(description="The Player ID")) -> Player:
+    return await get_player(player_id, **upstream.request_options)
 
 
 @router.get(
@@ -18,5 +19,5 @@ async def player(player_id: int = Path(description="The Player ID")) -> Player:
     responses={status.HTTP_200_OK: {"description": "The Player career stats"}},
     summary="Get Player career stats",
 )
-async def player_career(player_id: int = Path(description="The Player ID")) -> Career:
-    return await get_player_career(player_id=player_id)
+async def player_career(upstream: Upstream, player_id: int = Path(description="The Player ID")) -> Career:
+    return await get_player_career(player_id=player_id, **upstream.request_options)
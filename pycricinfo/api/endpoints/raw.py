@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, Path, status
 
+from pycricinfo.api.dependencies import Upstream
 from pycricinfo.api.utils import PageAndInningsQueryParameters
-from pycricinfo.api_helper import get_request
 from pycricinfo.config import BaseRoute, get_settings
 
 router = APIRouter(prefix="/raw", tags=["Cricinfo: API"])
@@ -12,8 +12,8 @@ router = APIRouter(prefix="/raw", tags=["Cricinfo: API"])
     responses={status.HTTP_200_OK: {"description": "The basic match data"}},
     summary="Get basic match data from the '/events' API",
 )
-async def match_basic(match_id: int = Path(description="The Match ID")):
-    return await get_request(get_settings().routes.match_basic, params={"match_id": match_id})
+async def match_basic(upstream: Upstream, match_id: int = Path(description="The Match ID")):
+    return await upstream.get_request(get_settings().routes.match_basic, params={"match_id": match_id})
 
 
 @router.get(
@@ -21,8 +21,10 @@ async def match_basic(match_id: int = Path(description="The Match ID")):
     responses={status.HTTP_200_OK: {"description": "The basic match data"}},
     summary="Get a match's Team",
 )
-async def match_team(match_id: int = Path(description="The Match ID"), team_id: int = Path(description="The Team ID")):
-    return await get_request(
+async def match_team(
+    upstream: Upstream, match_id: int = Path(description="The Match ID"), team_id: int = Path(description="The Team ID")
+):
+    return await upstream.get_request(
         get_settings().routes.match_team,
         {"match_id": match_id, "team_id": team_id},
         BaseRoute.core,
@@ -35,9 +37,9 @@ async def match_team(match_id: int = Path(description="The Match ID"), team_id:
     summary="Get a match Team's roster",
 )
 async def match_team_roster(
-    match_id: int = Path(description="The Match ID"), team_id: int = Path(description="The Team ID")
+    upstream: Upstream, match_id: int = Path(description="The Match ID"), team_id: int = Path(description="The Team ID")
 ):
-    return await get_request(
+    return await upstream.get_request(
         get_settings().routes.match_team_roster,
         {"match_id": match_id, "team_id": team_id},
         BaseRoute.core,
@@ -50,10 +52,11 @@ async def match_team_roster(
     summary="Get a match Team's innings",
 )
 async def match_team_all_innings(
+    upstream: Upstream,
     match_id: int = Path(description="The Match ID"),
     team_id: int = Path(description="The Team ID"),
 ):
-    return await get_request(
+    return await upstream.get_request(
         get_settings().routes.match_team_all_innings,
         {"match_id": match_id, "team_id": team_id},
         BaseRoute.core,
@@ -66,11 +69,12 @@ async def match_team_all_innings(
     summary="Get a match Team's innings",
 )
 async def match_team_innings(
+    upstream: Upstream,
     match_id: int = Path(description="The Match ID"),
     team_id: int = Path(description="The Team ID"),
     innings: int = Path(description="The innings number"),
 ):
-    return await get_request(
+    return await upstream.get_request(
         get_settings().routes.match_team_innings,
         {"match_id": match_id, "team_id": team_id, "innings": innings},
         BaseRoute.core,
@@ -83,11 +87,12 @@ async def match_team_innings(
     summary="Get a match Team's statistics",
 )
 async def match_team_statistics(
+    upstream: Upstream,
     series_id: int = Path(description="The Series ID"),
     match_id: int = Path(description="The Match ID"),
     team_id: int = Path(description="The Team ID"),
 ):
-    return await get_request(
+    return await upstream.get_request(
         get_settings().routes.match_team_statistics,
         {"series_id": series_id, "match_id": match_id, "team_id": team_id},
         BaseRoute.core,
@@ -100,11 +105,12 @@ async def match_team_statistics(
     summary="Get a match Team's innings",
 )
 async def match_player_all_innings(
+    upstream: Upstream,
     match_id: int = Path(description="The Match ID"),
     team_id: int = Path(description="The Team ID"),
     player_id: int = Path(description="The Player ID"),
 ):
-    return await get_request(
+    return await upstream.get_request(
         get_settings().routes.match_player_all_innings,
         {"match_id": match_id, "team_id": team_id, "player_id": player_id},
         BaseRoute.core,
@@ -117,13 +123,14 @@ async def match_player_all_innings(
     summary="Get statistics for a player's innings",
 )
 async def match_player_innings_statistics(
+    upstream: Upstream,
     series_id: int = Path(description="The Series ID"),
     match_id: int = Path(description="The Match ID"),
     team_id: int = Path(description="The Team ID"),
     player_id: int = Path(description="The Player ID"),
     innings: int = Path(description="The innings number"),
 ):
-    return await get_request(
+    return await upstream.get_request(
         get_settings().routes.match_player_innings_statistics,
         {
             "series_id": series_id,
@@ -142,9 +149,9 @@ async def match_player_innings_statistics(
     summary="Get a page of ball-by-ball data",
 )
 async def match_play_by_play(
-    match_id: int = Path(description="The Match ID"), pi: PageAndInningsQueryParameters = Depends()
+    upstream: Upstream, match_id: int = Path(description="The Match ID"), pi: PageAndInningsQueryParameters = Depends()
 ):
-    return await get_request(
+    return await upstream.get_request(
         get_settings().routes.play_by_play_page,
         {"match_id": match_id, "page": pi.page, "innings": pi.innings},
         BaseRoute.site,
@@ -156,8 +163,8 @@ async def match_play_by_play(
     responses={status.HTTP_200_OK: {"description": "The match summary"}},
     summary="Get a match summary",
 )
-async def match_summary(match_id: int = Path(description="The Match ID")):
-    return await get_request(
+async def match_summary(upstream: Upstream, match_id: int = Path(description="The Match ID")):
+    return await upstream.get_request(
         get_settings().routes.match_summary, params={"match_id": match_id}, base_route=BaseRoute.site
     )
 
@@ -167,8 +174,8 @@ async def match_summary(match_id: int = Path(description="The Match ID")):
     responses={status.HTTP_200_OK: {"description": "A Venue's data"}},
     summary="Get a Venue",
 )
-async def venue(venue_id: int = Path(description="The Venue ID")):
-    return await get_request(get_settings().routes.venue, params={"venue_id": venue_id})
+async def venue(upstream: Upstream, venue_id: int = Path(description="The Venue ID")):
+    return await upstream.get_request(get_settings().routes.venue, params={"venue_id": venue_id})
 
 
 @router.get(
@@ -176,8 +183,8 @@ async def venue(venue_id: int = Path(description="The Venue ID")):
     responses={status.HTTP_200_OK: {"description": "A League's data"}},
     summary="Get a League",
 )
-async def league(league_id: int = Path(description="The League ID")):
-    return await get_request(get_settings().routes.league, params={"league_id": league_id})
+async def league(upstream: Upstream, league_id: int = Path(description="The League ID")):
+    return await upstream.get_request(get_settings().routes.league, params={"league_id": league_id})
 
 
 @router.get(
@@ -186,18 +193,22 @@ async def league(league_id: int = Path(description="The League ID")):
     summary="Get an event (aka: a series of matches) in a League",
 )
 async def series_in_league(
-    league_id: int = Path(description="The League ID"), event_id: int = Path(description="The Event ID")
+    upstream: Upstream,
+    league_id: int = Path(description="The League ID"),
+    event_id: int = Path(description="The Event ID"),
 ):
-    return await get_request(get_settings().routes.league_event, params={"league_id": league_id, "event_id": event_id})
+    return await upstream.get_request(
+        get_settings().routes.league_event, params={"league_id": league_id, "event_id": event_id}
+    )
 
 
 @router.get(
     "/team/{team_id}", responses={status.HTTP_200_OK: {"description": "The Team data"}}, summary="Get Team data"
 )
-async def team(team_id: int = Path(description="The Team ID")):
-    return await get_request(get_settings().routes.team, params={"team_id": team_id})
+async def team(upstream: Upstream, team_id: int = Path(description="The Team ID")):
+    return await upstream.get_request(get_settings().routes.team, params={"team_id": team_id})
 
 
 @router.get("/player/{player_id}", responses={status.HTTP_200_OK: {"description": "The Player"}}, summary="Get Player")
-async def player(player_id: int = Path(description="The Player ID")):
-    return await get_request(get_settings().routes.player, params={"player_id": player_id})
+async def player(upstream: Upstream, player_id: int = Path(description="The Player ID")):
+    return await upstream.get_request(get_settings().routes.player, params={"player_id": player_id})
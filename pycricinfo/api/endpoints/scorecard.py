@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Path, status
 
+from pycricinfo.api.dependencies import Upstream
 from pycricinfo.call_cricinfo_api import (
     get_scorecard,
 )
@@ -14,6 +15,8 @@ router = APIRouter(prefix="/scorecard", tags=["scorecard"])
     summary="Get a match scorecard",
 )
 async def scorecard(
-    series_id: int = Path(description="The Series ID"), match_id: int = Path(description="The Match ID")
+    upstream: Upstream,
+    series_id: int = Path(description="The Series ID"),
+    match_id: int = Path(description="The Match ID"),
 ) -> CricinfoScorecard:
-    return await get_scorecard(series_id, match_id)
+    return await get_scorecard(series_id, match_id, **upstream.request_options)
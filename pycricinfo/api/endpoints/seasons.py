@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Path, Query, status
 
+from pycricinfo.api.dependencies import Upstream
 from pycricinfo.models.source.pages.series import MatchResult, MatchTypeWithSeries
 from pycricinfo.search.seasons import get_match_types_in_season
 from pycricinfo.search.series import get_match_results_in_series
@@ -18,13 +19,14 @@ router = APIRouter(prefix="", tags=["seasons"])
     summary="Get a list of match types, each containing a list of series in that match type for this season",
 )
 async def match_types_in_season(
+    upstream: Upstream,
     season_name: int | str = Path(description='The name of the season to get matches for, e.g. "2024" or "2020-21"'),
     match_type_name: MatchTypeNames = Query(
         default=None, description="Filter the response to just matches of the named type"
     ),
 ) -> list[MatchTypeWithSeries]:
     season_name = season_name.replace("-", "/") if isinstance(season_name, str) else season_name
-    match_types = await get_match_types_in_season(season_name, match_type_name)
+    match_types = await get_match_types_in_season(season_name, match_type_name, **upstream.request_options)
 
     return match_types
 
@@ -34,5 +36,7 @@ async def match_types_in_season(
     responses={status.HTTP_200_OK: {"description": "A list of IDs of the matches in the supplied series"}},
     summary="Get a list of IDs of the matches in the supplied series",
 )
-async def match_ids_in_series(data_series_id: int = Path(description="The ID of a series")) -> list[MatchResult]:
-    return await get_match_results_in_series(data_series_id)
+async def match_ids_in_series(
+    upstream: Upstream, data_series_id: int = Path(description="The ID of a series")
+) -> list[MatchResult]:
+    return await get_match_results_in_series(data_series_id, **upstream.request_options)
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Path, status
 
+from pycricinfo.api.dependencies import Upstream
 from pycricinfo.call_cricinfo_api import get_team
 from pycricinfo.models.source.api.team import TeamFull
 
@@ -7,5 +8,5 @@ router = APIRouter(prefix="/team", tags=["team"])
 
 
 @router.get("/{team_id}", responses={status.HTTP_200_OK: {"description": "The Team data"}}, summary="Get Team data")
-async def team(team_id: int = Path(description="The Team ID")) -> TeamFull:
-    return await get_team(team_id)
+async def team(upstream: Upstream, team_id: int = Path(description="The Team ID")) -> TeamFull:
+    return await get_team(team_id, **upstream.request_options)
@@ -1,8 +1,14 @@
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 import uvicorn
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
+from pycricinfo.api.dependencies import upstream_client_lifespan
 from pycricinfo.api.endpoints.match import router as match_router
+from pycricinfo.api.endpoints.metrics import router as metrics_router
 from pycricinfo.api.endpoints.play_by_play import router as play_by_play_router
 from pycricinfo.api.endpoints.player import router as player_router
 from pycricinfo.api.endpoints.raw import router as raw_router
@@ -11,9 +17,36 @@ from pycricinfo.api.endpoints.seasons import router as seasons_router
 from pycricinfo.api.endpoints.team import router as team_router
 from pycricinfo.config import get_settings
 from pycricinfo.exceptions import CricinfoAPIException
+from pycricinfo.executor import shutdown_parse_executor
+from pycricinfo.live import get_live_feed_hub
+from pycricinfo.metrics import EventLoopLagMonitor, get_metrics
 from pycricinfo.utils import get_field_from_pyproject
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Create the upstream client on startup, holding the pooled HTTP session, response cache and rate limiter shared by
+    every endpoint through the ``Upstream`` dependency, and close it on shutdown, after stopping any live feeds. The
+    parse executor is shut down last. While metrics are collected, the lag of the event loop is sampled throughout.
+    """
+    lag_monitor = None
+    if (metrics := get_metrics()) is not None:
+        lag_monitor = EventLoopLagMonitor(metrics.event_loop_lag, get_settings().event_loop_lag_interval)
+        lag_monitor.start()
+
+    async with upstream_client_lifespan() as upstream_client:
+        app.state.upstream_client = upstream_client
+        yield
+        await get_live_feed_hub().close()
+    shutdown_parse_executor()
+
+    if lag_monitor is not None:
+        await lag_monitor.stop()
+
+
 app = FastAPI(
+    lifespan=lifespan,
     version=get_field_from_pyproject("version"),
     title="pycricinfo API",
     swagger_ui_parameters={
@@ -38,6 +71,27 @@ app.include_router(seasons_router)
 app.include_router(scorecard_router)
 app.include_router(team_router)
 
+if get_metrics() is not None:
+    app.include_router(metrics_router)
+
+    @app.middleware("http")
+    async def record_request_metrics(request: Request, call_next):
+        """Time each request to the API, labelled by the route template it matched rather than its path."""
+        metrics = get_metrics()
+        metrics.http_in_flight.inc()
+        started_at = time.perf_counter()
+        status = 500
+        try:
+            response = await call_next(request)
+            status = response.status_code
+            return response
+        finally:
+            metrics.http_in_flight.dec()
+            route = request.scope.get("route")
+            metrics.http_request_duration.labels(
+                method=request.method, route=getattr(route, "path", "unmatched"), status=status
+            ).observe(time.perf_counter() - started_at)
+
 
 @app.exception_handler(CricinfoAPIException)
 def overall_exception_handler(_: Request, exc: CricinfoAPIException):
@@ -1,10 +1,11 @@
 import asyncio
 import json
 import logging
+import random
+import time
 import uuid
-from datetime import UTC, datetime
-from pathlib import Path
-from typing import Optional, Type, TypeVar
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional, Type, TypeVar
 from urllib.parse import urljoin, urlparse
 
 import aiohttp
@@ -16,9 +17,22 @@ try:
 except ImportError:  # pragma: no cover - optional at runtime in some environments
     curl_requests = None
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+from pycricinfo.archive import get_response_archiver
+from pycricinfo.cache import ResponseCache, get_cache_key, get_response_cache, get_route_cache_ttl
 from pycricinfo.config import BaseRoute, get_settings
 from pycricinfo.exceptions import CricinfoAPIException
-from pycricinfo.utils import replace_empty_objects_with_null
+from pycricinfo.executor import run_parser
+from pycricinfo.instrumentation import count_request, create_trace_config, get_current_span, record_span, span
+from pycricinfo.rate_limit import RateLimiter, get_rate_limiter
+from pycricinfo.replay import get_replay_archive
+from pycricinfo.resilience import get_circuit_breaker, get_retry_delay
+from pycricinfo.single_flight import SingleFlight
+from pycricinfo.utils import validate_json_to_model
 
 logger = logging.getLogger("cricinfo")
 T = TypeVar("T", bound=BaseModel)
@@ -31,6 +45,12 @@ _COMMON_BROWSER_HEADERS = {
     "Pragma": "no-cache",
 }
 
+_shared_session: Optional[aiohttp.ClientSession] = None
+_shared_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+_in_flight_requests = SingleFlight()
+_in_flight_parses = SingleFlight()
+
 
 async def get_and_parse(
     route: str,
@@ -39,6 +59,9 @@ async def get_and_parse(
     null_out_empty_dicts: bool = False,
     base_route: BaseRoute = BaseRoute.core,
     session: Optional[aiohttp.ClientSession] = None,
+    cache: Optional[ResponseCache] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    use_cache: bool = True,
 ) -> T:
     """
     Make a GET request to the API and parse the response to the supplied type
@@ -56,24 +79,59 @@ async def get_and_parse(
     base_route: BaseRoute, optional
         The base route to use for the API call, by default BaseRoute.core
     session : aiohttp.ClientSession, optional
-        An existing session to use for the request. If None, a new session is created and
-        closed after the request. Pass a session created by ``create_session()`` to persist
-        cookies across multiple requests, by default None
+        An existing session to use for the request. If None, the process-wide pooled session from
+        ``get_shared_session()`` is used. Pass a session created by ``create_session()`` to keep
+        cookies isolated from other requests, by default None
+    cache : ResponseCache, optional
+        The response cache to use. If None, the process-wide cache from ``get_response_cache()`` is used,
+        by default None
+    rate_limiter : RateLimiter, optional
+        The rate limiter to pace upstream requests with. If None, the process-wide rate limiter from
+        ``get_rate_limiter()`` is used, by default None
+    use_cache : bool, optional
+        Whether to serve the response from, and store it in, the response cache, by default True
+
     Returns
     -------
     T
-        The response data parsed into the supplied model
+        The response data parsed into the supplied model. Concurrent calls for the same route, parameters, model
+        and session share a single request and parse, and each receives its own copy of the model.
     """
-    api_response = await get_request(route, params, base_route, session=session)
+    # Only callers using the same session share a parse, as a caller's own session holds its own cookies
+    parse_key = (
+        get_cache_key(_format_route(route, params or {}), base_route),
+        session,
+        type_to_parse,
+        null_out_empty_dicts,
+        use_cache,
+    )
+    is_leader = False
+
+    async def fetch_and_parse() -> T:
+        nonlocal is_leader
+        is_leader = True
+        body = await _get_response_body(
+            route,
+            params,
+            base_route,
+            response_output_sub_folder=None,
+            warm_session=False,
+            session=session,
+            use_cache=use_cache,
+            cache=cache,
+            rate_limiter=rate_limiter,
+        )
 
-    if null_out_empty_dicts:
-        api_response = replace_empty_objects_with_null(api_response)
+        try:
+            with span("cricinfo.validate", route_template=route, model=type_to_parse.__name__, bytes=len(body)):
+                return await run_parser(validate_json_to_model, body, type_to_parse, null_out_empty_dicts)
+        except ValidationError as ex:
+            logger.error(ex)
+            raise
 
-    try:
-        return type_to_parse.model_validate(api_response)
-    except ValidationError as ex:
-        logger.error(ex)
-        raise
+    model = await _in_flight_parses.run(parse_key, fetch_and_parse)
+    # Callers who joined another's parse each get their own copy, so that none of them sees another's changes to it
+    return model if is_leader else model.model_copy(deep=True)
 
 
 async def get_request(
@@ -83,6 +141,9 @@ async def get_request(
     response_output_sub_folder: str = None,
     warm_session: bool = False,
     session: Optional[aiohttp.ClientSession] = None,
+    use_cache: bool = True,
+    cache: Optional[ResponseCache] = None,
+    rate_limiter: Optional[RateLimiter] = None,
 ) -> dict | str:
     """
     Make a GET request to the Cricinfo API or page routes.
@@ -101,23 +162,187 @@ async def get_request(
         Whether to warm the session with a homepage navigation request before issuing the main request.
         Most useful for page routes that may require initial cookie setup, by default False
     session : aiohttp.ClientSession, optional
-        An existing session to use for the request. If None, a new session is created and
-        closed after the request. Pass a session created by ``create_session()`` to persist
-        cookies across multiple requests, by default None
+        An existing session to use for the request. If None, the process-wide pooled session from
+        ``get_shared_session()`` is used. Pass a session created by ``create_session()`` to keep
+        cookies isolated from other requests, by default None
+    use_cache : bool, optional
+        Whether to serve the response from, and store it in, the response cache. Responses are only cached
+        when caching is enabled in settings and the route has a non-zero TTL, by default True
+    cache : ResponseCache, optional
+        The response cache to use. If None, the process-wide cache from ``get_response_cache()`` is used,
+        by default None
+    rate_limiter : RateLimiter, optional
+        The rate limiter to pace upstream requests with. If None, the process-wide rate limiter from
+        ``get_rate_limiter()`` is used, by default None
+
     Returns
     -------
     dict | str
         The JSON content or HTML text of the response
     """
+    body = await _get_response_body(
+        route, params, base_route, response_output_sub_folder, warm_session, session, use_cache, cache, rate_limiter
+    )
+    with span("cricinfo.decode", route_template=route, bytes=len(body)):
+        return _decode_body(body)
+
+
+async def _get_response_body(
+    route: str,
+    params: Optional[dict[str, str]],
+    base_route: BaseRoute,
+    response_output_sub_folder: Optional[str],
+    warm_session: bool,
+    session: Optional[aiohttp.ClientSession],
+    use_cache: bool = True,
+    cache: Optional[ResponseCache] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> bytes | str:
+    """
+    Get the raw body of a response, from the response cache if possible. Otherwise, make the request upstream,
+    sharing a single request between concurrent callers of the same route with the same session and response output
+    sub-folder.
+
+    See ``get_request`` for a description of the parameters.
+
+    Returns
+    -------
+    bytes | str
+        The raw JSON content, or the HTML text of the response
+    """
+    route_template = route
+    if params:
+        route = _format_route(route, params)
+
+    response_cache = None
+    cache_ttl = get_route_cache_ttl(route_template)
+    cache_key = get_cache_key(route, base_route)
+    transport_mode = get_settings().transport_mode
+
+    if transport_mode == "replay":
+        return await _replay_response_body(cache_key, route, base_route)
+
+    if use_cache and get_settings().cache_enabled and cache_ttl > 0:
+        response_cache = cache or get_response_cache()
+        with span("cricinfo.cache_lookup", route_template=route_template) as lookup_span:
+            cached_body = await response_cache.get(cache_key)
+            lookup_span.attributes["hit"] = cached_body is not None
+        if cached_body is not None:
+            logger.debug("Cache hit: %s", cache_key, extra={"cricket_stats.request_route_template": route_template})
+            # Responses cached before recording started, such as on disk, must be recorded too, to be replayable
+            if transport_mode == "record":
+                await get_replay_archive().record(cache_key, cached_body)
+            return cached_body
+
+        # Data for a finished match never changes, so it can be kept forever
+        match_id = (params or {}).get("match_id")
+        if match_id is not None and await response_cache.is_match_complete(match_id):
+            cache_ttl = None
+
+    async def fetch_and_cache() -> bytes | str:
+        body = await _fetch_response_body(
+            route_template, route, base_route, response_output_sub_folder, warm_session, session, rate_limiter
+        )
+        if response_cache is not None:
+            await response_cache.set(cache_key, body, cache_ttl)
+        if transport_mode == "record":
+            await get_replay_archive().record(cache_key, body)
+        return body
+
+    # Requests are only shared between callers using the same session, whose responses are archived to the same place
+    request_key = (cache_key, session, response_output_sub_folder, warm_session)
+    return await _in_flight_requests.run(request_key, fetch_and_cache)
+
+
+async def _replay_response_body(cache_key: str, route: str, base_route: BaseRoute) -> bytes | str:
+    """
+    Serve a response from the replay archive, in the same form as it would have come from upstream.
+
+    Raises
+    ------
+    CricinfoAPIException
+        With a status code of 404, if the route has not been recorded
+    """
+    body = await get_replay_archive().load(cache_key, as_text=base_route in (BaseRoute.page, BaseRoute.stats))
+    if body is None:
+        raise CricinfoAPIException(
+            status_code=404, route=route, content={"message": f"No recorded response for '{cache_key}'"}
+        )
+    return body
+
+
+async def _fetch_response_body(
+    route_template: str,
+    route: str,
+    base_route: BaseRoute,
+    response_output_sub_folder: Optional[str],
+    warm_session: bool,
+    session: Optional[aiohttp.ClientSession],
+    rate_limiter: Optional[RateLimiter] = None,
+) -> bytes | str:
+    """
+    Make a GET request upstream, and return the raw body of a successful response.
+
+    Parameters
+    ----------
+    route_template : str
+        The unformatted route template, used for logging
+    route : str
+        The route with all parameters filled in
+    base_route : BaseRoute
+        The base route to use for the API call
+    response_output_sub_folder : Optional[str]
+        Sub-folder within the response output folder to write the response file
+    warm_session : bool
+        Whether to warm the session with a homepage navigation request before issuing the main request
+    session : Optional[aiohttp.ClientSession]
+        The session to use for the request, or None to use the process-wide pooled session
+    rate_limiter : Optional[RateLimiter], optional
+        The rate limiter to pace the request with, or None to use the process-wide rate limiter, by default None
+
+    Returns
+    -------
+    bytes | str
+        The raw JSON content, or the HTML text of the response
+    """
     request_id = str(uuid.uuid4())
+    with span(
+        "cricinfo.request", request_id=request_id, route_template=route_template, base_route=base_route.name
+    ) as request_span:
+        try:
+            return await _request_upstream(
+                request_id,
+                route_template,
+                route,
+                base_route,
+                response_output_sub_folder,
+                warm_session,
+                session,
+                rate_limiter or get_rate_limiter(),
+            )
+        finally:
+            count_request(route_template, request_span.attributes.get("status", "error"))
+
+
+async def _request_upstream(
+    request_id: str,
+    route_template: str,
+    route: str,
+    base_route: BaseRoute,
+    response_output_sub_folder: Optional[str],
+    warm_session: bool,
+    session: Optional[aiohttp.ClientSession],
+    rate_limiter: RateLimiter,
+) -> bytes | str:
+    """
+    Make a GET request upstream within the span of the request, with retries, and return the raw body of a
+    successful response. See ``_fetch_response_body`` for a description of the parameters.
+    """
     response_logging_extras = {
         "cricket_stats.request_id": request_id,
-        "cricket_stats.request_route_template": route,
+        "cricket_stats.request_route_template": route_template,
     }
 
-    if params:
-        route = _format_route(route, params)
-
     if base_route == BaseRoute.core:
         base = get_settings().core_base_route_v2
     elif base_route == BaseRoute.site:
@@ -132,57 +357,262 @@ async def get_request(
 
     headers = _get_request_headers(base_route=base_route, referer=referer)
 
-    logger.debug(f"Querying: {full_route}", extra={"cricket_stats.request_id": request_id})
+    logger.debug("Querying: %s", full_route, extra={"cricket_stats.request_id": request_id})
 
-    owned_session = session is None
-    if owned_session:
-        session = create_session()
-    try:
-        if warm_session and base_route == BaseRoute.page:
-            await _warm_page_session(session)
+    if session is None:
+        session = get_shared_session()
+
+    if warm_session and base_route == BaseRoute.page:
+        await rate_limiter.acquire(base_route)
+        await _warm_page_session(session)
+
+    response_status, body = await _send_with_retries(
+        session, full_route, headers, base_route, response_logging_extras, rate_limiter
+    )
+    response_logging_extras["cricket_stats.response_code"] = response_status
 
-        async with session.get(yarl.URL(full_route, encoded=True), headers=headers) as response:
-            response_status = response.status
+    if base_route in (BaseRoute.page, BaseRoute.stats):
+        if response_status == 403 or _is_bot_protection_page(body):
+            await rate_limiter.acquire(base_route)
+            fallback_output = await _retry_with_browser_tls(full_route=full_route, referer=referer)
+            if fallback_output is not None:
+                body = fallback_output
+                response_status = 200
+                response_logging_extras["cricket_stats.response_code"] = response_status
+                response_logging_extras["cricket_stats.transport_fallback"] = "curl_cffi"
+
+        if _is_bot_protection_page(body):
+            response_status = 403
             response_logging_extras["cricket_stats.response_code"] = response_status
+            response_logging_extras["cricket_stats.block_reason"] = "bot_protection_page"
 
-            if base_route in (BaseRoute.page, BaseRoute.stats):
-                output = await response.text()
-
-                if response_status == 403 or _is_bot_protection_page(output):
-                    fallback_output = await _retry_with_browser_tls(full_route=full_route, referer=referer)
-                    if fallback_output is not None:
-                        output = fallback_output
-                        response_status = 200
-                        response_logging_extras["cricket_stats.response_code"] = response_status
-                        response_logging_extras["cricket_stats.transport_fallback"] = "curl_cffi"
-
-                if _is_bot_protection_page(output):
-                    response_status = 403
-                    response_logging_extras["cricket_stats.response_code"] = response_status
-                    response_logging_extras["cricket_stats.block_reason"] = "bot_protection_page"
-
-                logger.debug(json.dumps(f"Page fetched from: {full_route}"), extra=response_logging_extras)
-                output_for_file = output
-                response_output_file_extension = "html"
-            else:
-                output = await response.json()
-                logger.debug(json.dumps(output, indent=4), extra=response_logging_extras)
-                output_for_file = json.dumps(output, indent=4)
-                response_output_file_extension = "json"
-
-            _output_response_to_file(output_for_file, route, response_output_sub_folder, response_output_file_extension)
-
-            if response_status != 200:
-                logger.error(
-                    f"Status Code '{response_status}' returned for '{full_route}'",
-                    extra=response_logging_extras,
-                )
-                raise CricinfoAPIException(status_code=response_status, route=full_route, content=output)
-
-            return output
-    finally:
-        if owned_session:
-            await session.close()
+        logger.debug("Page fetched from: %s", full_route, extra=response_logging_extras)
+        response_output_file_extension = "html"
+    else:
+        _log_payload(body, full_route, response_logging_extras)
+        response_output_file_extension = "json"
+
+    _output_response_to_file(body, route, response_output_sub_folder, response_output_file_extension)
+
+    if response_status == 200 and isinstance(body, bytes) and body.lstrip()[:1] not in (b"{", b"["):
+        response_status = 502
+        response_logging_extras["cricket_stats.response_code"] = response_status
+        response_logging_extras["cricket_stats.block_reason"] = "invalid_json"
+
+    request_span = get_current_span()
+    request_span.attributes["status"] = response_status
+    request_span.attributes["bytes"] = len(body)
+
+    if response_status != 200:
+        logger.error(
+            f"Status Code '{response_status}' returned for '{full_route}'",
+            extra=response_logging_extras,
+        )
+        raise CricinfoAPIException(status_code=response_status, route=full_route, content=_decode_error_content(body))
+
+    return body
+
+
+def _log_payload(body: bytes | str, full_route: str, response_logging_extras: dict) -> None:
+    """
+    Log the payload of a response at debug level. The payload is only decoded and formatted if a handler emits
+    the record, and only a ``debug_payload_sample_rate`` fraction of payloads are logged at all, so this costs
+    nothing while debug logging is disabled.
+
+    Parameters
+    ----------
+    body : bytes | str
+        The raw response body
+    full_route : str
+        The URL the response came from
+    response_logging_extras : dict
+        Logging extras for the request
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+
+    sample_rate = get_settings().debug_payload_sample_rate
+    if sample_rate < 1 and random.random() >= sample_rate:
+        return
+
+    logger.debug("Response from %s: %s", full_route, _LazyPayload(body), extra=response_logging_extras)
+
+
+class _LazyPayload:
+    """Defers pretty-printing a response payload until the log record holding it is formatted."""
+
+    __slots__ = ("body",)
+
+    def __init__(self, body: bytes | str):
+        self.body = body
+
+    def __str__(self) -> str:
+        try:
+            return json.dumps(_decode_body(self.body), indent=4)
+        except ValueError:
+            return self.body if isinstance(self.body, str) else self.body.decode(errors="replace")
+
+
+def _decode_error_content(body: bytes | str) -> dict | str:
+    """
+    Decode the body of an unsuccessful response, to include in an exception. Error responses are not always JSON.
+
+    Parameters
+    ----------
+    body : bytes | str
+        The raw response body
+
+    Returns
+    -------
+    dict | str
+        The parsed JSON content, or the text of the response
+    """
+    try:
+        return _decode_body(body)
+    except ValueError:
+        return body.decode(errors="replace")
+
+
+async def _send_with_retries(
+    session: aiohttp.ClientSession,
+    full_route: str,
+    headers: dict[str, str],
+    base_route: BaseRoute,
+    response_logging_extras: dict,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> tuple[int, bytes | str]:
+    """
+    Send a GET request, retrying with exponential backoff and jitter on connection errors, timeouts and retryable
+    status codes. Each attempt is rate limited, and is refused without being sent while the circuit breaker for
+    the host is open.
+
+    Parameters
+    ----------
+    session : aiohttp.ClientSession
+        The session to send the request with
+    full_route : str
+        The full URL to request
+    headers : dict[str, str]
+        Headers to send with the request
+    base_route : BaseRoute
+        The base route being requested, which determines the rate limit, and whether the body is read as text
+    response_logging_extras : dict
+        Logging extras for the request, which are updated with the attempt number and rate limit wait
+    rate_limiter : Optional[RateLimiter], optional
+        The rate limiter to pace each attempt with, or None to use the process-wide rate limiter, by default None
+
+    Returns
+    -------
+    tuple[int, bytes | str]
+        The status code and body of the final response: text for page routes, bytes otherwise
+
+    Raises
+    ------
+    CircuitBreakerOpenException
+        If the circuit breaker for the host is open
+    """
+    settings = get_settings()
+    retry_settings = settings.retry
+    timeout = aiohttp.ClientTimeout(total=settings.request_timeout)
+    breaker = get_circuit_breaker(urlparse(full_route).netloc)
+    rate_limiter = rate_limiter or get_rate_limiter()
+    max_attempts = max(retry_settings.max_attempts, 1)
+
+    for attempt in range(1, max_attempts + 1):
+        breaker.check(full_route)
+        response_logging_extras["cricket_stats.attempt"] = attempt
+        with span("cricinfo.rate_limit_wait", base_route=base_route.name):
+            response_logging_extras["cricket_stats.rate_limit_wait"] = await rate_limiter.acquire(base_route)
+
+        try:
+            sent_at = time.perf_counter()
+            async with session.get(yarl.URL(full_route, encoded=True), headers=headers, timeout=timeout) as response:
+                response_status = response.status
+                retry_after = response.headers.get("Retry-After")
+                record_span("cricinfo.ttfb", sent_at, time.perf_counter(), attempt=attempt, status=response_status)
+                with span("cricinfo.body_read", attempt=attempt):
+                    if base_route in (BaseRoute.page, BaseRoute.stats):
+                        body = await response.text()
+                    else:
+                        body = await response.read()
+        except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError) as ex:
+            breaker.record_failure()
+            if attempt == max_attempts:
+                logger.error(f"Request to '{full_route}' failed: {ex!r}", extra=response_logging_extras)
+                raise
+            delay = get_retry_delay(attempt, retry_settings)
+            logger.warning(
+                f"Request to '{full_route}' failed: {ex!r}, retrying in {delay:.2f}s", extra=response_logging_extras
+            )
+            await asyncio.sleep(delay)
+            continue
+
+        if response_status not in retry_settings.retry_statuses:
+            breaker.record_success()
+            break
+
+        breaker.record_failure()
+        if attempt == max_attempts:
+            break
+        delay = get_retry_delay(attempt, retry_settings, retry_after)
+        logger.warning(
+            f"Status Code '{response_status}' returned for '{full_route}', retrying in {delay:.2f}s",
+            extra=response_logging_extras,
+        )
+        await asyncio.sleep(delay)
+
+    return response_status, body
+
+
+async def cache_completed_match(
+    route: str,
+    params: dict[str, str],
+    base_route: BaseRoute = BaseRoute.core,
+    cache: Optional[ResponseCache] = None,
+) -> None:
+    """
+    Record that a match has finished, so that every subsequent response for it is cached without expiry, and
+    keep the already cached response for the supplied route indefinitely.
+
+    Parameters
+    ----------
+    route : str
+        The route template which returned the finished match, such as the match summary
+    params : dict[str, str]
+        The parameters filled in to the route, which must include the match_id
+    base_route: BaseRoute, optional
+        The base route the route was called against, by default BaseRoute.core
+    cache : ResponseCache, optional
+        The response cache the match was cached in. If None, the process-wide cache from ``get_response_cache()``
+        is used, by default None
+    """
+    if not get_settings().cache_enabled:
+        return
+
+    cache = cache or get_response_cache()
+    await cache.mark_match_complete(params["match_id"])
+    await cache.pin(get_cache_key(_format_route(route, params), base_route))
+
+
+def _decode_body(body: bytes | str) -> dict | str:
+    """
+    Decode a response body: JSON responses are read as bytes and parsed, while page responses are already text.
+
+    Parameters
+    ----------
+    body : bytes | str
+        The raw response body
+
+    Returns
+    -------
+    dict | str
+        The parsed JSON content, or the HTML text of the response
+    """
+    if isinstance(body, str):
+        return body
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
 
 
 def _format_route(route: str, params: dict[str, str] = {}) -> str:
@@ -309,7 +739,7 @@ async def _retry_with_browser_tls(full_route: str, referer: str) -> str | None:
     return await asyncio.to_thread(_do_request)
 
 
-def create_session() -> aiohttp.ClientSession:
+def create_session(connector: Optional[aiohttp.BaseConnector] = None) -> aiohttp.ClientSession:
     """
     Create a configured aiohttp ClientSession with base headers set.
 
@@ -317,6 +747,12 @@ def create_session() -> aiohttp.ClientSession:
     server, making subsequent requests appear more like a real browser session.
     The caller is responsible for closing the session when finished.
 
+    Parameters
+    ----------
+    connector : aiohttp.BaseConnector, optional
+        The connector to use for the session. If None, a pooled connector is built from the
+        connection settings, by default None
+
     Returns
     -------
     aiohttp.ClientSession
@@ -330,7 +766,102 @@ def create_session() -> aiohttp.ClientSession:
         **_COMMON_BROWSER_HEADERS,
         "Connection": "keep-alive",
     }
-    return aiohttp.ClientSession(headers=headers)
+    return aiohttp.ClientSession(
+        headers=headers, connector=connector or _create_pooled_connector(), trace_configs=[create_trace_config()]
+    )
+
+
+def _create_pooled_connector() -> aiohttp.TCPConnector:
+    """
+    Build a TCP connector with connection pooling, keep-alive and DNS caching configured from settings.
+
+    Returns
+    -------
+    aiohttp.TCPConnector
+        A connector to back a ClientSession.
+    """
+    settings = get_settings()
+    return aiohttp.TCPConnector(
+        limit=settings.connection_pool_limit,
+        limit_per_host=settings.connection_pool_limit_per_host,
+        ttl_dns_cache=settings.dns_cache_ttl,
+        keepalive_timeout=settings.keepalive_timeout,
+    )
+
+
+def get_shared_session() -> aiohttp.ClientSession:
+    """
+    Get the process-wide pooled session, creating it on first use.
+
+    All helpers use this session when they are not handed one explicitly, so upstream connections
+    are kept alive and reused rather than paying a new TCP and TLS handshake per request. A new
+    session is created if the previous one was closed, or belongs to a different event loop, in which
+    case the previous one is closed.
+    Close it with ``close_shared_session()``, or use ``shared_session_lifespan()`` to manage it.
+
+    Returns
+    -------
+    aiohttp.ClientSession
+        The shared session for the running event loop.
+    """
+    global _shared_session, _shared_session_loop
+
+    loop = asyncio.get_running_loop()
+    if _shared_session is None or _shared_session.closed or _shared_session_loop is not loop:
+        if _shared_session is not None and not _shared_session.closed:
+            _close_stale_session(_shared_session, _shared_session_loop)
+        _shared_session = create_session()
+        _shared_session_loop = loop
+    return _shared_session
+
+
+def _close_stale_session(session: aiohttp.ClientSession, loop: asyncio.AbstractEventLoop) -> None:
+    """
+    Close the shared session of an event loop other than the running one. A session can only be closed on its own
+    loop, so if that loop has stopped, its connections are dropped instead.
+    """
+    if loop.is_running():
+        asyncio.run_coroutine_threadsafe(session.close(), loop)
+        return
+
+    logger.warning(
+        "The shared session of an event loop which has stopped was not closed with close_shared_session(), "
+        "so its connections are being dropped"
+    )
+    connector = session.connector
+    session.detach()
+    if connector is not None:
+        # The synchronous part of BaseConnector.close(), as the rest would have to run on the stopped loop
+        connector._close()
+
+
+async def close_shared_session() -> None:
+    """
+    Close the process-wide pooled session, if one is open.
+    """
+    global _shared_session, _shared_session_loop
+
+    session, _shared_session, _shared_session_loop = _shared_session, None, None
+    if session is not None and not session.closed:
+        await session.close()
+
+
+@asynccontextmanager
+async def shared_session_lifespan() -> AsyncIterator[aiohttp.ClientSession]:
+    """
+    Open the process-wide pooled session for the duration of the context, and close it on exit.
+
+    Intended to wrap the lifetime of an application, such as a FastAPI lifespan or a CLI command.
+
+    Yields
+    ------
+    aiohttp.ClientSession
+        The shared session.
+    """
+    try:
+        yield get_shared_session()
+    finally:
+        await close_shared_session()
 
 
 async def _warm_page_session(session: aiohttp.ClientSession) -> None:
@@ -356,26 +887,30 @@ async def _warm_page_session(session: aiohttp.ClientSession) -> None:
         return
 
 
-def _output_response_to_file(response: str, route: str, sub_folder: str, file_extension: str) -> None:
+def _output_response_to_file(response: bytes | str, route: str, sub_folder: str, file_extension: str) -> None:
     """
-    Output the content of the response to a file
+    Queue the content of the response to be written to a file by the background archiver, if archiving is enabled
 
     Parameters
     ----------
-    response : str
-        The API/page response
+    response : bytes | str
+        The raw API/page response
     route : str
         The route that was called
+    sub_folder : str
+        Sub-folder within the response output folder to write the file to
+    file_extension : str
+        The file extension for the response content
     """
-    folder = Path(get_settings().api_response_output_folder)
-    today = datetime.today().strftime("%Y%m%d")
-    file_name = f"{datetime.now(UTC).time().strftime('%H%M%S')}_{route.replace('/', '_')}.{file_extension}"
-
-    if sub_folder:
-        folder = folder / sub_folder
-    folder = folder / today
-    folder.mkdir(parents=True, exist_ok=True)
+    if not get_settings().archive_responses:
+        return
 
-    file_path = (folder / file_name).resolve()
-    with open(file_path, "w") as file:
-        file.write(response)
+    request_span = get_current_span()
+    get_response_archiver().submit(
+        response,
+        route,
+        sub_folder,
+        file_extension,
+        request_id=request_span.request_id if request_span else None,
+        route_template=request_span.route_template if request_span else None,
+    )
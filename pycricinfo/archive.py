@@ -0,0 +1,195 @@
+import atexit
+import gzip
+import itertools
+import logging
+import queue
+import threading
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from pycricinfo.config import ArchiveCompression, get_settings
+from pycricinfo.instrumentation import span
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+logger = logging.getLogger("cricinfo")
+
+
+@dataclass(slots=True)
+class ArchiveItem:
+    """A response waiting to be written to the archive, handed over without validating the body it holds."""
+
+    path: Path
+    content: bytes
+    request_id: Optional[str] = None
+    route_template: Optional[str] = None
+
+
+class ResponseArchiver:
+    """
+    Writes upstream responses to the response output folder from a background thread, so that archiving never
+    blocks the event loop.
+
+    Responses are handed over through a bounded queue. If the writer falls behind and the queue is full, further
+    responses are dropped, with a warning, rather than slowing down requests. Each file is named with the time and a
+    sequence number, so that responses for the same route within the same second don't overwrite each other.
+    """
+
+    def __init__(self, folder: str | Path, compression: ArchiveCompression = "none", queue_size: int = 256):
+        self.folder = Path(folder)
+        self.compression = compression
+        if compression == "zstd" and zstandard is None:
+            logger.warning("zstandard is not installed, so archived responses will be compressed with gzip")
+            self.compression = "gzip"
+
+        self._queue: queue.Queue[Optional[ArchiveItem]] = queue.Queue(maxsize=queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._sequence = itertools.count(1)
+        self.dropped = 0
+
+    def submit(
+        self,
+        content: bytes | str,
+        route: str,
+        sub_folder: Optional[str],
+        file_extension: str,
+        request_id: Optional[str] = None,
+        route_template: Optional[str] = None,
+    ) -> bool:
+        """
+        Queue a response to be written to the archive, without waiting for it to be written.
+
+        Parameters
+        ----------
+        content : bytes | str
+            The raw API/page response
+        route : str
+            The route that was called, which is used to name the file
+        sub_folder : Optional[str]
+            Sub-folder within the archive folder to write the file to
+        file_extension : str
+            The file extension for the content, e.g. "json" or "html"
+        request_id : Optional[str], optional
+            The ID of the request the response is from, to record on the span of the write, by default None
+        route_template : Optional[str], optional
+            The route template of the request, to record on the span of the write, by default None
+
+        Returns
+        -------
+        bool
+            True if the response was queued, or False if the queue was full and it was dropped
+        """
+        now = datetime.now(UTC)
+        folder = self.folder / sub_folder if sub_folder else self.folder
+        file_name = (
+            f"{now.strftime('%H%M%S')}_{next(self._sequence):06d}_{route.replace('/', '_')}.{file_extension}"
+            f"{self._suffix}"
+        )
+        path = folder / now.strftime("%Y%m%d") / file_name
+
+        if isinstance(content, str):
+            content = content.encode()
+
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(
+                ArchiveItem(path=path, content=content, request_id=request_id, route_template=route_template)
+            )
+        except queue.Full:
+            self.dropped += 1
+            logger.warning(f"Response archive queue is full, so the response for '{route}' was not archived")
+            return False
+        return True
+
+    def flush(self) -> None:
+        """Block until every queued response has been written."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Write any queued responses, then stop the background writer.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The maximum number of seconds to wait for the writer to finish, by default 5.0
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+
+        self._queue.put(None)
+        thread.join(timeout)
+
+    @property
+    def _suffix(self) -> str:
+        return {"gzip": ".gz", "zstd": ".zst"}.get(self.compression, "")
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="pycricinfo-archiver", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._write(item)
+            except Exception as ex:
+                logger.warning(f"Failed to archive response to '{item.path}': {ex}")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, item: ArchiveItem) -> None:
+        with span(
+            "cricinfo.archive_write",
+            request_id=item.request_id,
+            route_template=item.route_template,
+            bytes=len(item.content),
+            compression=self.compression,
+        ):
+            item.path.parent.mkdir(parents=True, exist_ok=True)
+
+            content = item.content
+            if self.compression == "gzip":
+                content = gzip.compress(content)
+            elif self.compression == "zstd":
+                content = zstandard.ZstdCompressor().compress(content)
+
+            with open(item.path, "wb") as file:
+                file.write(content)
+
+
+@lru_cache
+def get_response_archiver() -> ResponseArchiver:
+    """
+    Get the process-wide response archiver, configured from settings. Queued responses are written at exit.
+
+    Returns
+    -------
+    ResponseArchiver
+        The shared response archiver
+    """
+    settings = get_settings()
+    archiver = ResponseArchiver(
+        folder=settings.api_response_output_folder,
+        compression=settings.archive_compression,
+        queue_size=settings.archive_queue_size,
+    )
+    atexit.register(archiver.close)
+    return archiver
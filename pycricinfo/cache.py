@@ -0,0 +1,383 @@
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from pycricinfo.config import BaseRoute, Settings, get_settings
+from pycricinfo.utils import write_file_atomically
+
+logger = logging.getLogger("cricinfo")
+
+_response_cache: Optional["ResponseCache"] = None
+_route_cache_ttls: Optional[tuple[Settings, dict[str, int]]] = None
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    """
+    A cached response body, and the time at which it expires. A plain dataclass rather than a model, so that bodies
+    of several MB are not validated every time they are cached or read from disk.
+    """
+
+    content: bytes | str
+    expires_at: Optional[float] = None
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at is not None and self.expires_at <= time.time()
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+
+class ResponseCache:
+    """
+    A two-tier cache of upstream response bodies: an in-memory LRU tier bounded by total size, in front of an
+    optional on-disk tier which persists across processes.
+
+    Entries are stored with a time-to-live in seconds, or without expiry if the TTL is None. The disk tier is pruned
+    when more than a tenth of its limit has been written since it was last pruned, and on the first write, so that
+    entries left by earlier processes count towards it too.
+    """
+
+    def __init__(
+        self, max_memory_bytes: int, folder: Optional[str | Path] = None, max_disk_bytes: Optional[int] = None
+    ):
+        self.max_memory_bytes = max_memory_bytes
+        self.folder = Path(folder) if folder else None
+        self.max_disk_bytes = max_disk_bytes
+        self._memory: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._memory_bytes = 0
+        self._completed_match_ids: set[str] = set()
+        self._disk_bytes_since_prune: Optional[int] = None
+        self._prune_lock = asyncio.Lock()
+
+    async def get(self, key: str) -> Optional[bytes | str]:
+        """
+        Get the content cached against a key, checking the memory tier and then the disk tier.
+
+        Parameters
+        ----------
+        key : str
+            The cache key
+
+        Returns
+        -------
+        Optional[bytes | str]
+            The cached content, or None if nothing unexpired is cached for the key
+        """
+        entry = self._memory.get(key)
+        if entry is not None:
+            if not entry.expired:
+                self._memory.move_to_end(key)
+                return entry.content
+            self._evict(key)
+
+        if self.folder is None:
+            return None
+
+        entry = await asyncio.to_thread(self._read_from_disk, key)
+        if entry is None:
+            return None
+
+        self._store_in_memory(key, entry)
+        return entry.content
+
+    async def set(self, key: str, content: bytes | str, ttl: Optional[float]) -> None:
+        """
+        Cache content against a key in both tiers.
+
+        Parameters
+        ----------
+        key : str
+            The cache key
+        content : bytes | str
+            The response body to cache
+        ttl : Optional[float]
+            The number of seconds to cache the content for, or None to cache it without expiry
+        """
+        entry = CacheEntry(content=content, expires_at=None if ttl is None else time.time() + ttl)
+        self._store_in_memory(key, entry)
+
+        if self.folder is not None:
+            await asyncio.to_thread(self._write_to_disk, key, entry)
+            await self._prune_disk_if_due(entry.size)
+
+    async def prune_disk(self) -> int:
+        """
+        Remove expired entries from the disk tier, then the least recently written entries until it is within
+        ``max_disk_bytes``, if set.
+
+        Returns
+        -------
+        int
+            The number of bytes left in the disk tier
+        """
+        if self.folder is None:
+            return 0
+        async with self._prune_lock:
+            self._disk_bytes_since_prune = 0
+            return await asyncio.to_thread(self._prune_disk)
+
+    async def pin(self, key: str) -> None:
+        """
+        Remove the expiry from content already cached against a key, so that it is kept indefinitely.
+
+        Parameters
+        ----------
+        key : str
+            The cache key
+        """
+        content = await self.get(key)
+        if content is not None:
+            await self.set(key, content, ttl=None)
+
+    async def mark_match_complete(self, match_id: int | str) -> None:
+        """
+        Record that a match has finished, so responses for it can be cached without expiry.
+
+        Parameters
+        ----------
+        match_id : int | str
+            The ID of the completed match
+        """
+        match_id = str(match_id)
+        self._completed_match_ids.add(match_id)
+
+        if self.folder is not None:
+            await asyncio.to_thread(self._write_completed_match_marker, match_id)
+
+    async def is_match_complete(self, match_id: int | str) -> bool:
+        """
+        Check whether a match has been recorded as finished.
+
+        Parameters
+        ----------
+        match_id : int | str
+            The ID of the match
+
+        Returns
+        -------
+        bool
+            True if the match has been marked as complete
+        """
+        match_id = str(match_id)
+        if match_id in self._completed_match_ids:
+            return True
+
+        if self.folder is None:
+            return False
+
+        if await asyncio.to_thread(self._completed_match_marker_path(match_id).exists):
+            self._completed_match_ids.add(match_id)
+            return True
+        return False
+
+    def clear(self) -> None:
+        """Remove every entry from the memory tier. Entries on disk are left in place."""
+        self._memory.clear()
+        self._memory_bytes = 0
+
+    def _store_in_memory(self, key: str, entry: CacheEntry) -> None:
+        if key in self._memory:
+            self._evict(key)
+
+        if entry.size > self.max_memory_bytes:
+            return
+
+        self._memory[key] = entry
+        self._memory_bytes += entry.size
+
+        while self._memory_bytes > self.max_memory_bytes:
+            oldest_key = next(iter(self._memory))
+            self._evict(oldest_key)
+
+    def _evict(self, key: str) -> None:
+        entry = self._memory.pop(key)
+        self._memory_bytes -= entry.size
+
+    async def _prune_disk_if_due(self, written_bytes: int) -> None:
+        if self.max_disk_bytes is None or self._prune_lock.locked():
+            return
+        if self._disk_bytes_since_prune is not None:
+            self._disk_bytes_since_prune += written_bytes
+            if self._disk_bytes_since_prune < self.max_disk_bytes // 10:
+                return
+        await self.prune_disk()
+
+    def _prune_disk(self) -> int:
+        entries = []
+        for path in self.folder.glob("??/*"):
+            if path.suffix == ".tmp":
+                continue
+            try:
+                stat = path.stat()
+                with open(path, "rb") as file:
+                    expires_at = json.loads(file.readline()).get("expires_at")
+            except (OSError, ValueError):
+                continue
+            if expires_at is not None and expires_at <= time.time():
+                path.unlink(missing_ok=True)
+            else:
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_bytes = sum(size for _, size, _ in entries)
+        if self.max_disk_bytes is not None and total_bytes > self.max_disk_bytes:
+            for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+                path.unlink(missing_ok=True)
+                total_bytes -= size
+                if total_bytes <= self.max_disk_bytes:
+                    break
+        return total_bytes
+
+    def _completed_match_marker_path(self, match_id: str) -> Path:
+        return self.folder / "completed_matches" / match_id
+
+    def _write_completed_match_marker(self, match_id: str) -> None:
+        path = self._completed_match_marker_path(match_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+
+    def _path_for_key(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self.folder / digest[:2] / digest
+
+    def _read_from_disk(self, key: str) -> Optional[CacheEntry]:
+        """
+        Read an entry from the disk tier. Each file holds a single line of JSON metadata, followed by the raw body.
+        """
+        path = self._path_for_key(key)
+        try:
+            with open(path, "rb") as file:
+                metadata = json.loads(file.readline())
+                content = file.read()
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as ex:
+            logger.warning("Unable to read cache file '%s': %s", path, ex)
+            return None
+
+        if metadata.get("key") != key:
+            return None
+
+        entry = CacheEntry(
+            content=content.decode() if metadata.get("text") else content, expires_at=metadata.get("expires_at")
+        )
+        if entry.expired:
+            path.unlink(missing_ok=True)
+            return None
+        return entry
+
+    def _write_to_disk(self, key: str, entry: CacheEntry) -> None:
+        path = self._path_for_key(key)
+        is_text = isinstance(entry.content, str)
+        metadata = json.dumps({"key": key, "expires_at": entry.expires_at, "text": is_text})
+        content = entry.content.encode() if is_text else entry.content
+
+        write_file_atomically(path, [metadata.encode(), b"\n", content])
+
+
+def create_response_cache() -> ResponseCache:
+    """
+    Create a response cache configured from settings.
+
+    Returns
+    -------
+    ResponseCache
+        A new response cache
+    """
+    settings = get_settings()
+    return ResponseCache(
+        max_memory_bytes=settings.cache_memory_max_bytes,
+        folder=settings.cache_folder,
+        max_disk_bytes=settings.cache_disk_max_bytes,
+    )
+
+
+def get_response_cache() -> ResponseCache:
+    """
+    Get the process-wide response cache: the one installed with ``set_response_cache``, or otherwise one created
+    from settings on first use.
+
+    Returns
+    -------
+    ResponseCache
+        The shared response cache
+    """
+    global _response_cache
+
+    if _response_cache is None:
+        _response_cache = create_response_cache()
+    return _response_cache
+
+
+def set_response_cache(cache: Optional[ResponseCache]) -> None:
+    """
+    Install a response cache as the process-wide default, used by every request which isn't given one.
+
+    Parameters
+    ----------
+    cache : Optional[ResponseCache]
+        The cache to install, or None to create a new one from settings on next use
+    """
+    global _response_cache
+
+    _response_cache = cache
+
+
+def get_cache_key(route: str, base_route: BaseRoute) -> str:
+    """
+    Build the cache key for a fully formatted route.
+
+    Parameters
+    ----------
+    route : str
+        The route, with all parameters filled in
+    base_route : BaseRoute
+        The base route the route is called against
+
+    Returns
+    -------
+    str
+        The cache key
+    """
+    return f"{base_route.name}:{route}"
+
+
+def get_route_cache_ttl(route_template: str) -> int:
+    """
+    Look up the number of seconds to cache responses for, for a route template from ``CoreAPIRoutes`` or
+    ``PageRoutes``.
+
+    Parameters
+    ----------
+    route_template : str
+        The unformatted route template
+
+    Returns
+    -------
+    int
+        The TTL in seconds configured for the route, or the default TTL if the route is not a known template
+    """
+    settings = get_settings()
+    return _get_route_cache_ttls(settings).get(route_template, settings.cache_default_ttl)
+
+
+def _get_route_cache_ttls(settings: Settings) -> dict[str, int]:
+    """Get the TTL of each known route template, built once for each settings object rather than on every request."""
+    global _route_cache_ttls
+
+    if _route_cache_ttls is None or _route_cache_ttls[0] is not settings:
+        ttls = settings.cache_ttls.model_dump()
+        route_ttls = {}
+        for routes in (settings.routes, settings.page_routes):
+            for name, template in routes.model_dump().items():
+                route_ttls.setdefault(template, ttls.get(name, settings.cache_default_ttl))
+        _route_cache_ttls = (settings, route_ttls)
+    return _route_cache_ttls[1]
@@ -2,13 +2,20 @@ from typing import Optional
 
 import aiohttp
 
-from pycricinfo.api_helper import get_and_parse, get_request
+from pycricinfo.api_helper import cache_completed_match, get_and_parse, get_request
+from pycricinfo.cache import ResponseCache
 from pycricinfo.config import BaseRoute, get_settings
 from pycricinfo.models.output.scorecard import CricinfoScorecard
 from pycricinfo.models.source import APIResponseCommentary, Commentary, Match, MatchBasic, Player, TeamFull
+from pycricinfo.rate_limit import RateLimiter
 
 
-async def get_player(player_id: int, session: Optional[aiohttp.ClientSession] = None) -> Player:
+async def get_player(
+    player_id: int,
+    session: Optional[aiohttp.ClientSession] = None,
+    cache: Optional[ResponseCache] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> Player:
     """
     Get a player by their ID.
 
@@ -18,16 +25,32 @@ async def get_player(player_id: int, session: Optional[aiohttp.ClientSession] =
         The ID of the player to retrieve.
     session : aiohttp.ClientSession, optional
         An existing session to use for the request, by default None
+    cache : ResponseCache, optional
+        The response cache to use, by default the process-wide one
+    rate_limiter : RateLimiter, optional
+        The rate limiter to pace upstream requests with, by default the process-wide one
 
     Returns
     -------
     Player
         A parsed Pydantic model representing the player.
     """
-    return await get_and_parse(get_settings().routes.player, Player, params={"player_id": player_id}, session=session)
+    return await get_and_parse(
+        get_settings().routes.player,
+        Player,
+        params={"player_id": player_id},
+        session=session,
+        cache=cache,
+        rate_limiter=rate_limiter,
+    )
 
 
-async def get_team(team_id: int, session: Optional[aiohttp.ClientSession] = None) -> TeamFull:
+async def get_team(
+    team_id: int,
+    session: Optional[aiohttp.ClientSession] = None,
+    cache: Optional[ResponseCache] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> TeamFull:
     """
     Get a team by its ID.
 
@@ -37,16 +60,32 @@ async def get_team(team_id: int, session: Optional[aiohttp.ClientSession] = None
         The ID of the team to retrieve.
     session : aiohttp.ClientSession, optional
         An existing session to use for the request, by default None
+    cache : ResponseCache, optional
+        The response cache to use, by default the process-wide one
+    rate_limiter : RateLimiter, optional
+        The rate limiter to pace upstream requests with, by default the process-wide one
 
     Returns
     -------
     TeamFull
         A parsed Pydantic model representing the team.
     """
-    return await get_and_parse(get_settings().routes.team, TeamFull, params={"team_id": team_id}, session=session)
+    return await get_and_parse(
+        get_settings().routes.team,
+        TeamFull,
+        params={"team_id": team_id},
+        session=session,
+        cache=cache,
+        rate_limiter=rate_limiter,
+    )
 
 
-async def get_match_basic(match_id: int, session: Optional[aiohttp.ClientSession] = None) -> MatchBasic:
+async def get_match_basic(
+    match_id: int,
+    session: Optional[aiohttp.ClientSession] = None,
+    cache: Optional[ResponseCache] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> MatchBasic:
     """
     Get basic match information by match ID.
 
@@ -56,6 +95,10 @@ async def get_match_basic(match_id: int, session: Optional[aiohttp.ClientSession
         The ID of the match to retrieve.
     session : aiohttp.ClientSession, optional
         An existing session to use for the request, by default None
+    cache : ResponseCache, optional
+        The response cache to use, by default the process-wide one
+    rate_limiter : RateLimiter, optional
+        The rate limiter to pace upstream requests with, by default the process-wide one
 
     Returns
     -------
@@ -63,11 +106,22 @@ async def get_match_basic(match_id: int, session: Optional[aiohttp.ClientSession
         A parsed Pydantic model representing the basic match information.
     """
     return await get_and_parse(
-        get_settings().routes.match_basic, MatchBasic, params={"match_id": match_id}, session=session
+        get_settings().routes.match_basic,
+        MatchBasic,
+        params={"match_id": match_id},
+        session=session,
+        cache=cache,
+        rate_limiter=rate_limiter,
     )
 
 
-async def get_match(series_id: int, match_id: int, session: Optional[aiohttp.ClientSession] = None) -> Match:
+async def get_match(
+    series_id: int,
+    match_id: int,
+    session: Optional[aiohttp.ClientSession] = None,
+    cache: Optional[ResponseCache] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> Match:
     """
     Get detailed match information by match ID.
 
@@ -79,22 +133,40 @@ async def get_match(series_id: int, match_id: int, session: Optional[aiohttp.Cli
         The ID of the match to retrieve.
     session : aiohttp.ClientSession, optional
         An existing session to use for the request, by default None
+    cache : ResponseCache, optional
+        The response cache to use, by default the process-wide one
+    rate_limiter : RateLimiter, optional
+        The rate limiter to pace upstream requests with, by default the process-wide one
 
     Returns
     -------
     Match
         A parsed Pydantic model representing the match details.
     """
-    return await get_and_parse(
+    params = {"series_id": series_id, "match_id": match_id}
+    match = await get_and_parse(
         get_settings().routes.match_summary,
         Match,
-        params={"series_id": series_id, "match_id": match_id},
+        params=params,
         base_route=BaseRoute.site,
         session=session,
+        cache=cache,
+        rate_limiter=rate_limiter,
     )
 
+    if match.is_complete:
+        await cache_completed_match(get_settings().routes.match_summary, params, BaseRoute.site, cache)
 
-async def get_match_raw(series_id: int, match_id: int, session: Optional[aiohttp.ClientSession] = None) -> dict:
+    return match
+
+
+async def get_match_raw(
+    series_id: int,
+    match_id: int,
+    session: Optional[aiohttp.ClientSession] = None,
+    cache: Optional[ResponseCache] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> dict:
     """
     Get raw match data by match ID.
 
@@ -106,6 +178,10 @@ async def get_match_raw(series_id: int, match_id: int, session: Optional[aiohttp
         The ID of the match to retrieve.
     session : aiohttp.ClientSession, optional
         An existing session to use for the request, by default None
+    cache : ResponseCache, optional
+        The response cache to use, by default the process-wide one
+    rate_limiter : RateLimiter, optional
+        The rate limiter to pace upstream requests with, by default the process-wide one
 
     Returns
     -------
@@ -118,11 +194,17 @@ async def get_match_raw(series_id: int, match_id: int, session: Optional[aiohttp
         base_route=BaseRoute.site,
         response_output_sub_folder="matches",
         session=session,
+        cache=cache,
+        rate_limiter=rate_limiter,
     )
 
 
 async def get_scorecard(
-    series_id: int, match_id: int, session: Optional[aiohttp.ClientSession] = None
+    series_id: int,
+    match_id: int,
+    session: Optional[aiohttp.ClientSession] = None,
+    cache: Optional[ResponseCache] = None,
+    rate_limiter: Optional[RateLimiter] = None,
 ) -> CricinfoScorecard:
     """
     Get a match and generate and return a scorecard for it.
@@ -135,18 +217,28 @@ async def get_scorecard(
         The ID of the match for which to generate the scorecard.
     session : aiohttp.ClientSession, optional
         An existing session to use for the request, by default None
+    cache : ResponseCache, optional
+        The response cache to use, by default the process-wide one
+    rate_limiter : RateLimiter, optional
+        The rate limiter to pace upstream requests with, by default the process-wide one
 
     Returns
     -------
     Scorecard
         A scorecard object containing match details and scores.
     """
-    match = await get_match(series_id, match_id, session=session)
+    match = await get_match(series_id, match_id, session=session, cache=cache, rate_limiter=rate_limiter)
     return CricinfoScorecard(match=match)
 
 
 async def get_play_by_play(
-    match_id: int, innings: int = 1, page: int = 1, session: Optional[aiohttp.ClientSession] = None
+    match_id: int,
+    innings: int = 1,
+    page: int = 1,
+    session: Optional[aiohttp.ClientSession] = None,
+    cache: Optional[ResponseCache] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    use_cache: bool = True,
 ) -> Commentary:
     """
     Get a page of ball-by-ball data for a match, processed into a list of CommentaryItems.
@@ -161,6 +253,12 @@ async def get_play_by_play(
         The page of commentary to return, by default 1
     session : aiohttp.ClientSession, optional
         An existing session to use for the request, by default None
+    cache : ResponseCache, optional
+        The response cache to use, by default the process-wide one
+    rate_limiter : RateLimiter, optional
+        The rate limiter to pace upstream requests with, by default the process-wide one
+    use_cache : bool, optional
+        Whether the page may be served from the response cache, by default True
 
     Returns
     -------
@@ -174,12 +272,20 @@ async def get_play_by_play(
         True,
         BaseRoute.site,
         session=session,
+        cache=cache,
+        rate_limiter=rate_limiter,
+        use_cache=use_cache,
     )
     return response.commentary if response and response.commentary else []
 
 
 async def get_play_by_play_raw(
-    match_id: int, page: int = 1, innings: int = 1, session: Optional[aiohttp.ClientSession] = None
+    match_id: int,
+    page: int = 1,
+    innings: int = 1,
+    session: Optional[aiohttp.ClientSession] = None,
+    cache: Optional[ResponseCache] = None,
+    rate_limiter: Optional[RateLimiter] = None,
 ) -> dict:
     """
     Get a page of ball-by-ball data for a match.
@@ -194,6 +300,10 @@ async def get_play_by_play_raw(
         Which innings to retrieve commentary for, by default 1
     session : aiohttp.ClientSession, optional
         An existing session to use for the request, by default None
+    cache : ResponseCache, optional
+        The response cache to use, by default the process-wide one
+    rate_limiter : RateLimiter, optional
+        The rate limiter to pace upstream requests with, by default the process-wide one
 
     Returns
     -------
@@ -206,4 +316,6 @@ async def get_play_by_play_raw(
         base_route=BaseRoute.site,
         response_output_sub_folder="play_by_play",
         session=session,
+        cache=cache,
+        rate_limiter=rate_limiter,
     )
@@ -0,0 +1,175 @@
+import asyncio
+from collections import deque
+from typing import AsyncIterator, Optional
+
+import aiohttp
+
+from pycricinfo.call_cricinfo_api import get_play_by_play
+from pycricinfo.config import get_settings
+from pycricinfo.models.source.api.commentary import Commentary, CommentaryDelivery
+
+
+async def get_innings_commentary(
+    match_id: int,
+    innings: int = 1,
+    session: Optional[aiohttp.ClientSession] = None,
+    concurrency: Optional[int] = None,
+) -> Commentary:
+    """
+    Get all of the ball-by-ball commentary for an innings of a match. The first page is fetched to find out how many
+    pages there are, then the remaining pages are fetched concurrently.
+
+    Parameters
+    ----------
+    match_id : int
+        The ID of the match for which to retrieve ball-by-ball commentary.
+    innings : int, optional
+        Which innings to retrieve commentary for, by default 1
+    session : aiohttp.ClientSession, optional
+        An existing session to use for the requests, by default None
+    concurrency : Optional[int], optional
+        The maximum number of pages to fetch at once, by default the play_by_play_concurrency setting
+
+    Returns
+    -------
+    Commentary
+        Every delivery of the innings in order, as a single page
+    """
+    semaphore = asyncio.Semaphore(concurrency or get_settings().play_by_play_concurrency)
+    deliveries = await _get_innings_deliveries(match_id, innings, semaphore, session)
+    return _combine_deliveries(deliveries)
+
+
+async def get_match_commentary(
+    match_id: int,
+    max_innings: int = 4,
+    session: Optional[aiohttp.ClientSession] = None,
+    concurrency: Optional[int] = None,
+) -> Commentary:
+    """
+    Get all of the ball-by-ball commentary for a match, fetching the pages of every innings concurrently. Innings
+    which have no commentary, because they were not played, are skipped.
+
+    Parameters
+    ----------
+    match_id : int
+        The ID of the match for which to retrieve ball-by-ball commentary.
+    max_innings : int, optional
+        The number of innings to look for commentary in, by default 4
+    session : aiohttp.ClientSession, optional
+        An existing session to use for the requests, by default None
+    concurrency : Optional[int], optional
+        The maximum number of pages to fetch at once, across all innings, by default the play_by_play_concurrency
+        setting
+
+    Returns
+    -------
+    Commentary
+        Every delivery of the match in order, as a single page
+    """
+    semaphore = asyncio.Semaphore(concurrency or get_settings().play_by_play_concurrency)
+    async with asyncio.TaskGroup() as task_group:
+        tasks = [
+            task_group.create_task(_get_innings_deliveries(match_id, innings, semaphore, session))
+            for innings in range(1, max_innings + 1)
+        ]
+    return _combine_deliveries([delivery for task in tasks for delivery in task.result()])
+
+
+async def stream_deliveries(
+    match_id: int,
+    max_innings: int = 4,
+    session: Optional[aiohttp.ClientSession] = None,
+    prefetch: Optional[int] = None,
+) -> AsyncIterator[CommentaryDelivery]:
+    """
+    Stream every delivery of a match in order, yielding each page of deliveries as soon as it arrives. Later pages,
+    including the first page of the next innings, are fetched in the background while earlier ones are consumed,
+    but no more than ``prefetch`` pages are held at once, so a whole match is never in memory. Innings which have no
+    commentary are skipped.
+
+    Parameters
+    ----------
+    match_id : int
+        The ID of the match for which to stream ball-by-ball commentary.
+    max_innings : int, optional
+        The number of innings to look for commentary in, by default 4
+    session : aiohttp.ClientSession, optional
+        An existing session to use for the requests, by default None
+    prefetch : Optional[int], optional
+        The maximum number of pages to fetch ahead of the consumer, by default the play_by_play_concurrency setting
+
+    Yields
+    ------
+    CommentaryDelivery
+        Each delivery of the match, in the order they were bowled
+    """
+    window = max(prefetch or get_settings().play_by_play_concurrency, 1)
+    pending: deque[tuple[int, int, asyncio.Task]] = deque()
+    page_counts: dict[int, int] = {}
+    next_innings, next_page = 1, 1
+    seen_ids: set[str] = set()
+
+    def schedule_pages() -> None:
+        nonlocal next_innings, next_page
+        while len(pending) < window and next_innings <= max_innings:
+            # Until the first page of an innings arrives, it isn't known how many more pages it has
+            if next_page > 1 and next_innings not in page_counts:
+                return
+            if next_page > page_counts.get(next_innings, 1):
+                next_innings, next_page = next_innings + 1, 1
+                continue
+
+            coroutine = get_play_by_play(match_id, next_innings, next_page, session=session)
+            pending.append((next_innings, next_page, asyncio.ensure_future(coroutine)))
+            next_page += 1
+
+    try:
+        schedule_pages()
+        while pending:
+            innings, page, task = pending.popleft()
+            commentary = await task
+            if page == 1:
+                page_counts[innings] = commentary.page_count if commentary else 0
+            schedule_pages()
+
+            if not commentary:
+                continue
+            for delivery in sorted(commentary.deliveries, key=lambda d: d.sequence):
+                if delivery.id not in seen_ids:
+                    seen_ids.add(delivery.id)
+                    yield delivery
+    finally:
+        for _, _, task in pending:
+            task.cancel()
+
+
+async def _get_innings_deliveries(
+    match_id: int, innings: int, semaphore: asyncio.Semaphore, session: Optional[aiohttp.ClientSession]
+) -> list[CommentaryDelivery]:
+    async def get_page(page: int) -> list[CommentaryDelivery]:
+        async with semaphore:
+            commentary = await get_play_by_play(match_id, innings, page, session=session)
+        return commentary.deliveries if commentary else []
+
+    async with semaphore:
+        first_page = await get_play_by_play(match_id, innings, 1, session=session)
+    if not first_page:
+        return []
+
+    async with asyncio.TaskGroup() as task_group:
+        tasks = [task_group.create_task(get_page(page)) for page in range(2, first_page.page_count + 1)]
+    return first_page.deliveries + [delivery for task in tasks for delivery in task.result()]
+
+
+def _combine_deliveries(deliveries: list[CommentaryDelivery]) -> Commentary:
+    """
+    Combine deliveries from many pages into a single page, in the order they were bowled. Pages of an innings in
+    progress can shift while they are being fetched, so any delivery which appears on two pages is only kept once.
+    """
+    unique_deliveries = {delivery.id: delivery for delivery in deliveries}
+    ordered_deliveries = sorted(unique_deliveries.values(), key=lambda d: (d.period, d.sequence))
+    count = len(ordered_deliveries)
+    return Commentary(
+        count=count, page_index=1, page_size=count, page_count=1 if count else 0, deliveries=ordered_deliveries
+    )
@@ -1,9 +1,15 @@
 from enum import Enum, auto
 from functools import lru_cache
+from typing import Literal, Optional
 
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings
 
+ArchiveCompression = Literal["none", "gzip", "zstd"]
+HTMLParserBackend = Literal["auto", "lxml", "html.parser"]
+ParseExecutorType = Literal["inline", "thread", "process"]
+TransportMode = Literal["live", "record", "replay"]
+
 
 class BaseRoute(Enum):
     core: str = auto()
@@ -47,6 +53,125 @@ class PageRoutes(BaseModel):
     player_stats: str = "ci/engine/player/{player_id}.html?class=11;template=results;type={stat_type}"
 
 
+class RouteCacheTTLs(BaseModel):
+    """
+    The number of seconds to cache responses for, for each route in ``CoreAPIRoutes`` and ``PageRoutes``,
+    keyed by the route's field name. A value of 0 disables caching for that route.
+    """
+
+    team: int = 86400
+    team_players: int = 86400
+    player: int = 604800
+    match_basic: int = 300
+    match_team: int = 300
+    match_team_roster: int = 300
+    match_team_all_innings: int = 60
+    match_team_innings: int = 60
+    match_team_statistics: int = 60
+    match_player_all_innings: int = 60
+    match_player_innings_statistics: int = 60
+    match_summary: int = 15
+    league: int = 86400
+    league_event: int = 3600
+    play_by_play_page: int = 10
+    venue: int = 604800
+    player_profile: int = 86400
+    series_in_season: int = 3600
+    matches_in_series: int = 600
+    player_stats: int = 86400
+
+
+class RateLimit(BaseModel):
+    """A token bucket rate limit: the sustained number of requests per second, and how many can be made in a burst"""
+
+    rate: float
+    burst: int
+
+
+class RateLimits(BaseModel):
+    """
+    The rate limit for each ``BaseRoute``. A rate of 0 disables rate limiting for that base route.
+    The page and Statsguru routes are protected by bot detection, which blocks clients much sooner than the JSON APIs.
+    """
+
+    core: RateLimit = RateLimit(rate=20, burst=40)
+    site: RateLimit = RateLimit(rate=20, burst=40)
+    page: RateLimit = RateLimit(rate=1, burst=3)
+    stats: RateLimit = RateLimit(rate=1, burst=3)
+
+
+class RetrySettings(BaseModel):
+    """
+    How to retry failed upstream requests. Delays grow exponentially from ``backoff_base`` up to ``backoff_max``
+    seconds, with full jitter. Responses with one of ``retry_statuses``, connection errors and timeouts are retried.
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 10.0
+    retry_statuses: list[int] = [429, 500, 502, 503, 504]
+
+
+class CircuitBreakerSettings(BaseModel):
+    """
+    When a host fails ``failure_threshold`` times in a row, requests to it fail fast for ``reset_timeout`` seconds,
+    after which a single trial request is allowed through to test whether it has recovered.
+    """
+
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+
+
+class LivePollSettings(BaseModel):
+    """
+    How often to poll the ball-by-ball commentary of a live match. Polling starts every ``min_interval`` seconds,
+    and each poll which finds no new deliveries multiplies the interval by ``backoff_factor``, up to ``max_interval``.
+    While the current innings doesn't look finished, the next innings is only checked for every
+    ``next_innings_probe_interval`` seconds, in case it was closed in a way the commentary doesn't show.
+    """
+
+    min_interval: float = 15.0
+    max_interval: float = 120.0
+    backoff_factor: float = 2.0
+    next_innings_probe_interval: float = 600.0
+
+
+class PollScheduleSettings(BaseModel):
+    """
+    How often ``PollScheduler`` polls a match in each state, in seconds. While overs are being bowled, commentary is
+    polled every ``live`` seconds and the match summary every ``status_interval`` seconds. During breaks and after
+    close of play only the match summary is polled, to find out when play resumes. Before a match starts, it is
+    checked again when it is due to start, or after ``not_started_max`` seconds if that is sooner. If no deliveries
+    arrive for ``stall_after`` seconds while a match is in progress, it is treated as being in a break.
+
+    For matches lasting more than a day, ``session_starts`` are when each session of a day's play is due to start, in
+    seconds after the time play started on the first day: by default, two-hour sessions with 40 minutes for lunch and
+    20 for tea. If the latest delivery is from an earlier session than the one due, play is between sessions.
+    """
+
+    live: float = 10.0
+    break_interval: float = 120.0
+    close_of_play: float = 900.0
+    not_started_max: float = 3600.0
+    status_interval: float = 60.0
+    stall_after: float = 600.0
+    session_starts: list[float] = [0.0, 9600.0, 18000.0]
+
+
+class CrawlSettings(BaseModel):
+    """
+    How ``SeasonCrawler`` crawls seasons: how many series are listed, and how many matches fetched, at once, how
+    many items each stage's queue holds before the stage before it waits, and how often progress is checkpointed to
+    a file in ``checkpoint_folder``, in number of matches.
+    """
+
+    series_concurrency: int = 2
+    match_concurrency: int = 4
+    queue_size: int = 50
+    checkpoint_every: int = 20
+    checkpoint_folder: str = "checkpoints"
+
+
 class PageHeaders(BaseModel):
     user_agent: str = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:150.0) Gecko/20100101 Firefox/150.0"
     accept: str = "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
@@ -64,6 +189,72 @@ class Settings(BaseSettings):
     api_response_output_folder: str = "responses"
     port: int = 8004
 
+    # Archiving of every upstream response to api_response_output_folder, written from a background thread
+    archive_responses: bool = True
+    archive_compression: ArchiveCompression = "none"
+    archive_queue_size: int = 256
+
+    # "record" saves every successful upstream response to the replay archive in replay_folder, and "replay" serves
+    # every request from that archive without touching the network
+    transport_mode: TransportMode = "live"
+    replay_folder: str = "replay"
+
+    # The BeautifulSoup tree builder used to parse HTML pages. "auto" uses lxml if it is installed
+    html_parser: HTMLParserBackend = "auto"
+
+    # Where CPU-bound parsing and validation of responses runs: on the event loop ("inline"), or in a pool of
+    # parse_executor_workers threads or processes, so the event loop can carry on with other requests meanwhile
+    parse_executor: ParseExecutorType = "thread"
+    parse_executor_workers: Optional[int] = None
+
+    # Whether the API serves metrics at /metrics when the metrics extra is installed, and how often it samples the lag
+    # of its event loop, in seconds
+    metrics_enabled: bool = True
+    event_loop_lag_interval: float = 1.0
+
+    # Whether to mirror the spans timing each stage of a request to OpenTelemetry, when it is installed
+    opentelemetry_tracing: bool = True
+
+    # The fraction of response payloads to write to the debug log, when debug logging is enabled
+    debug_payload_sample_rate: float = 1.0
+
+    # Connection pooling for the shared HTTP session
+    connection_pool_limit: int = 100
+    connection_pool_limit_per_host: int = 20
+    dns_cache_ttl: int = 300
+    keepalive_timeout: float = 30.0
+
+    # Response caching, in memory and optionally on disk
+    cache_enabled: bool = True
+    cache_ttls: RouteCacheTTLs = RouteCacheTTLs()
+    cache_default_ttl: int = 0
+    cache_memory_max_bytes: int = 256 * 1024 * 1024
+    cache_folder: Optional[str] = "cache"
+    # The most the disk tier may hold: expired entries, then the oldest, are removed when it grows past this
+    cache_disk_max_bytes: Optional[int] = 1024 * 1024 * 1024
+
+    rate_limits: RateLimits = RateLimits()
+
+    request_timeout: float = 30.0
+    retry: RetrySettings = RetrySettings()
+    circuit_breaker: CircuitBreakerSettings = CircuitBreakerSettings()
+
+    # The maximum number of pages of ball-by-ball commentary to fetch at once for an innings or match
+    play_by_play_concurrency: int = 8
+
+    # The maximum number of players whose careers are fetched at once by get_player_careers
+    player_career_concurrency: int = 4
+
+    crawl: CrawlSettings = CrawlSettings()
+
+    live_poll: LivePollSettings = LivePollSettings()
+    poll_schedule: PollScheduleSettings = PollScheduleSettings()
+
+    # Live delivery feeds served by the API: how many deliveries to buffer for each client before dropping the
+    # oldest, and how often to send a keep-alive comment while there are none
+    live_feed_queue_size: int = 100
+    live_feed_heartbeat: float = 15.0
+
     # TODO: Combine with MatchTypeNames enum
     # 11, 12 and 13 have different meanings in API "match_class" and the records/StatsGuru section
     match_classes: dict[int, str] = {
@@ -0,0 +1,209 @@
+import asyncio
+import logging
+import re
+from pathlib import Path
+from typing import AsyncIterator, Iterable, Optional
+
+import aiohttp
+from pydantic import BaseModel, Field
+
+from pycricinfo.call_cricinfo_api import get_match
+from pycricinfo.config import CrawlSettings, get_settings
+from pycricinfo.models.source.api.match import Match
+from pycricinfo.models.source.pages.series import MatchSeries
+from pycricinfo.search.seasons import get_match_types_in_season
+from pycricinfo.search.series import get_match_results_in_series
+from pycricinfo.types.match_types import MatchTypeNames
+from pycricinfo.utils import write_file_atomically
+
+logger = logging.getLogger("cricinfo")
+
+
+class CrawledMatch(BaseModel):
+    """A match found by crawling a season: either the match summary, or why fetching it failed."""
+
+    season: str
+    series: MatchSeries
+    match_id: int
+    match: Optional[Match] = None
+    error: Optional[str] = None
+
+
+class CrawlCheckpoint(BaseModel):
+    """
+    How far a crawl has got, saved to disk so that it can be resumed. A series is complete once every one of its
+    matches has been handed to the consumer, and a season once every one of its series is complete.
+    """
+
+    completed_seasons: set[str] = Field(default_factory=set)
+    completed_series: set[int] = Field(default_factory=set)
+    completed_matches: set[int] = Field(default_factory=set)
+    failed_matches: dict[int, str] = Field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path) -> "CrawlCheckpoint":
+        if not path.exists():
+            return cls()
+        return cls.model_validate_json(path.read_bytes())
+
+    def save(self, path: Path) -> None:
+        """Write the checkpoint atomically, so that a crash or an overlapping save can't leave it corrupt."""
+        write_file_atomically(path, [self.model_dump_json().encode()])
+
+
+class SeasonCrawler:
+    """
+    Crawls every match in one or more seasons, as a pipeline of three stages joined by bounded queues: listing the
+    series in each season, listing the matches in each series, then fetching each match's summary. Each stage runs
+    its own number of workers, and because the queues are bounded, a slow consumer or later stage holds back the
+    earlier ones, rather than everything being fetched up front.
+
+    Progress is checkpointed to disk, so a crawl which is stopped or fails can be resumed by crawling the same
+    seasons again: completed seasons, series and matches are skipped. Matches which failed, or which had not finished
+    when they were fetched, are fetched again.
+    """
+
+    def __init__(
+        self,
+        seasons: Iterable[str | int],
+        type_filter: Optional[MatchTypeNames] = None,
+        checkpoint_path: Optional[str | Path] = None,
+        settings: Optional[CrawlSettings] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+    ):
+        self.seasons = [str(season) for season in seasons]
+        self.type_filter = type_filter
+        self.settings = settings or get_settings().crawl
+        self.session = session
+
+        if checkpoint_path is None:
+            name = re.sub(r"[^\w-]", "-", "_".join(self.seasons + ([type_filter.name] if type_filter else [])))
+            checkpoint_path = Path(self.settings.checkpoint_folder) / f"crawl_{name}.json"
+        self.checkpoint_path = Path(checkpoint_path)
+        self.checkpoint = CrawlCheckpoint.load(self.checkpoint_path)
+
+        self._series_queue: asyncio.Queue[tuple[str, MatchSeries]] = asyncio.Queue(self.settings.queue_size)
+        self._match_queue: asyncio.Queue[tuple[str, MatchSeries, int]] = asyncio.Queue(self.settings.queue_size)
+        self._output_queue: asyncio.Queue[Optional[CrawledMatch]] = asyncio.Queue(self.settings.queue_size)
+
+        # The number of series in each season, and matches in each series, not yet complete
+        self._incomplete_series: dict[str, int] = {}
+        self._incomplete_matches: dict[int, int] = {}
+        self._unsaved_changes = 0
+
+    async def crawl(self) -> AsyncIterator[CrawledMatch]:
+        """
+        Crawl the seasons, yielding each match as it is fetched. A match is only recorded as complete in the
+        checkpoint once the consumer asks for the next one, so a match is never skipped on resume because the
+        consumer stopped while handling it.
+
+        Yields
+        ------
+        CrawledMatch
+            Each match in the seasons, or the error from fetching it
+        """
+        workers = [asyncio.create_task(self._list_matches_worker()) for _ in range(self.settings.series_concurrency)]
+        workers += [asyncio.create_task(self._fetch_match_worker()) for _ in range(self.settings.match_concurrency)]
+        coordinator = asyncio.create_task(self._list_series())
+
+        try:
+            while (crawled_match := await self._output_queue.get()) is not None:
+                yield crawled_match
+                self._record_match(crawled_match)
+            # Raise any error from listing the seasons
+            await coordinator
+        finally:
+            coordinator.cancel()
+            for worker in workers:
+                worker.cancel()
+            self.checkpoint.save(self.checkpoint_path)
+
+    async def _list_series(self) -> None:
+        """Put every incomplete series of each season on the series queue, then end the crawl once all are done."""
+        try:
+            for season in self.seasons:
+                if season in self.checkpoint.completed_seasons:
+                    continue
+
+                match_types = await get_match_types_in_season(season, self.type_filter, session=self.session)
+                series_in_season = list(
+                    {
+                        series.data_series_id: series
+                        for match_type in match_types
+                        for series in match_type.series or []
+                        if series.data_series_id not in self.checkpoint.completed_series
+                    }.values()
+                )
+                self._incomplete_series[season] = len(series_in_season)
+                if not series_in_season:
+                    self._complete_season(season)
+                for series in series_in_season:
+                    await self._series_queue.put((season, series))
+
+            await self._series_queue.join()
+            await self._match_queue.join()
+        except Exception:
+            await self._output_queue.put(None)
+            raise
+        await self._output_queue.put(None)
+
+    async def _list_matches_worker(self) -> None:
+        while True:
+            season, series = await self._series_queue.get()
+            try:
+                results = await get_match_results_in_series(series.data_series_id, session=self.session)
+                match_ids = list(
+                    dict.fromkeys(result.id for result in results if result.id not in self.checkpoint.completed_matches)
+                )
+                self._incomplete_matches[series.data_series_id] = len(match_ids)
+                if not match_ids:
+                    self._complete_series(season, series)
+                for match_id in match_ids:
+                    await self._match_queue.put((season, series, match_id))
+            except Exception as ex:
+                logger.warning(f"Failed to list matches in series {series.data_series_id}: {ex}")
+            finally:
+                self._series_queue.task_done()
+
+    async def _fetch_match_worker(self) -> None:
+        while True:
+            season, series, match_id = await self._match_queue.get()
+            try:
+                crawled_match = CrawledMatch(season=season, series=series, match_id=match_id)
+                try:
+                    crawled_match.match = await get_match(series.series_id, match_id, session=self.session)
+                except Exception as ex:
+                    logger.warning(f"Failed to get match {match_id} in series {series.series_id}: {ex}")
+                    crawled_match.error = str(ex)
+                await self._output_queue.put(crawled_match)
+            finally:
+                self._match_queue.task_done()
+
+    def _record_match(self, crawled_match: CrawledMatch) -> None:
+        if crawled_match.error is not None:
+            self.checkpoint.failed_matches[crawled_match.match_id] = crawled_match.error
+        else:
+            self.checkpoint.failed_matches.pop(crawled_match.match_id, None)
+            # A match which is still in progress or yet to start is left pending, so that a resumed crawl fetches it
+            # again, along with the series and season it is in
+            if crawled_match.match.is_complete:
+                self.checkpoint.completed_matches.add(crawled_match.match_id)
+
+                series_id = crawled_match.series.data_series_id
+                self._incomplete_matches[series_id] -= 1
+                if self._incomplete_matches[series_id] == 0:
+                    self._complete_series(crawled_match.season, crawled_match.series)
+
+        self._unsaved_changes += 1
+        if self._unsaved_changes >= self.settings.checkpoint_every:
+            self.checkpoint.save(self.checkpoint_path)
+            self._unsaved_changes = 0
+
+    def _complete_series(self, season: str, series: MatchSeries) -> None:
+        self.checkpoint.completed_series.add(series.data_series_id)
+        self._incomplete_series[season] -= 1
+        if self._incomplete_series[season] == 0:
+            self._complete_season(season)
+
+    def _complete_season(self, season: str) -> None:
+        self.checkpoint.completed_seasons.add(season)
@@ -25,3 +25,12 @@ class CricinfoAPIException(Exception):
 
     def __str__(self) -> str:
         return f"CricinfoAPIException: status_code={self.status_code}, route={self.route}, content={self.content}"
+
+
+class CircuitBreakerOpenException(CricinfoAPIException):
+    """Raised without making a request, while the circuit breaker for an unhealthy upstream host is open."""
+
+    def __init__(self, route: str, host: str):
+        super().__init__(
+            status_code=503, route=route, content={"message": f"Requests to '{host}' are paused as it is failing"}
+        )
@@ -0,0 +1,83 @@
+import asyncio
+import atexit
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Optional, TypeVar
+
+from pycricinfo.config import get_settings
+from pycricinfo.instrumentation import span
+
+T = TypeVar("T")
+
+_parse_executor: Optional[Executor] = None
+
+
+async def run_parser(func: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Run a CPU-bound parsing or validation function off the event loop, in the executor chosen by the
+    parse_executor setting, or inline if it is "inline".
+
+    With a process pool, the function must be defined at the top level of a module, and its arguments and result
+    must be picklable.
+
+    Parameters
+    ----------
+    func : Callable[..., T]
+        The function to run
+    *args, **kwargs
+        The arguments to call the function with
+
+    Returns
+    -------
+    T
+        The result of the function
+    """
+    executor = get_parse_executor()
+    with span("cricinfo.parse", parser=func.__name__, executor=get_settings().parse_executor):
+        if executor is None:
+            return func(*args, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(executor, partial(func, *args, **kwargs))
+
+
+def get_parse_executor() -> Optional[Executor]:
+    """
+    Get the process-wide executor for parsing, creating it from settings on first use.
+
+    Returns
+    -------
+    Optional[Executor]
+        The thread or process pool, or None if parsing runs inline on the event loop
+    """
+    global _parse_executor
+
+    settings = get_settings()
+    if settings.parse_executor == "inline":
+        return None
+
+    if _parse_executor is None:
+        workers = settings.parse_executor_workers or min(4, os.cpu_count() or 1)
+        if settings.parse_executor == "process":
+            _parse_executor = ProcessPoolExecutor(max_workers=workers)
+        else:
+            _parse_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pycricinfo-parser")
+    return _parse_executor
+
+
+def shutdown_parse_executor(wait: bool = True) -> None:
+    """
+    Shut down the parse executor, if one has been created. A new one is created if anything is parsed afterwards.
+
+    Parameters
+    ----------
+    wait : bool, optional
+        Whether to wait for any parsing in progress to finish, by default True
+    """
+    global _parse_executor
+
+    executor, _parse_executor = _parse_executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
+atexit.register(shutdown_parse_executor)
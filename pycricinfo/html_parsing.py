@@ -0,0 +1,55 @@
+import logging
+from functools import lru_cache
+from typing import Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from pycricinfo.config import HTMLParserBackend, get_settings
+
+try:
+    import lxml
+except ImportError:  # pragma: no cover - optional dependency
+    lxml = None
+
+logger = logging.getLogger("cricinfo")
+
+
+def parse_html(content: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """
+    Parse an HTML page with the fastest available BeautifulSoup tree builder, as chosen by the html_parser setting.
+
+    Parameters
+    ----------
+    content : str
+        The HTML to parse
+    parse_only : Optional[SoupStrainer], optional
+        Limits parsing to the matching parts of the page, by default None
+
+    Returns
+    -------
+    BeautifulSoup
+        The parsed page
+    """
+    return BeautifulSoup(content, get_html_parser_backend(), parse_only=parse_only)
+
+
+def get_html_parser_backend() -> str:
+    """
+    Get the name of the BeautifulSoup tree builder to parse HTML with.
+
+    Returns
+    -------
+    str
+        "lxml" if it is configured or installed, otherwise "html.parser"
+    """
+    return _resolve_html_parser_backend(get_settings().html_parser)
+
+
+@lru_cache
+def _resolve_html_parser_backend(backend: HTMLParserBackend) -> str:
+    if backend == "lxml" and lxml is None:
+        logger.warning("lxml is not installed, so HTML will be parsed with html.parser")
+        return "html.parser"
+    if backend == "auto":
+        return "lxml" if lxml is not None else "html.parser"
+    return backend
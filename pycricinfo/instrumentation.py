@@ -0,0 +1,313 @@
+import itertools
+import logging
+import threading
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Any, Callable, Iterator, Optional
+
+import aiohttp
+
+from pycricinfo.config import get_settings
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:  # pragma: no cover - optional dependency
+    otel_trace = None
+
+logger = logging.getLogger("cricinfo")
+
+SpanHook = Callable[["Span"], None]
+
+_span_hooks: list[SpanHook] = []
+_current_span: ContextVar[Optional["Span"]] = ContextVar("cricinfo_current_span", default=None)
+_span_ids = itertools.count(1)
+
+_request_counts: Counter[tuple[str, str]] = Counter()
+_request_counts_lock = threading.Lock()
+
+# The number of spans of each name in progress, such as upstream requests in flight
+_open_spans: Counter[str] = Counter()
+_open_spans_lock = threading.Lock()
+
+
+class Span:
+    """
+    A timed stage of handling a request, such as waiting for the first byte of a response, or validating it into a
+    model. Spans started within another span are its children, and share its request ID and route template.
+
+    Times are from ``time.perf_counter``, so only durations, and the order of spans, are meaningful.
+    """
+
+    __slots__ = ("name", "span_id", "parent_id", "request_id", "route_template", "start", "end", "attributes")
+
+    def __init__(
+        self,
+        name: str,
+        parent: Optional["Span"] = None,
+        request_id: Optional[str] = None,
+        route_template: Optional[str] = None,
+        attributes: Optional[dict[str, Any]] = None,
+        start: Optional[float] = None,
+    ):
+        self.name = name
+        self.span_id = next(_span_ids)
+        self.parent_id = parent.span_id if parent else None
+        self.request_id = request_id or (parent.request_id if parent else None)
+        self.route_template = route_template or (parent.route_template if parent else None)
+        self.start = time.perf_counter() if start is None else start
+        self.end: Optional[float] = None
+        self.attributes = attributes or {}
+
+    @property
+    def duration(self) -> Optional[float]:
+        """The number of seconds the span lasted, or None if it hasn't ended."""
+        return None if self.end is None else self.end - self.start
+
+    def __repr__(self) -> str:
+        return f"Span({self.name!r}, route_template={self.route_template!r}, duration={self.duration})"
+
+
+def add_span_hook(hook: SpanHook) -> None:
+    """
+    Register a function to be called with every span as it ends.
+
+    Hooks are called on the thread the span ended on, which is the event loop for most spans, but a background
+    thread for archive writes, so they must be quick and thread safe. An exception from a hook is logged, and does
+    not affect the request.
+
+    Parameters
+    ----------
+    hook : SpanHook
+        The function to call with each span
+    """
+    _span_hooks.append(hook)
+
+
+def remove_span_hook(hook: SpanHook) -> None:
+    """
+    Stop calling a function registered with ``add_span_hook``.
+
+    Parameters
+    ----------
+    hook : SpanHook
+        The function to stop calling
+    """
+    if hook in _span_hooks:
+        _span_hooks.remove(hook)
+
+
+def get_current_span() -> Optional[Span]:
+    """
+    Get the innermost span in progress in the current context.
+
+    Returns
+    -------
+    Optional[Span]
+        The current span, or None if there isn't one
+    """
+    return _current_span.get()
+
+
+@contextmanager
+def span(
+    name: str, request_id: Optional[str] = None, route_template: Optional[str] = None, **attributes
+) -> Iterator[Span]:
+    """
+    Time the code within the context as a span, which is passed to every span hook when it ends, and mirrored to
+    OpenTelemetry if it is installed. If the code raises, the name of the exception is recorded as the ``error``
+    attribute of the span.
+
+    Parameters
+    ----------
+    name : str
+        The name of the span, such as "cricinfo.validate"
+    request_id : Optional[str], optional
+        The ID of the request the span belongs to, by default that of the current span
+    route_template : Optional[str], optional
+        The route template of the request, by default that of the current span
+    **attributes
+        Attributes to record on the span. More can be added to ``Span.attributes`` within the context
+
+    Yields
+    ------
+    Span
+        The span in progress
+    """
+    current = Span(name, _current_span.get(), request_id, route_template, attributes)
+    token = _current_span.set(current)
+    tracer = _get_tracer()
+    with _open_spans_lock:
+        _open_spans[name] += 1
+
+    with ExitStack() as stack:
+        otel_span = stack.enter_context(tracer.start_as_current_span(name)) if tracer else None
+        try:
+            yield current
+        except BaseException as ex:
+            current.attributes["error"] = type(ex).__name__
+            raise
+        finally:
+            current.end = time.perf_counter()
+            _current_span.reset(token)
+            with _open_spans_lock:
+                _open_spans[name] -= 1
+            if otel_span is not None:
+                otel_span.set_attributes(_otel_attributes(current))
+            _emit(current)
+
+
+def record_span(
+    name: str,
+    start: float,
+    end: float,
+    request_id: Optional[str] = None,
+    route_template: Optional[str] = None,
+    **attributes,
+) -> Span:
+    """
+    Record a span which has already ended, for stages which can't be wrapped in a context, such as those timed by
+    aiohttp's tracing callbacks. It is a child of the current span.
+
+    Parameters
+    ----------
+    name : str
+        The name of the span
+    start : float
+        When the span started, from ``time.perf_counter``
+    end : float
+        When the span ended, from ``time.perf_counter``
+    request_id : Optional[str], optional
+        The ID of the request the span belongs to, by default that of the current span
+    route_template : Optional[str], optional
+        The route template of the request, by default that of the current span
+    **attributes
+        Attributes to record on the span
+
+    Returns
+    -------
+    Span
+        The recorded span
+    """
+    recorded = Span(name, _current_span.get(), request_id, route_template, attributes, start=start)
+    recorded.end = end
+
+    tracer = _get_tracer()
+    if tracer is not None:
+        # OpenTelemetry wants wall clock times in nanoseconds
+        offset = time.time_ns() - int(time.perf_counter() * 1e9)
+        otel_span = tracer.start_span(name, start_time=offset + int(start * 1e9))
+        otel_span.set_attributes(_otel_attributes(recorded))
+        otel_span.end(end_time=offset + int(end * 1e9))
+
+    _emit(recorded)
+    return recorded
+
+
+def get_open_span_counts() -> dict[str, int]:
+    """
+    Get the number of spans of each name which are in progress, such as "cricinfo.request" for the number of
+    upstream requests in flight.
+
+    Returns
+    -------
+    dict[str, int]
+        The number of spans in progress, by name
+    """
+    with _open_spans_lock:
+        return dict(_open_spans)
+
+
+def count_request(route_template: str, status: int | str) -> None:
+    """
+    Count an upstream request by its route template and outcome.
+
+    Parameters
+    ----------
+    route_template : str
+        The route template which was requested
+    status : int | str
+        The status code of the response, or "error" if no response was received
+    """
+    with _request_counts_lock:
+        _request_counts[(route_template, str(status))] += 1
+
+
+def get_request_counts() -> dict[tuple[str, str], int]:
+    """
+    Get the number of upstream requests made so far, by route template and status.
+
+    Returns
+    -------
+    dict[tuple[str, str], int]
+        The count for each pair of route template and status, which is "error" for requests with no response
+    """
+    with _request_counts_lock:
+        return dict(_request_counts)
+
+
+def reset_request_counts() -> None:
+    """Set every upstream request count back to zero."""
+    with _request_counts_lock:
+        _request_counts.clear()
+
+
+def create_trace_config() -> aiohttp.TraceConfig:
+    """
+    Create an aiohttp trace config which records DNS resolution and connection establishment as spans, as children
+    of the span of the request which needed them. Requests on a pooled connection have neither.
+
+    Returns
+    -------
+    aiohttp.TraceConfig
+        The trace config, to pass to a ``ClientSession``
+    """
+    trace_config = aiohttp.TraceConfig()
+
+    def start_timer(stage: str):
+        async def start(_: aiohttp.ClientSession, context: SimpleNamespace, __) -> None:
+            setattr(context, stage, time.perf_counter())
+
+        return start
+
+    def end_timer(stage: str):
+        async def end(_: aiohttp.ClientSession, context: SimpleNamespace, params) -> None:
+            started_at = getattr(context, stage, None)
+            if started_at is not None:
+                host = getattr(params, "host", None)
+                record_span(f"cricinfo.{stage}", started_at, time.perf_counter(), **({"host": host} if host else {}))
+
+        return end
+
+    trace_config.on_dns_resolvehost_start.append(start_timer("dns"))
+    trace_config.on_dns_resolvehost_end.append(end_timer("dns"))
+    trace_config.on_connection_create_start.append(start_timer("connect"))
+    trace_config.on_connection_create_end.append(end_timer("connect"))
+    return trace_config
+
+
+def _emit(ended: Span) -> None:
+    for hook in list(_span_hooks):
+        try:
+            hook(ended)
+        except Exception as ex:
+            logger.warning(f"Span hook {hook!r} failed for span '{ended.name}': {ex!r}")
+
+
+def _otel_attributes(ended: Span) -> dict[str, Any]:
+    attributes = {
+        "cricket_stats.request_id": ended.request_id,
+        "cricket_stats.request_route_template": ended.route_template,
+        **{f"cricket_stats.{key}": value for key, value in ended.attributes.items()},
+    }
+    return {key: value for key, value in attributes.items() if isinstance(value, (str, bool, int, float))}
+
+
+@lru_cache
+def _get_tracer():
+    if otel_trace is None or not get_settings().opentelemetry_tracing:
+        return None
+    return otel_trace.get_tracer("pycricinfo")
@@ -0,0 +1,295 @@
+import asyncio
+import logging
+import re
+import time
+from functools import lru_cache
+from typing import AsyncIterator, Optional
+
+import aiohttp
+from pydantic import BaseModel
+
+from pycricinfo.call_cricinfo_api import get_play_by_play
+from pycricinfo.config import LivePollSettings, get_settings
+from pycricinfo.exceptions import CricinfoAPIException
+from pycricinfo.models.source.api.commentary import Commentary, CommentaryDelivery
+
+logger = logging.getLogger("cricinfo")
+
+# Words in the commentary of a delivery which show that its innings has been closed without being bowled out
+INNINGS_CLOSED_PATTERN = re.compile(
+    r"\b(declared|declares|declaration|forfeit(ed|s)?|innings break|end of (the )?innings)\b"
+)
+
+
+class InningsPosition(BaseModel):
+    """How far through an innings a poller has read."""
+
+    innings: int
+    page_count: int = 0
+    last_sequence: int = 0
+    last_bbb_timestamp: int = 0
+
+
+def is_innings_finished(delivery: CommentaryDelivery) -> bool:
+    """
+    Check whether a delivery finished its innings: the batting side is all out, has used up its overs or reached its
+    target, or its commentary says the innings was declared or has ended.
+
+    Parameters
+    ----------
+    delivery : CommentaryDelivery
+        The delivery, usually the latest of its innings
+
+    Returns
+    -------
+    bool
+        True if the innings looks finished
+    """
+    innings = delivery.current_innings_score
+    if innings.wickets >= 10 or (innings.ball_limit > 0 and innings.remaining_balls <= 0):
+        return True
+    if innings.target > 0 and innings.runs >= innings.target:
+        return True
+    text = " ".join(text for text in (delivery.short_text, delivery.text, delivery.post_text) if text)
+    return bool(INNINGS_CLOSED_PATTERN.search(text.lower()))
+
+
+class LivePoller:
+    """
+    Polls the ball-by-ball commentary of a live match, returning only deliveries which have not been seen before.
+
+    New deliveries are always added to the last page of the innings in progress, so rather than downloading every
+    page on each poll, the poller remembers the page count and last delivery ``sequence`` of the current innings,
+    and only fetches the last page, plus any pages added since. These pages are always fetched upstream rather than
+    from the response cache, whose TTL for them is as long as the polling interval. Once the current innings looks
+    finished, and it has stopped changing, the first page of the next innings is checked too, so the poller moves on
+    once it starts. Otherwise, the next innings is only checked every ``next_innings_probe_interval`` seconds.
+
+    The first poll finds the innings in progress and records how far through it the match is, without returning
+    the deliveries bowled before the poller started.
+    """
+
+    def __init__(
+        self,
+        match_id: int,
+        session: Optional[aiohttp.ClientSession] = None,
+        max_innings: int = 4,
+        settings: Optional[LivePollSettings] = None,
+    ):
+        self.match_id = match_id
+        self.session = session
+        self.max_innings = max_innings
+        self.settings = settings or get_settings().live_poll
+        self.interval = self.settings.min_interval
+        self.position: Optional[InningsPosition] = None
+        self.latest_delivery: Optional[CommentaryDelivery] = None
+        self._next_innings_probed_at = time.monotonic()
+
+    async def poll(self) -> list[CommentaryDelivery]:
+        """
+        Poll for new deliveries once, and update the polling interval: back to the minimum if there were new
+        deliveries, otherwise backing off.
+
+        Returns
+        -------
+        list[CommentaryDelivery]
+            The deliveries bowled since the last poll, in order
+        """
+        if self.position is None:
+            await self._find_current_innings()
+            deliveries = []
+        else:
+            deliveries = await self._poll_innings(self.position)
+            if not deliveries and self._should_probe_next_innings():
+                self._next_innings_probed_at = time.monotonic()
+                next_position = InningsPosition(innings=self.position.innings + 1)
+                deliveries = await self._poll_innings(next_position)
+                if next_position.page_count:
+                    self.position = next_position
+
+        if deliveries:
+            self.interval = self.settings.min_interval
+        else:
+            self.interval = min(self.interval * self.settings.backoff_factor, self.settings.max_interval)
+        return deliveries
+
+    async def deliveries(self) -> AsyncIterator[CommentaryDelivery]:
+        """
+        Poll until cancelled, yielding each new delivery as it is found. Failed polls, whether from an error
+        response or a connection error or timeout which outlasted the retries, are logged and backed off from,
+        rather than ending the iteration.
+
+        Yields
+        ------
+        CommentaryDelivery
+            Each new delivery, in order
+        """
+        while True:
+            try:
+                for delivery in await self.poll():
+                    yield delivery
+            except (CricinfoAPIException, aiohttp.ClientError, asyncio.TimeoutError) as ex:
+                self.interval = min(self.interval * self.settings.backoff_factor, self.settings.max_interval)
+                logger.warning(f"Polling live commentary for match {self.match_id} failed: {ex!r}")
+            await asyncio.sleep(self.interval)
+
+    def _should_probe_next_innings(self) -> bool:
+        if not self.position.page_count or self.position.innings >= self.max_innings:
+            return False
+        if self.latest_delivery is not None and is_innings_finished(self.latest_delivery):
+            return True
+        return time.monotonic() - self._next_innings_probed_at >= self.settings.next_innings_probe_interval
+
+    async def _find_current_innings(self) -> None:
+        position = InningsPosition(innings=1)
+        for innings in range(1, self.max_innings + 1):
+            candidate = InningsPosition(innings=innings)
+            first_page = await self._get_page(innings, 1)
+            if not first_page:
+                break
+            candidate.page_count = first_page.page_count
+            position = candidate
+        self.position = position
+
+        # Skip everything bowled so far in the current innings
+        await self._poll_innings(position)
+
+    async def _poll_innings(self, position: InningsPosition) -> list[CommentaryDelivery]:
+        page = max(position.page_count, 1)
+        deliveries = []
+        while True:
+            commentary = await self._get_page(position.innings, page)
+            if not commentary:
+                break
+            deliveries.extend(d for d in commentary.deliveries if d.sequence > position.last_sequence)
+            position.page_count = commentary.page_count
+            if page >= commentary.page_count:
+                break
+            page += 1
+
+        deliveries.sort(key=lambda d: d.sequence)
+        if deliveries:
+            position.last_sequence = deliveries[-1].sequence
+            position.last_bbb_timestamp = max(d.bbb_timestamp for d in deliveries)
+            self.latest_delivery = deliveries[-1]
+        return deliveries
+
+    async def _get_page(self, innings: int, page: int) -> Optional[Commentary]:
+        commentary = await get_play_by_play(self.match_id, innings, page, session=self.session, use_cache=False)
+        return commentary or None
+
+
+class LiveFeed:
+    """A single poller for a live match, whose new deliveries are copied to the queue of every subscriber."""
+
+    def __init__(self, poller: LivePoller, queue_size: int):
+        self.poller = poller
+        self.queue_size = queue_size
+        self.subscribers: set[asyncio.Queue[Optional[CommentaryDelivery]]] = set()
+        self.task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self.task = asyncio.create_task(self._run(), name=f"pycricinfo-live-feed-{self.poller.match_id}")
+
+    async def _run(self) -> None:
+        try:
+            async for delivery in self.poller.deliveries():
+                for queue in self.subscribers:
+                    _put_dropping_oldest(queue, delivery)
+        except Exception as ex:
+            logger.error(f"Live feed for match {self.poller.match_id} stopped: {ex}")
+        finally:
+            # Tell subscribers the feed has ended, unless it was cancelled because they have all gone
+            for queue in self.subscribers:
+                _put_dropping_oldest(queue, None)
+
+
+class LiveFeedHub:
+    """
+    Shares one ``LivePoller`` per match between any number of subscribers, so that the number of upstream requests
+    for a live match doesn't grow with the number of clients following it. A match's poller starts with its first
+    subscriber and is stopped when its last subscriber leaves.
+
+    Each subscriber receives deliveries through its own bounded queue. If a subscriber falls behind, its oldest
+    undelivered deliveries are dropped. ``None`` is put on the queue if the feed stops.
+    """
+
+    def __init__(self, queue_size: Optional[int] = None, session: Optional[aiohttp.ClientSession] = None):
+        self.queue_size = queue_size or get_settings().live_feed_queue_size
+        self.session = session
+        self._feeds: dict[int, LiveFeed] = {}
+
+    def subscribe(self, match_id: int) -> asyncio.Queue[Optional[CommentaryDelivery]]:
+        """
+        Subscribe to the new deliveries of a match, starting to poll it if nobody else is already.
+
+        Parameters
+        ----------
+        match_id : int
+            The ID of the match to follow
+
+        Returns
+        -------
+        asyncio.Queue[Optional[CommentaryDelivery]]
+            The queue to which new deliveries will be put
+        """
+        feed = self._feeds.get(match_id)
+        if feed is None or feed.task.done():
+            feed = LiveFeed(LivePoller(match_id, session=self.session), self.queue_size)
+            feed.start()
+            self._feeds[match_id] = feed
+
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        feed.subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, match_id: int, queue: asyncio.Queue[Optional[CommentaryDelivery]]) -> None:
+        """
+        Stop receiving the deliveries of a match, and stop polling it if there are no subscribers left.
+
+        Parameters
+        ----------
+        match_id : int
+            The ID of the match
+        queue : asyncio.Queue[Optional[CommentaryDelivery]]
+            The queue returned when subscribing
+        """
+        feed = self._feeds.get(match_id)
+        if feed is None:
+            return
+
+        feed.subscribers.discard(queue)
+        if not feed.subscribers:
+            feed.task.cancel()
+            del self._feeds[match_id]
+
+    def subscriber_count(self, match_id: int) -> int:
+        feed = self._feeds.get(match_id)
+        return len(feed.subscribers) if feed else 0
+
+    async def close(self) -> None:
+        """Stop polling every match."""
+        feeds, self._feeds = list(self._feeds.values()), {}
+        for feed in feeds:
+            feed.subscribers.clear()
+            feed.task.cancel()
+        await asyncio.gather(*(feed.task for feed in feeds), return_exceptions=True)
+
+
+def _put_dropping_oldest(queue: asyncio.Queue, item: Optional[CommentaryDelivery]) -> None:
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(item)
+
+
+@lru_cache
+def get_live_feed_hub() -> LiveFeedHub:
+    """
+    Get the process-wide live feed hub, configured from settings.
+
+    Returns
+    -------
+    LiveFeedHub
+        The shared live feed hub
+    """
+    return LiveFeedHub()
@@ -0,0 +1,183 @@
+import asyncio
+from functools import lru_cache
+from typing import Optional
+
+from pycricinfo.config import get_settings
+from pycricinfo.instrumentation import Span, add_span_hook, get_open_span_counts
+
+try:
+    import prometheus_client
+except ImportError:  # pragma: no cover - optional dependency
+    prometheus_client = None
+
+# Upper bounds, in seconds, of the histogram buckets for durations
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+CONTENT_TYPE = (
+    prometheus_client.CONTENT_TYPE_LATEST
+    if prometheus_client is not None
+    else "text/plain; version=0.0.4; charset=utf-8"
+)
+
+# The stages of an upstream request timed by ``cricinfo_upstream_stage_duration_seconds``
+UPSTREAM_STAGES = {
+    "cricinfo.dns": "dns",
+    "cricinfo.connect": "connect",
+    "cricinfo.ttfb": "ttfb",
+    "cricinfo.body_read": "body_read",
+    "cricinfo.decode": "decode",
+    "cricinfo.archive_write": "archive_write",
+}
+
+
+class CricinfoMetrics:
+    """
+    The metrics of this process: upstream requests and their stages, the response cache, the rate limiter,
+    parsing, the event loop, and the requests served by the API. Everything but the API requests and the event loop
+    is collected from the spans in ``pycricinfo.instrumentation``. Needs ``prometheus_client``, from the ``metrics``
+    extra.
+    """
+
+    def __init__(self, registry: Optional["prometheus_client.CollectorRegistry"] = None):
+        if prometheus_client is None:
+            raise ImportError("Metrics need prometheus_client, which is installed by the metrics extra")
+
+        self.registry = registry or prometheus_client.CollectorRegistry()
+        options = {"registry": self.registry}
+        durations = {"registry": self.registry, "buckets": DEFAULT_BUCKETS}
+
+        self.upstream_request_duration = prometheus_client.Histogram(
+            "cricinfo_upstream_request_duration_seconds",
+            "Duration of upstream requests, including retries, by route template and status",
+            ("route_template", "status"),
+            **durations,
+        )
+        self.upstream_stage_duration = prometheus_client.Histogram(
+            "cricinfo_upstream_stage_duration_seconds",
+            "Duration of each stage of handling upstream requests, by stage and route template",
+            ("stage", "route_template"),
+            **durations,
+        )
+        self.upstream_in_flight = prometheus_client.Gauge(
+            "cricinfo_upstream_requests_in_flight", "Number of upstream requests in progress", **options
+        )
+        self.upstream_in_flight.set_function(lambda: get_open_span_counts().get("cricinfo.request", 0))
+        self.cache_lookups = prometheus_client.Counter(
+            "cricinfo_cache_lookups_total",
+            "Response cache lookups, by route template and whether they were hits",
+            ("route_template", "result"),
+            **options,
+        )
+        self.rate_limit_wait = prometheus_client.Histogram(
+            "cricinfo_rate_limit_wait_seconds",
+            "Time spent waiting for the rate limiter before each upstream request attempt, by base route",
+            ("base_route",),
+            **durations,
+        )
+        self.parse_duration = prometheus_client.Histogram(
+            "cricinfo_parse_duration_seconds",
+            "Duration of parsing and validation, including any wait for the parse executor, by parser",
+            ("parser",),
+            **durations,
+        )
+        self.validation_duration = prometheus_client.Histogram(
+            "cricinfo_validation_duration_seconds",
+            "Duration of validating upstream responses into models, by model",
+            ("model",),
+            **durations,
+        )
+        self.event_loop_lag = prometheus_client.Histogram(
+            "cricinfo_event_loop_lag_seconds",
+            "How late the event loop was to wake up from a sleep, sampled periodically",
+            **durations,
+        )
+        self.http_request_duration = prometheus_client.Histogram(
+            "cricinfo_http_request_duration_seconds",
+            "Duration of requests to the API until the response starts, by method, route and status",
+            ("method", "route", "status"),
+            **durations,
+        )
+        self.http_in_flight = prometheus_client.Gauge(
+            "cricinfo_http_requests_in_flight", "Number of requests to the API in progress", **options
+        )
+
+    def observe_span(self, ended: Span) -> None:
+        """Record a span from ``pycricinfo.instrumentation`` in the metrics it feeds. Registered as a span hook."""
+        duration = ended.duration
+        if ended.name == "cricinfo.request":
+            status = ended.attributes.get("status", "error")
+            self.upstream_request_duration.labels(route_template=ended.route_template, status=status).observe(duration)
+        elif ended.name in UPSTREAM_STAGES:
+            stage = UPSTREAM_STAGES[ended.name]
+            self.upstream_stage_duration.labels(stage=stage, route_template=ended.route_template or "").observe(
+                duration
+            )
+        elif ended.name == "cricinfo.cache_lookup":
+            result = "hit" if ended.attributes.get("hit") else "miss"
+            self.cache_lookups.labels(route_template=ended.route_template, result=result).inc()
+        elif ended.name == "cricinfo.rate_limit_wait":
+            self.rate_limit_wait.labels(base_route=ended.attributes.get("base_route")).observe(duration)
+        elif ended.name == "cricinfo.parse":
+            self.parse_duration.labels(parser=ended.attributes.get("parser")).observe(duration)
+        elif ended.name == "cricinfo.validate":
+            self.validation_duration.labels(model=ended.attributes.get("model")).observe(duration)
+
+    def render(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format.
+
+        Returns
+        -------
+        str
+            The metrics, to be served with the ``CONTENT_TYPE`` content type
+        """
+        return prometheus_client.generate_latest(self.registry).decode()
+
+
+class EventLoopLagMonitor:
+    """
+    Measures how far behind the event loop is running, by sleeping for ``interval`` seconds at a time and recording
+    how much later than that it wakes up. Lag comes from work which blocks the event loop, such as parsing inline.
+    """
+
+    def __init__(self, histogram: "prometheus_client.Histogram", interval: float = 1.0):
+        self.histogram = histogram
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started_at = loop.time()
+            await asyncio.sleep(self.interval)
+            self.histogram.observe(max(loop.time() - started_at - self.interval, 0.0))
+
+
+@lru_cache
+def get_metrics() -> Optional[CricinfoMetrics]:
+    """
+    Get the process-wide metrics, creating them and starting to collect them from spans on first use.
+
+    Returns
+    -------
+    Optional[CricinfoMetrics]
+        The shared metrics, or None if prometheus_client is not installed or the ``metrics_enabled`` setting is off
+    """
+    if prometheus_client is None or not get_settings().metrics_enabled:
+        return None
+    metrics = CricinfoMetrics()
+    add_span_hook(metrics.observe_span)
+    return metrics
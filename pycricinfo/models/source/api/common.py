@@ -28,13 +28,13 @@ class CCBaseModel(ABC, BaseModel):
     @model_validator(mode="before")
     @classmethod
     def set_empty_dicts_to_none(self, data: dict):
-        if not data:
+        if not data or not isinstance(data, dict):
             return data
 
-        for k, v in data.items():
-            if isinstance(v, dict) and len(v) == 0:
-                data[k] = None
-        return data
+        # Return a new dictionary, rather than changing the one passed in, which belongs to the caller
+        if not any(isinstance(v, dict) and len(v) == 0 for v in data.values()):
+            return data
+        return {k: None if isinstance(v, dict) and len(v) == 0 else v for k, v in data.items()}
 
 
 T = TypeVar("T")
@@ -1,5 +1,5 @@
 from abc import ABC
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Literal, Optional
 
 from pydantic import AliasChoices, BaseModel, Field, computed_field
@@ -60,10 +60,22 @@ class MatchCompetitonCommon(CCBaseModel, ABC):
     description: str = Field(description="Match description, covering match number in series", examples=["3rd Test"])
 
 
+class MatchStatusType(CCBaseModel):
+    """The type of a match's status, which includes whether the match is yet to start, in progress or finished"""
+
+    id: Optional[str] = None
+    description: Optional[str] = Field(default=None, examples=["Result"])
+    detail: Optional[str] = Field(default=None, examples=["Final"])
+    state: Optional[str] = Field(
+        default=None, description="The state of play: 'pre', 'in' or 'post'", examples=["post"]
+    )
+
+
 class MatchStatus(CCBaseModel):
     """The status of a match, as used in the match summary endpoint"""
 
     summary: str = Field(description="A summary of the result of the match", examples=["England won by 5 wickets"])
+    type: Optional[MatchStatusType] = None
 
 
 class MatchCompetiton(MatchCompetitonCommon):
@@ -194,3 +206,20 @@ class Match(CCBaseModel):
     def summary(self) -> bool:
         """A summary of the result of the match, e.g.) 'England won by 5 wickets'"""
         return self.header.competitions[0].status.summary
+
+    @property
+    def is_complete(self) -> bool:
+        """
+        Whether the match has finished, so its data will no longer change: it has a status summary, its end date
+        has passed, and no innings is in progress
+        """
+        competition = self.header.competition
+        if not competition.status.summary or competition.end_date is None:
+            return False
+        end_date = competition.end_date
+        if end_date.tzinfo is None:
+            end_date = end_date.replace(tzinfo=UTC)
+        if end_date > datetime.now(UTC):
+            return False
+        status_type = competition.status.type
+        return status_type is None or status_type.state not in ("pre", "in")
@@ -1,14 +1,18 @@
 import asyncio
 from argparse import ArgumentParser, Namespace
+from typing import Awaitable, TypeVar
 
 from pydantic import ValidationError
 
+from pycricinfo.api_helper import shared_session_lifespan
 from pycricinfo.call_cricinfo_api import get_match, get_play_by_play
 from pycricinfo.models.output.scorecard import CricinfoScorecard
 from pycricinfo.models.source.api.commentary import APIResponseCommentary, Commentary
 from pycricinfo.models.source.api.match import Match
 from pycricinfo.utils import load_file_and_validate_to_model
 
+T = TypeVar("T")
+
 
 def print_scorecard(
     file_path: str = None,
@@ -54,10 +58,15 @@ def _print_scorecard_from_file(
 def _print_scorecard_from_match_id(
     series_id: int, match_id: int, include_batting_minutes: bool = True, include_bowling_dots: bool = False
 ):
-    model = asyncio.run(get_match(series_id, match_id))
+    model = asyncio.run(_run_with_shared_session(get_match(series_id, match_id)))
     _print_scorecard_from_match(model, include_batting_minutes, include_bowling_dots)
 
 
+async def _run_with_shared_session(coroutine: Awaitable[T]) -> T:
+    async with shared_session_lifespan():
+        return await coroutine
+
+
 def _print_scorecard_from_match(match: Match, include_batting_minutes: bool = True, include_bowling_dots: bool = False):
     try:
         sc = CricinfoScorecard(match=match)
@@ -123,7 +132,7 @@ def _print_ball_by_ball_from_file(file_path: str):
 
 
 def _print_ball_by_ball_from_match_id(match_id: int, innings: int, page: int):
-    model = asyncio.run(get_play_by_play(match_id, innings, page))
+    model = asyncio.run(_run_with_shared_session(get_play_by_play(match_id, innings, page)))
     _print_ball_by_ball_from_commentary_model(model)
 
 
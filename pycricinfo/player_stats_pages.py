@@ -1,13 +1,18 @@
 import asyncio
+import logging
 import re
-from typing import Optional, Type
+from typing import AsyncIterator, Iterable, Optional, Type
 
 import aiohttp
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 from pydantic import BaseModel
 
-from pycricinfo.api_helper import create_session, get_request
+from pycricinfo.api_helper import get_request
+from pycricinfo.cache import ResponseCache
 from pycricinfo.config import BaseRoute, get_settings
+from pycricinfo.exceptions import CricinfoAPIException
+from pycricinfo.executor import run_parser
+from pycricinfo.html_parsing import parse_html
 from pycricinfo.models.source.pages.player import (
     Career,
     CareerBattingRow,
@@ -15,10 +20,32 @@ from pycricinfo.models.source.pages.player import (
     CareerFieldingRow,
     CareerStatsBaseModel,
 )
+from pycricinfo.rate_limit import RateLimiter
 from pycricinfo.types.match_types import MatchTypeNames
 
 _INTERNATIONAL_MATCH_TYPES = frozenset({MatchTypeNames.TESTS, MatchTypeNames.ODIs, MatchTypeNames.T20Is})
 
+logger = logging.getLogger("cricinfo")
+
+
+class _StatsPageStrainer(SoupStrainer):
+    """
+    Only builds the parts of a Statsguru page which are read: its tables, which include the captioned Career summary
+    and Career averages tables, and the statsTab list of formats.
+    """
+
+    def allow_tag_creation(self, nsprefix: Optional[str], name: str, attrs: Optional[dict[str, str]]) -> bool:
+        return name == "table" or (name == "ul" and bool(attrs) and attrs.get("id") == "statsTab")
+
+
+class PlayerCareerResult(BaseModel):
+    """The outcome of fetching one player's career as part of a batch: either their career, or why it failed."""
+
+    player_id: int
+    career: Optional[Career] = None
+    error: Optional[str] = None
+    status_code: Optional[int] = None
+
 
 class CareerAveragesRow(BaseModel):
     """Parsed overall row from the Career averages table."""
@@ -30,6 +57,8 @@ class CareerAveragesRow(BaseModel):
 async def get_player_career(
     player_id: int,
     session: Optional[aiohttp.ClientSession] = None,
+    cache: Optional[ResponseCache] = None,
+    rate_limiter: Optional[RateLimiter] = None,
 ) -> Career:
     """
     Fetch and parse a player's international career stats from the Statsguru pages.
@@ -42,36 +71,119 @@ async def get_player_career(
     player_id : int
         Cricinfo player ID.
     session : aiohttp.ClientSession, optional
-        An existing session to reuse. If None, one is created and closed after the request.
+        An existing session to reuse. If None, the process-wide pooled session is used.
+    cache : ResponseCache, optional
+        The response cache to use. If None, the process-wide cache is used.
+    rate_limiter : RateLimiter, optional
+        The rate limiter to pace the requests with. If None, the process-wide rate limiter is used.
 
     Returns
     -------
     Career
         Structured career stats from the three international match types.
     """
-    owned_session = session is None
-    if owned_session:
-        session = create_session()
+    # TODO: This only works for male players, there's no collective "all international formats" page for women
+    batting_html, bowling_html, fielding_html = await asyncio.gather(
+        _fetch_stats_page(player_id, "batting", session, cache, rate_limiter),
+        _fetch_stats_page(player_id, "bowling", session, cache, rate_limiter),
+        _fetch_stats_page(player_id, "fielding", session, cache, rate_limiter),
+    )
+
+    batting_rows, bowling_rows, fielding_rows = await asyncio.gather(
+        run_parser(_parse_career_summary_rows, batting_html, CareerBattingRow),
+        run_parser(_parse_career_summary_rows, bowling_html, CareerBowlingRow),
+        run_parser(_parse_career_summary_rows, fielding_html, CareerFieldingRow),
+    )
+
+    return Career(batting=batting_rows, bowling=bowling_rows, fielding=fielding_rows)
+
+
+async def get_player_careers(
+    player_ids: Iterable[int],
+    session: Optional[aiohttp.ClientSession] = None,
+    concurrency: Optional[int] = None,
+    cache: Optional[ResponseCache] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> AsyncIterator[PlayerCareerResult]:
+    """
+    Fetch and parse the international career stats of many players, yielding each player's result as soon as it
+    is complete, rather than in the order of ``player_ids``.
+
+    Every request shares one session and is paced by the Statsguru rate limit. No more than ``concurrency`` players
+    are fetched at once, and player IDs are only read from ``player_ids`` as they are needed, so it can be a lazy
+    iterable. Fetching pauses while ``concurrency`` results are waiting to be read. A failure for one player is
+    reported in their result rather than stopping the batch.
 
+    Parameters
+    ----------
+    player_ids : Iterable[int]
+        Cricinfo player IDs.
+    session : aiohttp.ClientSession, optional
+        An existing session to reuse. If None, the process-wide pooled session is used.
+    concurrency : Optional[int], optional
+        The maximum number of players to fetch at once, by default the player_career_concurrency setting
+    cache : ResponseCache, optional
+        The response cache to use. If None, the process-wide cache is used.
+    rate_limiter : RateLimiter, optional
+        The rate limiter to pace the requests with. If None, the process-wide rate limiter is used.
+
+    Yields
+    ------
+    PlayerCareerResult
+        The career, or the error, for each player
+    """
+    concurrency = max(concurrency or get_settings().player_career_concurrency, 1)
+    remaining_player_ids = iter(player_ids)
+    results: asyncio.Queue[Optional[PlayerCareerResult]] = asyncio.Queue(maxsize=concurrency)
+
+    async def worker() -> None:
+        try:
+            for player_id in remaining_player_ids:
+                await results.put(await _get_player_career_result(player_id, session, cache, rate_limiter))
+        finally:
+            # Once cancelled nothing reads the queue, so waiting for room in it would never finish
+            if not asyncio.current_task().cancelling():
+                await results.put(None)
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
     try:
-        # TODO: This only works for male players, there's no collective "all international formats" page for women
-        batting_html, bowling_html, fielding_html = await asyncio.gather(
-            _fetch_stats_page(player_id, "batting", session),
-            _fetch_stats_page(player_id, "bowling", session),
-            _fetch_stats_page(player_id, "fielding", session),
-        )
+        running = len(workers)
+        while running:
+            result = await results.get()
+            if result is None:
+                running -= 1
+            else:
+                yield result
     finally:
-        if owned_session:
-            await session.close()
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
 
-    batting_rows = _parse_career_summary_rows(str(batting_html), CareerBattingRow)
-    bowling_rows = _parse_career_summary_rows(str(bowling_html), CareerBowlingRow)
-    fielding_rows = _parse_career_summary_rows(str(fielding_html), CareerFieldingRow)
 
-    return Career(batting=batting_rows, bowling=bowling_rows, fielding=fielding_rows)
+async def _get_player_career_result(
+    player_id: int,
+    session: Optional[aiohttp.ClientSession],
+    cache: Optional[ResponseCache],
+    rate_limiter: Optional[RateLimiter],
+) -> PlayerCareerResult:
+    try:
+        career = await get_player_career(player_id, session=session, cache=cache, rate_limiter=rate_limiter)
+    except CricinfoAPIException as ex:
+        logger.warning(f"Failed to get career for player {player_id}: {ex}")
+        return PlayerCareerResult(player_id=player_id, error=str(ex), status_code=ex.status_code)
+    except Exception as ex:
+        logger.warning(f"Failed to get career for player {player_id}: {ex!r}")
+        return PlayerCareerResult(player_id=player_id, error=repr(ex))
+    return PlayerCareerResult(player_id=player_id, career=career)
 
 
-async def _fetch_stats_page(player_id: int, stat_type: str, session: aiohttp.ClientSession) -> str:
+async def _fetch_stats_page(
+    player_id: int,
+    stat_type: str,
+    session: Optional[aiohttp.ClientSession],
+    cache: Optional[ResponseCache] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> str:
     """
     Fetch a single Statsguru player page.
 
@@ -81,8 +193,12 @@ async def _fetch_stats_page(player_id: int, stat_type: str, session: aiohttp.Cli
         Cricinfo player ID.
     stat_type : str
         One of the supported player stat page types: batting, bowling, or fielding.
-    session : aiohttp.ClientSession
-        Open HTTP session used for the request.
+    session : aiohttp.ClientSession, optional
+        Open HTTP session used for the request. If None, the process-wide pooled session is used.
+    cache : ResponseCache, optional
+        The response cache to use. If None, the process-wide cache is used.
+    rate_limiter : RateLimiter, optional
+        The rate limiter to pace the request with. If None, the process-wide rate limiter is used.
 
     Returns
     -------
@@ -95,21 +211,43 @@ async def _fetch_stats_page(player_id: int, stat_type: str, session: aiohttp.Cli
         base_route=BaseRoute.stats,
         response_output_sub_folder="player_stats",
         session=session,
+        cache=cache,
+        rate_limiter=rate_limiter,
     )
 
 
-def _parse_career_summary_rows(html: str, row_model: Type[CareerStatsBaseModel]) -> list[CareerStatsBaseModel]:
+def _parse_stats_page(html: str) -> BeautifulSoup:
+    """
+    Parse a Statsguru page once, keeping only the elements which the extractors read.
+
+    Parameters
+    ----------
+    html : str
+        HTML content for the player stats page.
+
+    Returns
+    -------
+    BeautifulSoup
+        The parsed tables and statsTab list of the page.
+    """
+    return parse_html(html, parse_only=_StatsPageStrainer())
+
+
+def _parse_career_summary_rows(
+    html: str | BeautifulSoup, row_model: Type[CareerStatsBaseModel]
+) -> list[CareerStatsBaseModel]:
     """
     Parse career rows from a Statsguru page into a typed list of models.
 
     The parser first tries the grouped Career summary table. If the page only exposes
     a single international format, it falls back to the overall row in Career averages
-    and uses the single statsTab entry to determine the format.
+    and uses the single statsTab entry to determine the format. The page is only parsed
+    once, and shared between each of these.
 
     Parameters
     ----------
-    html : str
-        HTML content for the relevant Statsguru player stats page.
+    html : str | BeautifulSoup
+        HTML content for the relevant Statsguru player stats page, or the already parsed page.
     row_model : Type[CareerStatsBaseModel]
         Model class to instantiate for each row.
 
@@ -118,8 +256,10 @@ def _parse_career_summary_rows(html: str, row_model: Type[CareerStatsBaseModel])
     list[CareerStatsBaseModel]
         Parsed career rows for one or more international formats.
     """
+    soup = html if isinstance(html, BeautifulSoup) else _parse_stats_page(html)
+
     try:
-        rows = _extract_career_summary_rows(html)
+        rows = _extract_career_summary_rows(soup)
     except Exception:
         rows = []
     result: list[CareerStatsBaseModel] = []
@@ -139,8 +279,8 @@ def _parse_career_summary_rows(html: str, row_model: Type[CareerStatsBaseModel])
     if result:
         return result
 
-    fallback_row = _extract_overall_career_averages_row(html)
-    fallback_format = _extract_single_format_from_stats_tab(html)
+    fallback_row = _extract_overall_career_averages_row(soup)
+    fallback_format = _extract_single_format_from_stats_tab(soup)
     if not fallback_row or fallback_format is None:
         return result
 
@@ -153,22 +293,20 @@ def _parse_career_summary_rows(html: str, row_model: Type[CareerStatsBaseModel])
     return result
 
 
-def _extract_overall_career_averages_row(html: str) -> Optional[CareerAveragesRow]:
+def _extract_overall_career_averages_row(soup: BeautifulSoup) -> Optional[CareerAveragesRow]:
     """
     Extract the overall row from the Career averages table.
 
     Parameters
     ----------
-    html : str
-        HTML content for the player stats page.
+    soup : BeautifulSoup
+        The parsed player stats page.
 
     Returns
     -------
     Optional[CareerAveragesRow]
         The overall row cells and table headers, or None if not present.
     """
-    soup = BeautifulSoup(html, "html.parser")
-
     caption = soup.find("caption", string=re.compile(r"^Career averages$", re.IGNORECASE))
     if not caption:
         return None
@@ -205,14 +343,14 @@ def _extract_overall_career_averages_row(html: str) -> Optional[CareerAveragesRo
     return None
 
 
-def _extract_single_format_from_stats_tab(html: str) -> Optional[MatchTypeNames]:
+def _extract_single_format_from_stats_tab(soup: BeautifulSoup) -> Optional[MatchTypeNames]:
     """
     Extract the single international format label from the statsTab navigation.
 
     Parameters
     ----------
-    html : str
-        HTML content for the player stats page.
+    soup : BeautifulSoup
+        The parsed player stats page.
 
     Returns
     -------
@@ -220,8 +358,6 @@ def _extract_single_format_from_stats_tab(html: str) -> Optional[MatchTypeNames]
         The mapped international match type if exactly one valid format is present,
         otherwise None.
     """
-    soup = BeautifulSoup(html, "html.parser")
-
     stats_tab = soup.find("ul", id="statsTab")
     if stats_tab is None:
         return None
@@ -268,7 +404,7 @@ def _to_international_match_type(format_name: str) -> Optional[MatchTypeNames]:
     return parsed
 
 
-def _extract_career_summary_rows(html: str) -> list[tuple[str, list[str], list[str]]]:
+def _extract_career_summary_rows(soup: BeautifulSoup) -> list[tuple[str, list[str], list[str]]]:
     """
     Find the Career summary table in an HTML stats page and return rows for the
     supported international formats.
@@ -278,16 +414,14 @@ def _extract_career_summary_rows(html: str) -> list[tuple[str, list[str], list[s
 
     Parameters
     ----------
-    html : str
-        HTML content for the player stats page.
+    soup : BeautifulSoup
+        The parsed player stats page.
 
     Returns
     -------
     list[tuple[str, list[str], list[str]]]
         Grouped career summary rows, filtered to the supported international formats.
     """
-    soup = BeautifulSoup(html, "html.parser")
-
     caption = soup.find("caption", string=re.compile(r"^Career summary$", re.IGNORECASE))
     if not caption:
         return []
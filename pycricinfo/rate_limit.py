@@ -0,0 +1,129 @@
+import asyncio
+import time
+from typing import Optional
+
+from pycricinfo.config import BaseRoute, RateLimit, get_settings
+
+_rate_limiter: Optional["RateLimiter"] = None
+
+
+class TokenBucket:
+    """
+    A token bucket which allows bursts of up to ``burst`` requests, refilling at ``rate`` tokens per second.
+
+    Callers reserve a token up front and are told how long to wait for it, so requests beyond the burst queue up
+    in the order they arrived rather than all retrying at once. A rate of 0 or less means the bucket is unlimited.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+
+    def reserve(self) -> float:
+        """
+        Take a token from the bucket, even if that leaves it in debt.
+
+        Returns
+        -------
+        float
+            The number of seconds to wait before the reserved token is available
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self.rate
+
+    async def acquire(self) -> float:
+        """
+        Wait until a token is available.
+
+        Returns
+        -------
+        float
+            The number of seconds spent waiting
+        """
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+class RateLimiter:
+    """
+    Rate limits requests per ``BaseRoute``, with a separate token bucket for each.
+    """
+
+    def __init__(self, limits: dict[BaseRoute, RateLimit]):
+        self._buckets = {base_route: TokenBucket(limit.rate, limit.burst) for base_route, limit in limits.items()}
+
+    async def acquire(self, base_route: BaseRoute) -> float:
+        """
+        Wait until a request can be made to the supplied base route.
+
+        Parameters
+        ----------
+        base_route : BaseRoute
+            The base route the request will be made against
+
+        Returns
+        -------
+        float
+            The number of seconds spent waiting
+        """
+        bucket = self._buckets.get(base_route)
+        if bucket is None:
+            return 0.0
+        return await bucket.acquire()
+
+
+def create_rate_limiter() -> RateLimiter:
+    """
+    Create a rate limiter configured from settings.
+
+    Returns
+    -------
+    RateLimiter
+        A new rate limiter
+    """
+    rate_limits = get_settings().rate_limits
+    return RateLimiter({base_route: getattr(rate_limits, base_route.name) for base_route in BaseRoute})
+
+
+def get_rate_limiter() -> RateLimiter:
+    """
+    Get the process-wide rate limiter: the one installed with ``set_rate_limiter``, or otherwise one created from
+    settings on first use.
+
+    Returns
+    -------
+    RateLimiter
+        The shared rate limiter
+    """
+    global _rate_limiter
+
+    if _rate_limiter is None:
+        _rate_limiter = create_rate_limiter()
+    return _rate_limiter
+
+
+def set_rate_limiter(rate_limiter: Optional[RateLimiter]) -> None:
+    """
+    Install a rate limiter as the process-wide default, used by every request which isn't given one.
+
+    Parameters
+    ----------
+    rate_limiter : Optional[RateLimiter]
+        The rate limiter to install, or None to create a new one from settings on next use
+    """
+    global _rate_limiter
+
+    _rate_limiter = rate_limiter
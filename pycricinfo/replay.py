@@ -0,0 +1,110 @@
+import asyncio
+import hashlib
+from datetime import UTC, datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from pydantic import BaseModel
+
+from pycricinfo.config import get_settings
+from pycricinfo.utils import write_file_atomically
+
+
+class ReplayIndexEntry(BaseModel):
+    """The entry in the replay index for a route: which recorded object holds its response, and when it was recorded."""
+
+    key: str
+    object_hash: str
+    recorded_at: datetime
+
+
+class ReplayArchive:
+    """
+    An archive of upstream responses which ``get_request`` can be served from instead of the network.
+
+    Responses are stored by the SHA-256 hash of their content under ``objects``, so a response which is recorded
+    many times, such as an unchanged page being polled, is only stored once. The ``index`` maps the cache key of each
+    route to the object holding its most recently recorded response.
+    """
+
+    def __init__(self, folder: str | Path):
+        self.folder = Path(folder)
+
+    async def record(self, key: str, content: bytes | str) -> None:
+        """
+        Record the response for a route, replacing any earlier recording.
+
+        Parameters
+        ----------
+        key : str
+            The cache key of the route, from ``get_cache_key``
+        content : bytes | str
+            The raw response body
+        """
+        await asyncio.to_thread(self._record, key, content)
+
+    async def load(self, key: str, as_text: bool = False) -> Optional[bytes | str]:
+        """
+        Load the recorded response for a route.
+
+        Parameters
+        ----------
+        key : str
+            The cache key of the route, from ``get_cache_key``
+        as_text : bool, optional
+            Whether to decode the response to text, as for HTML pages, by default False
+
+        Returns
+        -------
+        Optional[bytes | str]
+            The recorded response body, or None if the route has not been recorded
+        """
+        content = await asyncio.to_thread(self._load, key)
+        if content is None or not as_text:
+            return content
+        return content.decode()
+
+    def _record(self, key: str, content: bytes | str) -> None:
+        if isinstance(content, str):
+            content = content.encode()
+
+        object_hash = hashlib.sha256(content).hexdigest()
+        object_path = self._object_path(object_hash)
+        if not object_path.exists():
+            try:
+                write_file_atomically(object_path, [content])
+            except OSError:
+                # Objects are named by their content, so if another writer of the same content won, it's as good
+                if not object_path.exists():
+                    raise
+
+        entry = ReplayIndexEntry(key=key, object_hash=object_hash, recorded_at=datetime.now(UTC))
+        write_file_atomically(self._index_path(key), [entry.model_dump_json().encode()])
+
+    def _load(self, key: str) -> Optional[bytes]:
+        try:
+            entry = ReplayIndexEntry.model_validate_json(self._index_path(key).read_bytes())
+            return self._object_path(entry.object_hash).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _index_path(self, key: str) -> Path:
+        key_hash = hashlib.sha256(key.encode()).hexdigest()
+        return self.folder / "index" / key_hash[:2] / f"{key_hash}.json"
+
+    def _object_path(self, object_hash: str) -> Path:
+        return self.folder / "objects" / object_hash[:2] / object_hash
+
+
+@lru_cache
+def get_replay_archive() -> ReplayArchive:
+    """
+    Get the process-wide replay archive, in the replay_folder setting.
+
+    Returns
+    -------
+    ReplayArchive
+        The shared replay archive
+    """
+    return ReplayArchive(get_settings().replay_folder)
@@ -0,0 +1,114 @@
+import random
+import time
+from typing import Optional
+
+from pycricinfo.config import RetrySettings, get_settings
+from pycricinfo.exceptions import CircuitBreakerOpenException
+
+_circuit_breakers: dict[str, "CircuitBreaker"] = {}
+
+
+class CircuitBreaker:
+    """
+    Tracks consecutive failures of requests to a single host. Once ``failure_threshold`` is reached the circuit
+    opens, and requests fail fast until ``reset_timeout`` seconds have passed. A single trial request is then let
+    through: if it succeeds the circuit closes, otherwise it opens again.
+    """
+
+    def __init__(self, host: str, failure_threshold: int, reset_timeout: float):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_started_at: Optional[float] = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def check(self, route: str) -> None:
+        """
+        Check whether a request may be made to the host.
+
+        Parameters
+        ----------
+        route : str
+            The route about to be requested, to include in any exception
+
+        Raises
+        ------
+        CircuitBreakerOpenException
+            If the circuit is open, and it is not yet time for a trial request
+        """
+        if self._opened_at is None:
+            return
+
+        now = time.monotonic()
+        trial_in_progress = self._trial_started_at is not None and now - self._trial_started_at < self.reset_timeout
+        if now - self._opened_at < self.reset_timeout or trial_in_progress:
+            raise CircuitBreakerOpenException(route=route, host=self.host)
+
+        self._trial_started_at = now
+
+    def record_success(self) -> None:
+        """Record a successful request, closing the circuit."""
+        self.failures = 0
+        self._opened_at = None
+        self._trial_started_at = None
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit if the failure threshold has been reached."""
+        self.failures += 1
+        self._trial_started_at = None
+        if self.failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+
+
+def get_circuit_breaker(host: str) -> CircuitBreaker:
+    """
+    Get the circuit breaker for a host, creating it from settings on first use.
+
+    Parameters
+    ----------
+    host : str
+        The upstream host
+
+    Returns
+    -------
+    CircuitBreaker
+        The circuit breaker shared by all requests to the host
+    """
+    breaker = _circuit_breakers.get(host)
+    if breaker is None:
+        settings = get_settings().circuit_breaker
+        breaker = CircuitBreaker(host, settings.failure_threshold, settings.reset_timeout)
+        _circuit_breakers[host] = breaker
+    return breaker
+
+
+def get_retry_delay(attempt: int, retry_settings: RetrySettings, retry_after: Optional[str] = None) -> float:
+    """
+    Calculate how long to wait before retrying, using exponential backoff with full jitter.
+
+    Parameters
+    ----------
+    attempt : int
+        The number of the attempt which failed, starting from 1
+    retry_settings : RetrySettings
+        The backoff settings
+    retry_after : Optional[str], optional
+        The value of a Retry-After header on the failed response, which is honoured if it is a number of seconds,
+        by default None
+
+    Returns
+    -------
+    float
+        The number of seconds to wait
+    """
+    delay = random.uniform(0, min(retry_settings.backoff_max, retry_settings.backoff_base * 2 ** (attempt - 1)))
+
+    if retry_after and retry_after.strip().isdigit():
+        delay = max(delay, min(float(retry_after), retry_settings.backoff_max))
+
+    return delay
@@ -0,0 +1,276 @@
+import asyncio
+import logging
+import re
+import time
+from datetime import UTC, datetime, timedelta
+from enum import Enum, auto
+from typing import AsyncIterator, Iterable, Optional
+
+import aiohttp
+
+from pycricinfo.call_cricinfo_api import get_match
+from pycricinfo.config import PollScheduleSettings, get_settings
+from pycricinfo.exceptions import CricinfoAPIException
+from pycricinfo.live import LivePoller, is_innings_finished
+from pycricinfo.models.source.api.commentary import CommentaryDelivery
+from pycricinfo.models.source.api.match import Match
+
+logger = logging.getLogger("cricinfo")
+
+# Words in a match's status which show that play has stopped, for the day or for a break
+CLOSE_OF_PLAY_PATTERN = re.compile(r"\b(stumps|close of play|end of day)\b")
+BREAK_PATTERN = re.compile(
+    r"\b(lunch|tea|dinner|drinks|innings break|rain|bad light|wet outfield|delayed|interrupted|stopped|break)\b"
+)
+
+
+class MatchPollState(Enum):
+    NOT_STARTED = auto()
+    LIVE = auto()
+    BREAK = auto()
+    CLOSE_OF_PLAY = auto()
+    FINISHED = auto()
+
+
+def get_match_poll_state(
+    match: Match,
+    latest_delivery: Optional[CommentaryDelivery] = None,
+    now: Optional[datetime] = None,
+    settings: Optional[PollScheduleSettings] = None,
+) -> MatchPollState:
+    """
+    Work out what state a match is in, to decide how often to poll it.
+
+    The status of the match summary is used first: whether it has finished or is yet to start, and whether its
+    summary describes a break or close of play. If it is in progress, the latest delivery is checked too. If its
+    innings has been completed, or it was bowled on an earlier day of the match than today, or in an earlier session
+    of today's play than the one now due, play is not underway.
+
+    Parameters
+    ----------
+    match : Match
+        The match summary
+    latest_delivery : Optional[CommentaryDelivery], optional
+        The most recent delivery of the match, if any has been bowled, by default None
+    now : Optional[datetime], optional
+        The current time, by default the actual current time
+    settings : Optional[PollScheduleSettings], optional
+        The settings with the times each session is due to start, by default those from ``get_settings()``
+
+    Returns
+    -------
+    MatchPollState
+        The state of the match
+    """
+    now = now or datetime.now(UTC)
+    competition = match.header.competition
+    status_type = competition.status.type
+    state = status_type.state if status_type else None
+
+    if state == "post" or match.is_complete:
+        return MatchPollState.FINISHED
+    if state == "pre" or now < _as_utc(competition.date):
+        return MatchPollState.NOT_STARTED
+
+    status_text = " ".join(
+        text.lower()
+        for text in (
+            competition.status.summary,
+            status_type and status_type.description,
+            status_type and status_type.detail,
+        )
+        if text
+    )
+    if CLOSE_OF_PLAY_PATTERN.search(status_text):
+        return MatchPollState.CLOSE_OF_PLAY
+    if BREAK_PATTERN.search(status_text):
+        return MatchPollState.BREAK
+
+    if latest_delivery is not None:
+        if is_innings_finished(latest_delivery):
+            return MatchPollState.BREAK
+
+        innings = latest_delivery.current_innings_score
+        started_at = _as_utc(competition.date)
+        match_day = (now - started_at).days + 1
+        if innings.day and innings.day < match_day:
+            return MatchPollState.BREAK
+
+        # A session has started since the latest delivery, with no balls bowled in it yet, so play hasn't resumed
+        if innings.day == match_day and innings.session and _is_multi_day(match):
+            session_starts = (settings or get_settings().poll_schedule).session_starts
+            into_day = (now - started_at - timedelta(days=match_day - 1)).total_seconds()
+            due_session = sum(1 for session_start in session_starts if session_start <= into_day)
+            if innings.session < due_session:
+                return MatchPollState.BREAK
+
+    return MatchPollState.LIVE
+
+
+def _is_multi_day(match: Match) -> bool:
+    competition = match.header.competition
+    return competition.end_date is not None and competition.end_date.date() > competition.date.date()
+
+
+class PollScheduler:
+    """
+    Follows live matches, polling each one at an interval chosen from the state it is in, so that the upstream
+    request budget is spent on the matches where deliveries are actually being bowled.
+
+    Commentary is only polled while overs are being bowled. During breaks and close of play, only the match summary
+    is checked, less often, to see when play resumes. Matches which are yet to start are not polled until they are
+    due to start, and finished matches are not polled at all.
+    """
+
+    def __init__(
+        self, settings: Optional[PollScheduleSettings] = None, session: Optional[aiohttp.ClientSession] = None
+    ):
+        self.settings = settings or get_settings().poll_schedule
+        self.session = session
+
+    def get_interval(self, state: MatchPollState, match: Match, now: Optional[datetime] = None) -> Optional[float]:
+        """
+        Get how long to wait before polling a match again.
+
+        Parameters
+        ----------
+        state : MatchPollState
+            The state of the match
+        match : Match
+            The match summary
+        now : Optional[datetime], optional
+            The current time, by default the actual current time
+
+        Returns
+        -------
+        Optional[float]
+            The number of seconds to wait, or None if the match should not be polled again
+        """
+        if state == MatchPollState.FINISHED:
+            return None
+        if state == MatchPollState.LIVE:
+            return self.settings.live
+        if state == MatchPollState.BREAK:
+            return self.settings.break_interval
+        if state == MatchPollState.CLOSE_OF_PLAY:
+            return self.settings.close_of_play
+
+        # Not started yet: wait until it's due to start, or poll as if in a break if it's late starting
+        now = now or datetime.now(UTC)
+        until_start = (_as_utc(match.header.competition.date) - now).total_seconds()
+        if until_start <= 0:
+            return self.settings.break_interval
+        return max(min(until_start, self.settings.not_started_max), self.settings.live)
+
+    async def follow(self, series_id: int, match_id: int) -> AsyncIterator[CommentaryDelivery]:
+        """
+        Follow a match until it finishes, yielding each new delivery. A failed poll, whether from an error response
+        or a connection error or timeout which outlasted the retries, is logged, and the next poll is scheduled as
+        usual.
+
+        Parameters
+        ----------
+        series_id : int
+            The ID of the series to which the match belongs.
+        match_id : int
+            The ID of the match to follow.
+
+        Yields
+        ------
+        CommentaryDelivery
+            Each new delivery, in order
+        """
+        poller = LivePoller(match_id, session=self.session)
+        latest_delivery: Optional[CommentaryDelivery] = None
+        match: Optional[Match] = None
+        state = status_state = None
+        status_checked_at = last_delivery_at = 0.0
+
+        while True:
+            try:
+                if (
+                    match is None
+                    or state != MatchPollState.LIVE
+                    or self._elapsed(status_checked_at) >= self.settings.status_interval
+                ):
+                    match = await get_match(series_id, match_id, session=self.session)
+                    status_checked_at = time.monotonic()
+
+                # The match summary decides whether play may be underway, in which case commentary is polled, even
+                # if the latest delivery suggests otherwise, so that the resumption of play is noticed
+                previous_status_state, status_state = status_state, get_match_poll_state(match, settings=self.settings)
+                if status_state == MatchPollState.LIVE and previous_status_state != MatchPollState.LIVE:
+                    last_delivery_at = time.monotonic()
+
+                # Poll commentary while play is underway, and one last time when the match finishes
+                if status_state == MatchPollState.LIVE or (
+                    status_state == MatchPollState.FINISHED and poller.position is not None
+                ):
+                    deliveries = await poller.poll()
+                    if deliveries:
+                        latest_delivery = deliveries[-1]
+                        last_delivery_at = time.monotonic()
+                    for delivery in deliveries:
+                        yield delivery
+
+                state = get_match_poll_state(match, latest_delivery, settings=self.settings)
+                if state == MatchPollState.LIVE and self._elapsed(last_delivery_at) >= self.settings.stall_after:
+                    state = MatchPollState.BREAK
+            except (CricinfoAPIException, aiohttp.ClientError, asyncio.TimeoutError) as ex:
+                logger.warning(f"Polling match {match_id} failed: {ex!r}")
+                if state is None:
+                    await asyncio.sleep(self.settings.break_interval)
+                    continue
+
+            interval = self.get_interval(state, match)
+            if interval is None:
+                return
+            logger.debug("Polling match %s again in %ss, as it is %s", match_id, interval, state.name)
+            await asyncio.sleep(interval)
+
+    async def follow_many(self, matches: Iterable[tuple[int, int]]) -> AsyncIterator[tuple[int, CommentaryDelivery]]:
+        """
+        Follow many matches at once, each on its own schedule, yielding new deliveries from any of them as they
+        arrive, until they have all finished.
+
+        Parameters
+        ----------
+        matches : Iterable[tuple[int, int]]
+            The series ID and match ID of each match to follow
+
+        Yields
+        ------
+        tuple[int, CommentaryDelivery]
+            The match ID and each new delivery
+        """
+        queue: asyncio.Queue[Optional[tuple[int, CommentaryDelivery]]] = asyncio.Queue()
+
+        async def follow_match(series_id: int, match_id: int) -> None:
+            try:
+                async for delivery in self.follow(series_id, match_id):
+                    await queue.put((match_id, delivery))
+            except Exception as ex:
+                logger.error(f"Following match {match_id} stopped: {ex}")
+            finally:
+                await queue.put(None)
+
+        tasks = [asyncio.create_task(follow_match(series_id, match_id)) for series_id, match_id in matches]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                item = await queue.get()
+                if item is None:
+                    remaining -= 1
+                else:
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    def _elapsed(since: float) -> float:
+        return time.monotonic() - since
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
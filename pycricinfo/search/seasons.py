@@ -2,17 +2,25 @@ import re
 from typing import Optional
 from urllib.parse import quote
 
-from bs4 import BeautifulSoup
+import aiohttp
 from bs4._typing import _OneElement, _QueryResults
 
 from pycricinfo.api_helper import get_request
+from pycricinfo.cache import ResponseCache
 from pycricinfo.config import BaseRoute, get_settings
+from pycricinfo.executor import run_parser
+from pycricinfo.html_parsing import parse_html
 from pycricinfo.models.source.pages.series import MatchSeries, MatchTypeWithSeries
+from pycricinfo.rate_limit import RateLimiter
 from pycricinfo.types.match_types import MatchTypeNames
 
 
 async def get_match_types_in_season(
-    season_name: str | int, type_filter: Optional[MatchTypeNames] = None
+    season_name: str | int,
+    type_filter: Optional[MatchTypeNames] = None,
+    session: Optional[aiohttp.ClientSession] = None,
+    cache: Optional[ResponseCache] = None,
+    rate_limiter: Optional[RateLimiter] = None,
 ) -> list[MatchTypeWithSeries]:
     """
     Get the Cricinfo web page which lists all series in a given season, and parse out their details.
@@ -21,6 +29,14 @@ async def get_match_types_in_season(
     ----------
     season_name : str | int
         The name of the season to get matches for, e.g. "2024" or "2020/21"
+    type_filter : Optional[MatchTypeNames], optional
+        Only return the match type with this name, by default None
+    session : aiohttp.ClientSession, optional
+        An existing session to use for the request, by default None
+    cache : ResponseCache, optional
+        The response cache to use, by default the process-wide one
+    rate_limiter : RateLimiter, optional
+        The rate limiter to pace upstream requests with, by default the process-wide one
 
     Returns
     -------
@@ -32,9 +48,12 @@ async def get_match_types_in_season(
         params={"season_name": quote(str(season_name), safe="")},
         base_route=BaseRoute.page,
         response_output_sub_folder="seasons",
+        session=session,
+        cache=cache,
+        rate_limiter=rate_limiter,
     )
 
-    match_types = parse_season_html(content)
+    match_types = await run_parser(parse_season_html, content)
 
     if type_filter:
         match_types = [m for m in match_types if m.name.lower() == type_filter.value.lower()]
@@ -58,7 +77,7 @@ def parse_season_html(content: str) -> list[MatchTypeWithSeries]:
     """
     content = re.sub(r"^b\'|\'$", "", content)
 
-    soup = BeautifulSoup(content, "html.parser")
+    soup = parse_html(content)
 
     section_heads = soup.find_all("div", class_="match-section-head")
 
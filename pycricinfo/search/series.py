@@ -1,10 +1,15 @@
 import re
+from typing import Optional
 
-from bs4 import BeautifulSoup
+import aiohttp
 
 from pycricinfo.api_helper import get_request
+from pycricinfo.cache import ResponseCache
 from pycricinfo.config import BaseRoute, get_settings
+from pycricinfo.executor import run_parser
+from pycricinfo.html_parsing import parse_html
 from pycricinfo.models.source.pages.series import MatchResult
+from pycricinfo.rate_limit import RateLimiter
 
 
 def _clean_text(text: str) -> str:
@@ -27,7 +32,12 @@ def _clean_text(text: str) -> str:
     return re.sub(r"\s+", " ", text).strip()
 
 
-async def get_match_results_in_series(series_id: int | str) -> list[MatchResult]:
+async def get_match_results_in_series(
+    series_id: int | str,
+    session: Optional[aiohttp.ClientSession] = None,
+    cache: Optional[ResponseCache] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> list[MatchResult]:
     """
     Extract match results from a series by fetching the series page and parsing the matches.
 
@@ -35,6 +45,12 @@ async def get_match_results_in_series(series_id: int | str) -> list[MatchResult]
     ----------
     series_id : int | str
         The ID of the series to extract match results from.
+    session : aiohttp.ClientSession, optional
+        An existing session to use for the request, by default None
+    cache : ResponseCache, optional
+        The response cache to use, by default the process-wide one
+    rate_limiter : RateLimiter, optional
+        The rate limiter to pace upstream requests with, by default the process-wide one
 
     Returns
     -------
@@ -46,9 +62,29 @@ async def get_match_results_in_series(series_id: int | str) -> list[MatchResult]
         params={"series_id": series_id},
         base_route=BaseRoute.page,
         response_output_sub_folder="series",
+        session=session,
+        cache=cache,
+        rate_limiter=rate_limiter,
     )
 
-    soup = BeautifulSoup(content, "html.parser")
+    return await run_parser(parse_series_html, content)
+
+
+def parse_series_html(content: str) -> list[MatchResult]:
+    """
+    Parse the content of the Cricinfo series page HTML to extract the results of its matches.
+
+    Parameters
+    ----------
+    content : str
+        The series page content.
+
+    Returns
+    -------
+    list[MatchResult]
+        A list of match results extracted from the series.
+    """
+    soup = parse_html(content)
     matches: list[MatchResult] = []
 
     match_blocks = soup.find_all("section", class_="default-match-block")
@@ -0,0 +1,65 @@
+import asyncio
+import weakref
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls which share a key, so that only one of them runs and every caller receives its result.
+
+    Calls are only shared while one is in flight: once it completes, the next call with the same key runs again.
+    If a caller is cancelled, the shared call carries on for any other callers waiting on it.
+    """
+
+    def __init__(self):
+        self._in_flight: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[Hashable, asyncio.Task]] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run a call, or join an identical call which is already in flight.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key identifying identical calls
+        func : Callable[[], Awaitable[T]]
+            A function returning the awaitable to run, which is only called if no call with this key is in flight
+
+        Returns
+        -------
+        T
+            The result of the shared call
+        """
+        in_flight = self._in_flight.setdefault(asyncio.get_running_loop(), {})
+
+        task = in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            in_flight[key] = task
+            task.add_done_callback(lambda t: self._on_done(in_flight, key, t))
+
+        return await asyncio.shield(task)
+
+    def in_flight_count(self) -> int:
+        """
+        Get the number of distinct calls currently in flight on the running event loop.
+
+        Returns
+        -------
+        int
+            The number of calls in flight
+        """
+        return len(self._in_flight.get(asyncio.get_running_loop(), {}))
+
+    @staticmethod
+    def _on_done(in_flight: dict[Hashable, asyncio.Task], key: Hashable, task: asyncio.Task) -> None:
+        if in_flight.get(key) is task:
+            del in_flight[key]
+
+        # Mark any exception as retrieved, in case every caller was cancelled before it was raised
+        if not task.cancelled():
+            task.exception()
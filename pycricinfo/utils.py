@@ -1,9 +1,12 @@
 import importlib.util
-import json
+import os
+import tempfile
 from importlib.metadata import metadata
-from typing import Any, Type, TypeVar
+from pathlib import Path
+from typing import Any, Iterable, Type, TypeVar
 
 from pydantic import BaseModel, ValidationError
+from pydantic_core import from_json
 
 T = TypeVar("T", bound=BaseModel)
 
@@ -33,6 +36,72 @@ def replace_empty_objects_with_null(data: Any) -> Any:
         return data
 
 
+def _null_out_empty_objects(data: Any) -> Any:
+    """
+    Equivalent to ``replace_empty_objects_with_null``, except that dictionaries and lists with nothing in them to
+    replace are returned as they are, rather than copied. The data passed in is never changed.
+    """
+    if isinstance(data, dict):
+        replaced = None
+        only_none = True
+        for key, value in data.items():
+            if value is None:
+                continue
+            only_none = False
+            if isinstance(value, (dict, list)):
+                new_value = _null_out_empty_objects(value)
+                if new_value is not value:
+                    if replaced is None:
+                        replaced = dict(data)
+                    replaced[key] = new_value
+        if only_none:
+            return None
+        return data if replaced is None else replaced
+    elif isinstance(data, list):
+        replaced = None
+        for index, item in enumerate(data):
+            if isinstance(item, (dict, list)):
+                new_item = _null_out_empty_objects(item)
+                if new_item is not item:
+                    if replaced is None:
+                        replaced = list(data)
+                    replaced[index] = new_item
+        return data if replaced is None else replaced
+    else:
+        return data
+
+
+def validate_json_to_model(json_content: bytes | str, type_to_parse: Type[T], null_out_empty_dicts: bool = True) -> T:
+    """
+    Validate raw JSON content against a Pydantic model, optionally replacing empty objects with null first.
+
+    Equivalent to decoding the JSON and calling ``load_dict_to_model``, but the JSON is decoded with pydantic's own
+    parser, and only the parts of the decoded data which contain empty objects are copied to replace them.
+
+    Parameters
+    ----------
+    json_content : bytes | str
+        The raw JSON to validate
+    type_to_parse : Type[T]
+        The Pydantic model to validate against
+    null_out_empty_dicts : bool, optional
+        Whether to replace any dictionaries that contain only None values with None, by default True
+
+    Returns
+    -------
+    T
+        An instance of the Pydantic model with the loaded data
+
+    Raises
+    ------
+    ValidationError
+        If the JSON is not valid for the model
+    """
+    if not null_out_empty_dicts:
+        return type_to_parse.model_validate_json(json_content)
+    return type_to_parse.model_validate(_null_out_empty_objects(from_json(json_content)))
+
+
 def load_file_and_validate_to_model(file_path: str, type_to_parse: Type[T]) -> T:
     """
     Load a JSON file from disk and validate its contents against a Pydantic model.
@@ -49,9 +118,34 @@ def load_file_and_validate_to_model(file_path: str, type_to_parse: Type[T]) -> T
     T
         An instance of the Pydantic model with the loaded data
     """
-    with open(file_path, "r") as content:
-        json_data = json.load(content)
-        return load_dict_to_model(json_data, type_to_parse)
+    with open(file_path, "rb") as content:
+        return load_json_to_model(content.read(), type_to_parse)
+
+
+def load_json_to_model(json_content: bytes | str, type_to_parse: Type[T]) -> T:
+    """
+    Validate raw JSON content against a Pydantic model, replacing empty objects with null, with
+    ``validate_json_to_model``.
+
+    Parameters
+    ----------
+    json_content : bytes | str
+        The raw JSON to validate
+    type_to_parse : Type[T]
+        The Pydantic model to validate against
+
+    Returns
+    -------
+    T
+        An instance of the Pydantic model with the loaded data
+    """
+    try:
+        model = validate_json_to_model(json_content, type_to_parse)
+    except ValidationError as ex:
+        print(ex)
+        exit(1)
+
+    return model
 
 
 def load_dict_to_model(json_data: dict, type_to_parse: Type[T]) -> T:
@@ -80,6 +174,31 @@ def load_dict_to_model(json_data: dict, type_to_parse: Type[T]) -> T:
     return model
 
 
+def write_file_atomically(path: Path, chunks: Iterable[bytes]) -> None:
+    """
+    Write a file through a temporary file in the same folder, then move it into place, so that readers only ever see
+    the whole of the old or new content. Each call has its own temporary file, so concurrent writers of the same path
+    don't collide: the last to finish wins.
+
+    Parameters
+    ----------
+    path : Path
+        The path of the file to write, whose folder is created if needed
+    chunks : Iterable[bytes]
+        The content to write, in order
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    file_descriptor, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "wb") as file:
+            for chunk in chunks:
+                file.write(chunk)
+        os.replace(temp_name, path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
 def get_field_from_pyproject(field_name: str) -> str:
     """
     Get a specific field from package metadata.
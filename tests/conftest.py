@@ -0,0 +1,24 @@
+from pathlib import Path
+
+import pytest
+
+from pycricinfo.models.source.api.commentary import APIResponseCommentary, CommentaryDelivery
+from pycricinfo.utils import load_file_and_validate_to_model
+
+TEST_FILES_FOLDER = Path(__file__).parent / "test_files"
+
+
+@pytest.fixture
+def load_test_file():
+    """Load a file from the test_files folder into a model, such as ``load_test_file("match/1426555.json", Match)``."""
+
+    def load(file_name: str, type_to_parse):
+        return load_file_and_validate_to_model(str(TEST_FILES_FOLDER / file_name), type_to_parse)
+
+    return load
+
+
+@pytest.fixture
+def deliveries(load_test_file) -> list[CommentaryDelivery]:
+    """The deliveries on a page of ball-by-ball commentary, loaded afresh for each test so that they can be changed."""
+    return load_test_file("ball_by_ball/1031439_1_1.json", APIResponseCommentary).commentary.deliveries
@@ -0,0 +1,82 @@
+import asyncio
+from pathlib import Path
+
+from fastapi import FastAPI
+
+from pycricinfo import api_helper
+from pycricinfo.api.dependencies import UpstreamClient
+from pycricinfo.api.endpoints import match
+from pycricinfo.api.endpoints.raw import venue
+from pycricinfo.api.server import lifespan
+from pycricinfo.cache import ResponseCache, get_cache_key, get_response_cache, set_response_cache
+from pycricinfo.config import BaseRoute, get_settings
+from pycricinfo.rate_limit import create_rate_limiter, get_rate_limiter
+
+
+def test_lifespan_owns_the_upstream_client(monkeypatch, tmp_path):
+    monkeypatch.setattr(get_settings(), "cache_folder", str(tmp_path))
+    app = FastAPI()
+
+    async def run():
+        async with lifespan(app):
+            upstream_client = app.state.upstream_client
+            assert upstream_client.session is api_helper.get_shared_session()
+            assert get_response_cache() is upstream_client.cache
+            assert get_rate_limiter() is upstream_client.rate_limiter
+        assert upstream_client.session.closed
+        assert get_response_cache() is not upstream_client.cache
+        assert get_rate_limiter() is not upstream_client.rate_limiter
+        set_response_cache(None)
+
+    asyncio.run(run())
+
+
+def test_endpoints_use_the_injected_cache(monkeypatch):
+    async def fail(*_, **__):
+        raise AssertionError("The response should have come from the injected cache")
+
+    monkeypatch.setattr(api_helper, "_fetch_response_body", fail)
+
+    async def run():
+        cache = ResponseCache(max_memory_bytes=1000)
+        route = api_helper._format_route(get_settings().routes.venue, {"venue_id": 1})
+        await cache.set(get_cache_key(route, BaseRoute.core), b'{"id": "1"}', ttl=60)
+
+        upstream_client = UpstreamClient(None, cache, create_rate_limiter())
+        assert await venue(upstream_client, venue_id=1) == {"id": "1"}
+
+    asyncio.run(run())
+
+
+def test_typed_endpoints_use_the_injected_cache_and_rate_limiter(monkeypatch):
+    fixtures = Path(__file__).parent / "test_files"
+    bodies = {
+        BaseRoute.core: (fixtures / "match_basic" / "1225249_basic.json").read_bytes(),
+        BaseRoute.site: (fixtures / "match" / "1426555.json").read_bytes(),
+    }
+    rate_limiters = []
+
+    async def fetch(route_template, route, base_route, sub_folder, warm_session, session, rate_limiter):
+        rate_limiters.append(rate_limiter)
+        return bodies[base_route]
+
+    def get_response_cache():
+        raise AssertionError("The process-wide cache should not be used")
+
+    monkeypatch.setattr(api_helper, "_fetch_response_body", fetch)
+    monkeypatch.setattr(api_helper, "get_response_cache", get_response_cache)
+
+    async def run():
+        upstream_client = UpstreamClient(None, ResponseCache(max_memory_bytes=10_000_000), create_rate_limiter())
+
+        assert (await match.match_basic(1225249, upstream_client)).id == 1225249
+        match_basic_route = api_helper._format_route(get_settings().routes.match_basic, {"match_id": 1225249})
+        assert await upstream_client.cache.get(get_cache_key(match_basic_route, BaseRoute.core)) is not None
+
+        # A finished match is remembered as complete in the injected cache
+        await match.match_api(1, 1426555, upstream_client)
+        assert await upstream_client.cache.is_match_complete(1426555)
+
+        assert rate_limiters == [upstream_client.rate_limiter] * 2
+
+    asyncio.run(run())
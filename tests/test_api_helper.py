@@ -0,0 +1,74 @@
+import asyncio
+import logging
+import threading
+
+from pycricinfo import api_helper
+from pycricinfo.api_helper import close_shared_session, get_shared_session, shared_session_lifespan
+
+
+def test_shared_session_is_reused():
+    async def run():
+        async with shared_session_lifespan() as session:
+            assert get_shared_session() is session
+            assert not session.closed
+        assert session.closed
+
+    asyncio.run(run())
+
+
+async def _open_shared_session():
+    return get_shared_session()
+
+
+def test_shared_session_recreated_for_new_event_loop(caplog):
+    first_loop = asyncio.new_event_loop()
+    try:
+        first = first_loop.run_until_complete(_open_shared_session())
+        second = asyncio.run(_open_shared_session())
+
+        assert first is not second
+        # The session of the first loop, which has stopped, is closed rather than leaked
+        assert first.closed
+        assert "was not closed" in caplog.text
+    finally:
+        asyncio.run(close_shared_session())
+        first_loop.close()
+    assert second.closed
+
+
+def test_shared_session_of_a_running_loop_is_closed_on_that_loop():
+    first_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=first_loop.run_forever)
+    thread.start()
+    try:
+        first = asyncio.run_coroutine_threadsafe(_open_shared_session(), first_loop).result()
+
+        async def open_second_and_wait_for_first_to_close():
+            second = get_shared_session()
+            while not first.closed:
+                await asyncio.sleep(0.01)
+            await close_shared_session()
+            return second
+
+        second = asyncio.run(open_second_and_wait_for_first_to_close())
+
+        assert first.closed
+        assert second.closed
+    finally:
+        first_loop.call_soon_threadsafe(first_loop.stop)
+        thread.join()
+        first_loop.close()
+
+
+def test_payload_only_formatted_when_debug_enabled(monkeypatch, caplog):
+    formatted = []
+    monkeypatch.setattr(api_helper._LazyPayload, "__str__", lambda self: formatted.append(self.body) or "payload")
+
+    with caplog.at_level(logging.INFO, logger="cricinfo"):
+        api_helper._log_payload(b'{"a": 1}', "https://example.com", {})
+    assert formatted == []
+
+    with caplog.at_level(logging.DEBUG, logger="cricinfo"):
+        api_helper._log_payload(b'{"a": 1}', "https://example.com", {})
+    assert formatted
+    assert "Response from https://example.com: payload" in caplog.text
@@ -0,0 +1,33 @@
+import gzip
+
+from pycricinfo.archive import ResponseArchiver
+
+
+def test_responses_are_written_in_the_background(tmp_path):
+    archiver = ResponseArchiver(folder=tmp_path, compression="gzip")
+
+    assert archiver.submit(b'{"id": 1}', "teams/1", "teams", "json")
+    archiver.close()
+
+    [written] = list(tmp_path.glob("teams/*/*_teams_1.json.gz"))
+    assert gzip.decompress(written.read_bytes()) == b'{"id": 1}'
+
+
+def test_responses_are_dropped_when_queue_is_full(tmp_path):
+    archiver = ResponseArchiver(folder=tmp_path, queue_size=1)
+    archiver._ensure_started = lambda: None
+
+    assert archiver.submit("<html></html>", "page", None, "html")
+    assert not archiver.submit("<html></html>", "page", None, "html")
+    assert archiver.dropped == 1
+
+
+def test_responses_for_the_same_route_are_not_overwritten(tmp_path):
+    archiver = ResponseArchiver(folder=tmp_path)
+
+    for i in range(3):
+        assert archiver.submit(f'{{"id": {i}}}', "teams/1", None, "json")
+    archiver.close()
+
+    written = sorted(tmp_path.glob("*/*_teams_1.json"))
+    assert [path.read_bytes() for path in written] == [b'{"id": 0}', b'{"id": 1}', b'{"id": 2}']
@@ -0,0 +1,130 @@
+import asyncio
+import os
+
+from pycricinfo.cache import ResponseCache, get_route_cache_ttl
+from pycricinfo.config import RouteCacheTTLs, Settings, get_settings
+
+
+def test_memory_tier_evicts_least_recently_used():
+    async def run():
+        cache = ResponseCache(max_memory_bytes=10)
+        await cache.set("a", b"12345", ttl=60)
+        await cache.set("b", b"12345", ttl=60)
+        assert await cache.get("a") == b"12345"
+
+        await cache.set("c", b"12345", ttl=60)
+
+        assert await cache.get("a") == b"12345"
+        assert await cache.get("b") is None
+        assert await cache.get("c") == b"12345"
+
+    asyncio.run(run())
+
+
+def test_expired_entries_are_not_returned():
+    async def run():
+        cache = ResponseCache(max_memory_bytes=100)
+        await cache.set("a", b"content", ttl=-1)
+        await cache.set("b", b"content", ttl=None)
+
+        assert await cache.get("a") is None
+        assert await cache.get("b") == b"content"
+
+    asyncio.run(run())
+
+
+def test_disk_tier_persists_between_caches(tmp_path):
+    async def run():
+        await ResponseCache(max_memory_bytes=100, folder=tmp_path).set("page", "<html></html>", ttl=60)
+        await ResponseCache(max_memory_bytes=100, folder=tmp_path).set("json", b'{"a": 1}', ttl=60)
+
+        cache = ResponseCache(max_memory_bytes=100, folder=tmp_path)
+        assert await cache.get("page") == "<html></html>"
+        assert await cache.get("json") == b'{"a": 1}'
+        assert await cache.get("missing") is None
+
+    asyncio.run(run())
+
+
+def test_concurrent_disk_writes_of_the_same_key(tmp_path):
+    cache = ResponseCache(max_memory_bytes=100, folder=tmp_path)
+    body = b"x" * 2_000_000
+
+    async def run():
+        await asyncio.gather(*(cache.set("match", body, ttl=60) for _ in range(16)))
+
+        assert await ResponseCache(max_memory_bytes=100, folder=tmp_path).get("match") == body
+        assert not list(tmp_path.rglob("*.tmp"))
+
+    asyncio.run(run())
+
+
+def test_disk_tier_prunes_expired_then_oldest_entries(tmp_path):
+    async def run():
+        cache = ResponseCache(max_memory_bytes=0, folder=tmp_path)
+        await cache.set("expired", b"x", ttl=-1)
+        for written_at, key in enumerate("abcd"):
+            await cache.set(key, b"x" * 300, ttl=60)
+            os.utime(cache._path_for_key(key), (written_at, written_at))
+
+        cache.max_disk_bytes = 1000
+        assert await cache.prune_disk() <= 1000
+
+        fresh_cache = ResponseCache(max_memory_bytes=0, folder=tmp_path)
+        cached_keys = [key for key in ("expired", "a", "b", "c", "d") if await fresh_cache.get(key) is not None]
+        assert cached_keys == ["c", "d"]
+
+    asyncio.run(run())
+
+
+def test_disk_tier_stays_within_its_limit(tmp_path):
+    async def run():
+        cache = ResponseCache(max_memory_bytes=0, folder=tmp_path, max_disk_bytes=2000)
+        for i in range(20):
+            await cache.set(str(i), b"x" * 300, ttl=60)
+
+        assert sum(path.stat().st_size for path in tmp_path.glob("??/*")) <= 2000
+        assert await cache.get("19") == b"x" * 300
+
+    asyncio.run(run())
+
+
+def test_route_cache_ttl_lookup():
+    settings = get_settings()
+
+    assert get_route_cache_ttl(settings.routes.venue) == settings.cache_ttls.venue
+    assert get_route_cache_ttl(settings.page_routes.player_stats) == settings.cache_ttls.player_stats
+    assert get_route_cache_ttl("not/a/route") == settings.cache_default_ttl
+
+
+def test_route_cache_ttls_are_rebuilt_for_new_settings(monkeypatch):
+    assert get_route_cache_ttl(get_settings().routes.venue) == get_settings().cache_ttls.venue
+
+    settings = Settings(cache_default_ttl=5, cache_ttls=RouteCacheTTLs(venue=1))
+    monkeypatch.setattr("pycricinfo.cache.get_settings", lambda: settings)
+
+    assert get_route_cache_ttl(settings.routes.venue) == 1
+    assert get_route_cache_ttl("not/a/route") == 5
+
+
+def test_completed_matches_are_remembered_on_disk(tmp_path):
+    async def run():
+        cache = ResponseCache(max_memory_bytes=100, folder=tmp_path)
+        await cache.set("summary", b"{}", ttl=-1)
+        await cache.mark_match_complete(1426555)
+
+        assert await ResponseCache(max_memory_bytes=100, folder=tmp_path).is_match_complete("1426555")
+        assert not await cache.is_match_complete(1381212)
+
+    asyncio.run(run())
+
+
+def test_pin_removes_expiry():
+    async def run():
+        cache = ResponseCache(max_memory_bytes=100)
+        await cache.set("summary", b"{}", ttl=60)
+        await cache.pin("summary")
+
+        assert cache._memory["summary"].expires_at is None
+
+    asyncio.run(run())
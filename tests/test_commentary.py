@@ -0,0 +1,82 @@
+import asyncio
+
+from pycricinfo import commentary
+from pycricinfo.models.source.api.commentary import Commentary
+
+
+def _fake_play_by_play(monkeypatch, pages_per_innings: dict[int, list[list]]) -> dict:
+    stats = {"in_flight": 0, "max_in_flight": 0, "calls": 0}
+
+    async def get_play_by_play(match_id, innings=1, page=1, session=None):
+        stats["calls"] += 1
+        stats["in_flight"] += 1
+        stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+        await asyncio.sleep(0.01)
+        stats["in_flight"] -= 1
+
+        pages = pages_per_innings.get(innings)
+        if not pages:
+            return []
+        return Commentary(
+            count=sum(len(p) for p in pages),
+            page_index=page,
+            page_size=25,
+            page_count=len(pages),
+            deliveries=pages[page - 1],
+        )
+
+    monkeypatch.setattr(commentary, "get_play_by_play", get_play_by_play)
+    return stats
+
+
+def test_innings_commentary_is_ordered_and_deduplicated(monkeypatch, deliveries):
+    # Pages overlap, as they do when a live innings moves on between requests, and are returned out of order
+    pages = [deliveries[0:10], deliveries[8:18], list(reversed(deliveries[18:25]))]
+    stats = _fake_play_by_play(monkeypatch, {1: pages})
+
+    result = asyncio.run(commentary.get_innings_commentary(1031439, 1))
+
+    assert [d.id for d in result.deliveries] == [d.id for d in deliveries]
+    assert result.count == len(deliveries)
+    assert stats["calls"] == 3
+
+
+def test_match_commentary_skips_missing_innings_and_bounds_concurrency(monkeypatch, deliveries):
+    pages = [[delivery] for delivery in deliveries]
+    stats = _fake_play_by_play(monkeypatch, {1: pages})
+
+    result = asyncio.run(commentary.get_match_commentary(1031439, concurrency=3))
+
+    assert [d.id for d in result.deliveries] == [d.id for d in deliveries]
+    assert stats["calls"] == len(pages) + 3
+    assert stats["max_in_flight"] <= 3
+
+
+def test_stream_deliveries_across_innings_with_bounded_prefetch(monkeypatch, deliveries):
+    pages = [deliveries[i : i + 5] for i in range(0, len(deliveries), 5)]
+    stats = _fake_play_by_play(monkeypatch, {1: pages[:3], 2: [], 3: pages[3:]})
+
+    async def consume():
+        return [delivery.id async for delivery in commentary.stream_deliveries(1031439, prefetch=2)]
+
+    streamed_ids = asyncio.run(consume())
+
+    assert streamed_ids == [d.id for d in deliveries]
+    assert stats["max_in_flight"] <= 2
+    assert stats["calls"] == len(pages) + 2
+
+
+def test_stream_deliveries_cancels_prefetched_pages_when_closed(monkeypatch, deliveries):
+    stats = _fake_play_by_play(monkeypatch, {1: [[delivery] for delivery in deliveries]})
+
+    async def consume_first():
+        stream = commentary.stream_deliveries(1031439, prefetch=3)
+        first = await anext(stream)
+        await stream.aclose()
+        await asyncio.sleep(0.05)
+        return first
+
+    first = asyncio.run(consume_first())
+
+    assert first.id == deliveries[0].id
+    assert stats["calls"] <= 4
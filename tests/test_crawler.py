@@ -0,0 +1,139 @@
+import asyncio
+import os
+from datetime import UTC, datetime, timedelta
+
+from pycricinfo import crawler
+from pycricinfo.config import CrawlSettings
+from pycricinfo.exceptions import CricinfoAPIException
+from pycricinfo.models.source import Match
+from pycricinfo.models.source.pages.series import MatchResult, MatchSeries, MatchTypeWithSeries
+from pycricinfo.utils import load_file_and_validate_to_model
+
+MATCH = load_file_and_validate_to_model(
+    os.path.join(os.path.dirname(__file__), "test_files", "match", "1426555.json"), Match
+)
+LIVE_MATCH = MATCH.model_copy(deep=True)
+LIVE_MATCH.header.competition.end_date = datetime.now(UTC) + timedelta(days=2)
+
+
+class FakeSite:
+    """Two seasons, each with two series of three matches."""
+
+    def __init__(self, monkeypatch):
+        self.failing_match_ids: set[int] = set()
+        self.live_match_ids: set[int] = set()
+        self.fetched_match_ids: list[int] = []
+        monkeypatch.setattr(crawler, "get_match_types_in_season", self.get_match_types_in_season)
+        monkeypatch.setattr(crawler, "get_match_results_in_series", self.get_match_results_in_series)
+        monkeypatch.setattr(crawler, "get_match", self.get_match)
+
+    async def get_match_types_in_season(self, season, type_filter=None, session=None):
+        series = [
+            MatchSeries(
+                series_id=data_series_id + 1000,
+                data_series_id=data_series_id,
+                title=f"Series {data_series_id}",
+                link="",
+                summary_url="",
+            )
+            for data_series_id in (int(season) * 10, int(season) * 10 + 1)
+        ]
+        return [MatchTypeWithSeries(name="Tests", series=series)]
+
+    async def get_match_results_in_series(self, data_series_id, session=None):
+        return [MatchResult(id=data_series_id * 10 + i, description="") for i in range(3)]
+
+    async def get_match(self, series_id, match_id, session=None):
+        await asyncio.sleep(0)
+        self.fetched_match_ids.append(match_id)
+        if match_id in self.failing_match_ids:
+            raise CricinfoAPIException(status_code=500, route=str(match_id), content=None)
+        return LIVE_MATCH if match_id in self.live_match_ids else MATCH
+
+
+def _crawl(checkpoint_path, stop_after=None) -> list[crawler.CrawledMatch]:
+    settings = CrawlSettings(series_concurrency=2, match_concurrency=2, queue_size=2, checkpoint_every=1)
+
+    async def run():
+        results = []
+        async for crawled_match in crawler.SeasonCrawler(
+            [1, 2], checkpoint_path=checkpoint_path, settings=settings
+        ).crawl():
+            results.append(crawled_match)
+            if stop_after and len(results) == stop_after:
+                break
+        return results
+
+    return asyncio.run(run())
+
+
+def test_crawl_fetches_every_match_and_retries_failures_on_resume(monkeypatch, tmp_path):
+    site = FakeSite(monkeypatch)
+    site.failing_match_ids = {101}
+    checkpoint_path = tmp_path / "crawl.json"
+
+    results = _crawl(checkpoint_path)
+
+    assert sorted(result.match_id for result in results) == [100, 101, 102, 110, 111, 112, 200, 201, 202, 210, 211, 212]
+    assert [result.match_id for result in results if result.error] == [101]
+
+    checkpoint = crawler.CrawlCheckpoint.load(checkpoint_path)
+    assert checkpoint.completed_seasons == {"2"}
+    assert checkpoint.completed_series == {11, 20, 21}
+    assert set(checkpoint.failed_matches) == {101}
+
+    site.failing_match_ids = set()
+    site.fetched_match_ids = []
+    results = _crawl(checkpoint_path)
+
+    assert [result.match_id for result in results] == [101]
+    assert site.fetched_match_ids == [101]
+    assert crawler.CrawlCheckpoint.load(checkpoint_path).completed_seasons == {"1", "2"}
+
+
+def test_unfinished_matches_are_fetched_again_on_resume(monkeypatch, tmp_path):
+    site = FakeSite(monkeypatch)
+    site.live_match_ids = {112}
+    checkpoint_path = tmp_path / "crawl.json"
+
+    assert len(_crawl(checkpoint_path)) == 12
+
+    checkpoint = crawler.CrawlCheckpoint.load(checkpoint_path)
+    assert 112 not in checkpoint.completed_matches
+    assert checkpoint.completed_seasons == {"2"}
+    assert 11 not in checkpoint.completed_series
+
+    site.live_match_ids = set()
+    site.fetched_match_ids = []
+    results = _crawl(checkpoint_path)
+
+    assert [result.match_id for result in results] == [112]
+    assert site.fetched_match_ids == [112]
+    assert crawler.CrawlCheckpoint.load(checkpoint_path).completed_seasons == {"1", "2"}
+
+
+def test_stopped_crawl_resumes_where_it_left_off(monkeypatch, tmp_path):
+    FakeSite(monkeypatch)
+    checkpoint_path = tmp_path / "crawl.json"
+
+    first_results = _crawl(checkpoint_path, stop_after=4)
+    second_results = _crawl(checkpoint_path)
+
+    first_ids = {result.match_id for result in first_results}
+    second_ids = {result.match_id for result in second_results}
+    # The match being handled when the crawl stopped isn't recorded as complete, so it is crawled again
+    assert first_ids & second_ids == {first_results[-1].match_id}
+    assert len(first_ids | second_ids) == 12
+
+
+def test_overlapping_checkpoint_saves_leave_a_whole_checkpoint(tmp_path):
+    checkpoint_path = tmp_path / "crawl.json"
+    checkpoints = [crawler.CrawlCheckpoint(completed_matches=set(range(i * 10_000))) for i in range(1, 9)]
+
+    async def run():
+        await asyncio.gather(*(asyncio.to_thread(checkpoint.save, checkpoint_path) for checkpoint in checkpoints))
+
+    asyncio.run(run())
+
+    assert crawler.CrawlCheckpoint.load(checkpoint_path) in checkpoints
+    assert not list(tmp_path.glob("*.tmp"))
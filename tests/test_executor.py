@@ -0,0 +1,45 @@
+import asyncio
+import threading
+
+import pytest
+
+from pycricinfo import executor
+from pycricinfo.config import Settings
+
+
+@pytest.fixture
+def parse_executor(monkeypatch):
+    def configure(executor_type: str):
+        monkeypatch.setattr(executor, "get_settings", lambda: Settings(parse_executor=executor_type))
+
+    yield configure
+    executor.shutdown_parse_executor()
+
+
+def _current_thread_name(*_) -> str:
+    return threading.current_thread().name
+
+
+def test_inline_parsing_runs_on_event_loop_thread(parse_executor):
+    parse_executor("inline")
+
+    thread_name = asyncio.run(executor.run_parser(_current_thread_name))
+
+    assert thread_name == threading.current_thread().name
+    assert executor.get_parse_executor() is None
+
+
+def test_thread_parsing_runs_off_event_loop(parse_executor):
+    parse_executor("thread")
+
+    async def run():
+        return await asyncio.gather(*(executor.run_parser(_current_thread_name, i) for i in range(4)))
+
+    thread_names = asyncio.run(run())
+
+    assert all(name.startswith("pycricinfo-parser") for name in thread_names)
+    first_executor = executor.get_parse_executor()
+    assert executor.get_parse_executor() is first_executor
+
+    executor.shutdown_parse_executor()
+    assert executor.get_parse_executor() is not first_executor
@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+from benchmarks.stub_server import StubSettings, start_stub_server, stub_base_routes
+from pycricinfo import instrumentation
+from pycricinfo.api_helper import create_session, get_and_parse
+from pycricinfo.config import get_settings
+from pycricinfo.instrumentation import add_span_hook, get_request_counts, remove_span_hook, span
+from pycricinfo.models.source import MatchBasic
+
+
+@pytest.fixture
+def spans():
+    ended = []
+    add_span_hook(ended.append)
+    yield ended
+    remove_span_hook(ended.append)
+
+
+def test_nested_spans_share_request_and_record_errors(spans):
+    with pytest.raises(ValueError):
+        with span("outer", request_id="abc", route_template="teams/{team_id}"):
+            with span("inner", model="Team"):
+                raise ValueError()
+
+    inner, outer = spans
+    assert (inner.name, inner.request_id, inner.route_template) == ("inner", "abc", "teams/{team_id}")
+    assert inner.parent_id == outer.span_id
+    assert inner.attributes == {"model": "Team", "error": "ValueError"}
+    assert outer.duration >= inner.duration
+
+
+def test_request_stages_are_recorded_as_spans(spans, monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "cache_enabled", False)
+    monkeypatch.setattr(settings, "archive_responses", False)
+    monkeypatch.setattr(instrumentation, "_request_counts", instrumentation.Counter())
+
+    async def run():
+        runner, base_url = await start_stub_server(StubSettings())
+        for setting, value in stub_base_routes(base_url).items():
+            monkeypatch.setattr(settings, setting, value)
+        try:
+            async with create_session() as session:
+                return await get_and_parse(
+                    settings.routes.match_basic, MatchBasic, params={"match_id": 1}, session=session
+                )
+        finally:
+            await runner.cleanup()
+
+    asyncio.run(run())
+
+    by_name = {ended.name: ended for ended in spans}
+    request = by_name["cricinfo.request"]
+    assert request.attributes["status"] == 200
+    for name in ("cricinfo.connect", "cricinfo.ttfb", "cricinfo.body_read"):
+        assert by_name[name].request_id == request.request_id
+        assert by_name[name].parent_id == request.span_id
+    assert by_name["cricinfo.validate"].attributes["model"] == "MatchBasic"
+    assert by_name["cricinfo.parse"].parent_id == by_name["cricinfo.validate"].span_id
+    assert get_request_counts() == {(settings.routes.match_basic, "200"): 1}
@@ -0,0 +1,192 @@
+import asyncio
+
+import aiohttp
+import pytest
+
+from pycricinfo import live
+from pycricinfo.config import LivePollSettings, Settings
+from pycricinfo.models.source.api.commentary import Commentary
+
+PAGE_SIZE = 5
+
+
+class FakeLiveMatch:
+    """Serves pages of commentary for a match, to which deliveries can be added between polls."""
+
+    def __init__(self, monkeypatch):
+        self.innings: dict[int, list] = {}
+        self.requests: list[tuple[int, int]] = []
+        monkeypatch.setattr(live, "get_play_by_play", self.get_play_by_play)
+
+    async def get_play_by_play(self, match_id, innings=1, page=1, session=None, use_cache=True):
+        assert not use_cache, "Live commentary should always be fetched upstream"
+        self.requests.append((innings, page))
+        deliveries = self.innings.get(innings, [])
+        if not deliveries:
+            return []
+        page_count = (len(deliveries) + PAGE_SIZE - 1) // PAGE_SIZE
+        return Commentary(
+            count=len(deliveries),
+            page_index=page,
+            page_size=PAGE_SIZE,
+            page_count=page_count,
+            deliveries=deliveries[(page - 1) * PAGE_SIZE : page * PAGE_SIZE],
+        )
+
+
+def test_poller_returns_only_new_deliveries_from_tail_pages(monkeypatch, deliveries):
+    match = FakeLiveMatch(monkeypatch)
+    match.innings[1] = deliveries[:12]
+    poller = live.LivePoller(1031439, settings=LivePollSettings(min_interval=1, max_interval=8, backoff_factor=2))
+
+    async def run():
+        assert await poller.poll() == []
+
+        match.innings[1] = deliveries[:18]
+        match.requests.clear()
+        new = await poller.poll()
+        assert [d.id for d in new] == [d.id for d in deliveries[12:18]]
+        # Only the previous last page and the page added since are fetched
+        assert match.requests == [(1, 3), (1, 4)]
+        assert poller.interval == 1
+
+        assert await poller.poll() == []
+        assert await poller.poll() == []
+        assert poller.interval == 4
+
+    asyncio.run(run())
+
+
+def _last_wicket(delivery):
+    delivery = delivery.model_copy(deep=True)
+    delivery.current_innings_score.wickets = 10
+    return delivery
+
+
+def test_poller_moves_on_to_next_innings(monkeypatch, deliveries):
+    match = FakeLiveMatch(monkeypatch)
+    match.innings[1] = deliveries[:9] + [_last_wicket(deliveries[9])]
+    poller = live.LivePoller(1031439)
+
+    async def run():
+        await poller.poll()
+        match.innings[2] = deliveries[10:13]
+        new = await poller.poll()
+        assert [d.id for d in new] == [d.id for d in deliveries[10:13]]
+        assert poller.position.innings == 2
+
+    asyncio.run(run())
+
+
+def test_next_innings_is_only_checked_once_the_innings_looks_finished(monkeypatch, deliveries):
+    match = FakeLiveMatch(monkeypatch)
+    match.innings[1] = deliveries[:10]
+    poller = live.LivePoller(1031439)
+
+    async def run():
+        await poller.poll()
+        match.requests.clear()
+        assert await poller.poll() == []
+        assert await poller.poll() == []
+        assert match.requests == [(1, 2), (1, 2)]
+
+        match.innings[1] = deliveries[:10] + [_last_wicket(deliveries[10])]
+        assert [d.id for d in await poller.poll()] == [deliveries[10].id]
+        match.requests.clear()
+        assert await poller.poll() == []
+        assert match.requests == [(1, 3), (2, 1)]
+
+    asyncio.run(run())
+
+
+def test_next_innings_is_checked_now_and_then_while_the_innings_is_idle(monkeypatch, deliveries):
+    match = FakeLiveMatch(monkeypatch)
+    match.innings[1] = deliveries[:10]
+    poller = live.LivePoller(1031439, settings=LivePollSettings(next_innings_probe_interval=0))
+
+    async def run():
+        await poller.poll()
+        match.innings[2] = deliveries[10:13]
+        assert [d.id for d in await poller.poll()] == [d.id for d in deliveries[10:13]]
+        assert poller.position.innings == 2
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize(
+    "wickets, ball_limit, remaining_balls, target, runs, text, expected",
+    [
+        (3, 0, 0, 0, 150, "no run", False),
+        (10, 0, 0, 0, 150, "no run", True),
+        (6, 300, 0, 0, 250, "no run", True),
+        (6, 300, 12, 0, 250, "no run", False),
+        (4, 300, 60, 251, 252, "FOUR", True),
+        (7, 0, 0, 0, 450, "That's it, South Africa have declared", True),
+    ],
+)
+def test_is_innings_finished(deliveries, wickets, ball_limit, remaining_balls, target, runs, text, expected):
+    delivery = deliveries[0].model_copy(deep=True)
+    innings = delivery.current_innings_score
+    innings.wickets, innings.ball_limit, innings.remaining_balls = wickets, ball_limit, remaining_balls
+    innings.target, innings.runs = target, runs
+    delivery.text = text
+
+    assert live.is_innings_finished(delivery) == expected
+
+
+def test_hub_shares_one_poller_between_subscribers(monkeypatch, deliveries):
+    match = FakeLiveMatch(monkeypatch)
+    match.innings[1] = deliveries[:5]
+    monkeypatch.setattr(
+        live, "get_settings", lambda: Settings(live_poll=LivePollSettings(min_interval=0.01, max_interval=0.01))
+    )
+
+    async def run():
+        hub = live.LiveFeedHub(queue_size=10)
+        first = hub.subscribe(1031439)
+        second = hub.subscribe(1031439)
+        assert hub.subscriber_count(1031439) == 2
+
+        await asyncio.sleep(0.05)
+        requests_with_two_subscribers = len(match.requests)
+        match.innings[1] = deliveries[:7]
+
+        received = [await asyncio.wait_for(queue.get(), 1) for queue in (first, second) for _ in range(2)]
+        assert [d.id for d in received] == [d.id for d in deliveries[5:7] * 2]
+
+        hub.unsubscribe(1031439, first)
+        hub.unsubscribe(1031439, second)
+        assert hub.subscriber_count(1031439) == 0
+        await asyncio.sleep(0.05)
+        assert len(match.requests) <= requests_with_two_subscribers + 4
+        requests_after_unsubscribing = len(match.requests)
+        await asyncio.sleep(0.05)
+        assert len(match.requests) == requests_after_unsubscribing
+
+    asyncio.run(run())
+
+
+def test_deliveries_survive_connection_errors(monkeypatch, deliveries):
+    match = FakeLiveMatch(monkeypatch)
+    match.innings[1] = deliveries[:5]
+    serve_page = match.get_play_by_play
+    failures = [aiohttp.ClientConnectionError("Connection reset"), asyncio.TimeoutError()]
+
+    async def get_play_by_play(*args, **kwargs):
+        if match.requests and failures:
+            raise failures.pop()
+        return await serve_page(*args, **kwargs)
+
+    monkeypatch.setattr(live, "get_play_by_play", get_play_by_play)
+    poller = live.LivePoller(1031439, settings=LivePollSettings(min_interval=0.01, max_interval=0.01))
+
+    async def run():
+        iterator = poller.deliveries()
+        next_delivery = asyncio.ensure_future(anext(iterator))
+        await asyncio.sleep(0.05)
+        match.innings[1] = deliveries[:6]
+        assert (await asyncio.wait_for(next_delivery, 1)).id == deliveries[5].id
+        assert failures == []
+        await iterator.aclose()
+
+    asyncio.run(run())
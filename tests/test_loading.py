@@ -1,11 +1,25 @@
+import copy
+import json
 import os
+from pathlib import Path
+from typing import Optional
 
 import pytest
 
 from pycricinfo.models.source import Match, MatchBasic
 from pycricinfo.models.source.api.commentary import APIResponseCommentary
+from pycricinfo.models.source.api.common import CCBaseModel
 from pycricinfo.models.source.api.player import Player
-from pycricinfo.utils import load_file_and_validate_to_model
+from pycricinfo.utils import (
+    _null_out_empty_objects,
+    load_dict_to_model,
+    load_file_and_validate_to_model,
+    load_json_to_model,
+    replace_empty_objects_with_null,
+    validate_json_to_model,
+)
+
+TEST_FILES_FOLDER = Path(__file__).parent / "test_files"
 
 
 def get_test_file_path(file_name: str) -> str:
@@ -53,3 +67,89 @@ def test_load_plater():
 
     assert result is not None
     assert isinstance(result, Player)
+
+
+@pytest.mark.parametrize("file_name", ["match/1426555.json", "match/1381212.json"])
+def test_finished_match_is_complete(file_name):
+    """Test that finished matches are detected as complete, so their responses can be cached indefinitely."""
+    result = load_file_and_validate_to_model(get_test_file_path(file_name), Match)
+
+    assert result.is_complete
+
+
+FIXTURE_MODELS = {"ball_by_ball": APIResponseCommentary, "match": Match, "match_basic": MatchBasic, "player": Player}
+
+
+@pytest.mark.parametrize(
+    "file_name", sorted(str(path.relative_to(TEST_FILES_FOLDER)) for path in TEST_FILES_FOLDER.glob("*/*.json"))
+)
+@pytest.mark.parametrize("null_out_empty_dicts", [True, False])
+def test_json_and_dict_loading_are_equivalent(file_name, null_out_empty_dicts):
+    """
+    Test that validating raw JSON gives the same model as decoding it to a dict, replacing its empty objects with
+    null if asked to, and validating that.
+    """
+    model = FIXTURE_MODELS[file_name.split("/")[0]]
+    content = (TEST_FILES_FOLDER / file_name).read_bytes()
+    data = json.loads(content)
+    if null_out_empty_dicts:
+        data = replace_empty_objects_with_null(data)
+
+    from_json = validate_json_to_model(content, model, null_out_empty_dicts=null_out_empty_dicts)
+
+    assert from_json == model.model_validate(data)
+
+
+def test_all_null_nested_objects_are_nulled_during_validation():
+    """Test that an object of only nulls is nulled out wherever it is nested, such as a delivery's bowler's athlete."""
+    with open(get_test_file_path("ball_by_ball/1031439_1_1.json"), "rb") as content:
+        data = json.loads(content.read())
+    bowler = data["commentary"]["items"][0]["bowler"]
+    bowler["athlete"] = {key: None for key in bowler["athlete"]}
+
+    from_json = load_json_to_model(json.dumps(data), APIResponseCommentary)
+
+    assert from_json.commentary.deliveries[0].bowler.athlete is None
+    assert from_json == load_dict_to_model(data, APIResponseCommentary)
+
+
+def test_empty_objects_are_nulled_out_anywhere_without_changing_the_input():
+    """Test that empty objects are nulled out wherever they are nested, and that the input is left as it was."""
+    data = {
+        "competitions": [{"id": "1"}],
+        "name": "Innings",
+        "values": [[{"a": None}, {"b": 1}], [{}]],
+        "extra": {"nested": {"c": None}, "empty": {}},
+    }
+    original = copy.deepcopy(data)
+
+    result = _null_out_empty_objects(data)
+
+    assert result == {
+        "competitions": [{"id": "1"}],
+        "name": "Innings",
+        "values": [[None, {"b": 1}], [None]],
+        "extra": {"nested": None, "empty": None},
+    }
+    assert result == replace_empty_objects_with_null(original)
+    assert data == original
+    # Parts with nothing to null out are shared rather than copied
+    assert result["competitions"] is data["competitions"]
+
+
+class Named(CCBaseModel):
+    name: str
+    details: Optional[dict] = None
+
+
+def test_validating_leaves_the_input_unchanged():
+    """Test that the empty objects nulled out by CCBaseModel's validator are not nulled out in the caller's data."""
+    data = {"name": "Innings", "details": {}}
+
+    assert Named.model_validate(data).details is None
+    assert data == {"name": "Innings", "details": {}}
+
+
+def test_is_complete_is_not_serialized():
+    """Test that is_complete, which depends on the current time, is left out of serialized matches."""
+    assert "is_complete" not in Match.model_computed_fields
@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+from pycricinfo.config import get_settings
+from pycricinfo.instrumentation import span
+from pycricinfo.metrics import CricinfoMetrics, EventLoopLagMonitor, get_metrics
+
+prometheus_client = pytest.importorskip("prometheus_client")
+from prometheus_client.parser import text_string_to_metric_families  # noqa: E402
+
+
+def test_spans_feed_metrics():
+    metrics = CricinfoMetrics()
+
+    with span("cricinfo.request", route_template="venues/{venue_id}") as request:
+        with span("cricinfo.cache_lookup") as lookup:
+            lookup.attributes["hit"] = False
+        request.attributes["status"] = 200
+    metrics.observe_span(lookup)
+    metrics.observe_span(request)
+
+    sample = metrics.registry.get_sample_value
+    assert sample("cricinfo_cache_lookups_total", {"route_template": "venues/{venue_id}", "result": "miss"}) == 1
+    assert (
+        sample(
+            "cricinfo_upstream_request_duration_seconds_count", {"route_template": "venues/{venue_id}", "status": "200"}
+        )
+        == 1
+    )
+    assert sample("cricinfo_upstream_requests_in_flight") == 0
+
+
+def test_rendered_metrics_parse_as_the_exposition_format():
+    metrics = CricinfoMetrics()
+    route = 'teams/"{team_id}"\\\n'
+    metrics.http_request_duration.labels(method="GET", route=route, status=200).observe(0.05)
+    metrics.http_request_duration.labels(method="GET", route=route, status=200).observe(5)
+    metrics.http_in_flight.inc()
+
+    families = {family.name: family for family in text_string_to_metric_families(metrics.render())}
+
+    duration = families["cricinfo_http_request_duration_seconds"]
+    assert duration.type == "histogram"
+    samples = {(sample.name, sample.labels.get("le")): sample for sample in duration.samples}
+    assert samples[("cricinfo_http_request_duration_seconds_bucket", "0.05")].value == 1
+    assert samples[("cricinfo_http_request_duration_seconds_bucket", "+Inf")].value == 2
+    assert samples[("cricinfo_http_request_duration_seconds_sum", None)].value == pytest.approx(5.05)
+    assert samples[("cricinfo_http_request_duration_seconds_count", None)].labels["route"] == route
+    assert families["cricinfo_http_requests_in_flight"].samples[0].value == 1
+
+
+def test_metrics_are_off_when_disabled(monkeypatch):
+    monkeypatch.setattr(get_settings(), "metrics_enabled", False)
+    get_metrics.cache_clear()
+    try:
+        assert get_metrics() is None
+    finally:
+        get_metrics.cache_clear()
+
+
+def test_event_loop_lag_is_sampled():
+    registry = prometheus_client.CollectorRegistry()
+    histogram = prometheus_client.Histogram("lag_seconds", "Lag", registry=registry)
+
+    async def run():
+        monitor = EventLoopLagMonitor(histogram, interval=0.01)
+        monitor.start()
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+
+    asyncio.run(run())
+    assert registry.get_sample_value("lag_seconds_count") > 0
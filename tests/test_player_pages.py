@@ -1,7 +1,12 @@
+import asyncio
+from pathlib import Path
+
 import pytest
 
-from pycricinfo.models.source.pages.player import CareerBattingRow, CareerBowlingRow, CareerFieldingRow
-from pycricinfo.player_stats_pages import _parse_career_summary_rows
+from pycricinfo import html_parsing, player_stats_pages
+from pycricinfo.exceptions import CricinfoAPIException
+from pycricinfo.models.source.pages.player import Career, CareerBattingRow, CareerBowlingRow, CareerFieldingRow
+from pycricinfo.player_stats_pages import _parse_career_summary_rows, _parse_stats_page
 from pycricinfo.types.match_types import MatchTypeNames
 
 # ---------------------------------------------------------------------------
@@ -94,3 +99,126 @@ def test_parse_stats_fielding_career_summary(case):
         return
     rows = _parse_career_summary_rows(_read(case["fielding"]), CareerFieldingRow)
     assert all(isinstance(r, CareerFieldingRow) for r in rows)
+
+
+# Single parse tests
+def test_stats_page_parse_keeps_only_tables_and_stats_tab():
+    soup = _parse_stats_page(_read("tests/test_files/player/887207_stats_page_batting_all.html"))
+
+    assert {tag.name for tag in soup.find_all(recursive=False)} <= {"table", "ul"}
+    assert soup.find("ul", id="statsTab") is not None
+    assert [ul.get("id") for ul in soup.find_all("ul", recursive=False)] == ["statsTab"]
+
+
+@pytest.mark.parametrize("case", PLAYER_CASES, ids=[c["name"] for c in PLAYER_CASES])
+def test_parsed_page_gives_same_rows_as_html(case):
+    html = _read(case["batting"])
+
+    rows_from_html = _parse_career_summary_rows(html, CareerBattingRow)
+    rows_from_soup = _parse_career_summary_rows(_parse_stats_page(html), CareerBattingRow)
+
+    assert rows_from_soup == rows_from_html
+
+
+# Parser backend tests
+STATS_PAGES_FOLDER = Path("tests/test_files/player")
+STATS_PAGE_PLAYER_IDS = sorted(
+    {int(path.name.split("_")[0]) for path in STATS_PAGES_FOLDER.glob("*_stats_page_*.html")}
+)
+
+
+def _parse_career_from_fixtures(player_id: int) -> Career:
+    """Parse a Career from whichever of the player's batting, bowling and fielding fixture pages exist."""
+    rows = {}
+    for stat_type, row_model in (
+        ("batting", CareerBattingRow),
+        ("bowling", CareerBowlingRow),
+        ("fielding", CareerFieldingRow),
+    ):
+        path = STATS_PAGES_FOLDER / f"{player_id}_stats_page_{stat_type}_all.html"
+        rows[stat_type] = (
+            _parse_career_summary_rows(path.read_text(encoding="utf-8"), row_model) if path.exists() else []
+        )
+    return Career(**rows)
+
+
+@pytest.mark.parametrize("player_id", STATS_PAGE_PLAYER_IDS)
+def test_lxml_backend_gives_same_career_as_html_parser(player_id, monkeypatch):
+    pytest.importorskip("lxml")
+
+    monkeypatch.setattr(html_parsing, "get_html_parser_backend", lambda: "html.parser")
+    html_parser_career = _parse_career_from_fixtures(player_id)
+    monkeypatch.setattr(html_parsing, "get_html_parser_backend", lambda: "lxml")
+    lxml_career = _parse_career_from_fixtures(player_id)
+
+    assert lxml_career.model_dump() == html_parser_career.model_dump()
+
+
+def test_parser_backend_falls_back_without_lxml(monkeypatch):
+    monkeypatch.setattr(html_parsing, "lxml", None)
+    html_parsing._resolve_html_parser_backend.cache_clear()
+    try:
+        assert html_parsing._resolve_html_parser_backend("auto") == "html.parser"
+        assert html_parsing._resolve_html_parser_backend("lxml") == "html.parser"
+    finally:
+        html_parsing._resolve_html_parser_backend.cache_clear()
+
+
+# Bulk career tests
+def test_player_careers_reports_failures_per_player(monkeypatch):
+    in_flight = {"now": 0, "max": 0}
+
+    async def get_player_career(player_id, session=None, cache=None, rate_limiter=None):
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.01 * (player_id % 3))
+        in_flight["now"] -= 1
+        if player_id % 4 == 0:
+            raise CricinfoAPIException(status_code=403, route=f"player/{player_id}", content=None)
+        return Career(batting=[], bowling=[], fielding=[])
+
+    monkeypatch.setattr(player_stats_pages, "get_player_career", get_player_career)
+
+    async def run():
+        return [result async for result in player_stats_pages.get_player_careers(range(1, 13), concurrency=3)]
+
+    results = asyncio.run(run())
+
+    assert sorted(result.player_id for result in results) == list(range(1, 13))
+    failed = {result.player_id: result.status_code for result in results if result.career is None}
+    assert failed == {4: 403, 8: 403, 12: 403}
+    assert in_flight["max"] == 3
+
+
+def test_player_careers_stop_fetching_once_the_results_are_no_longer_read(monkeypatch):
+    fetched = []
+    passed = set()
+    cache, rate_limiter = object(), object()
+
+    async def get_player_career(player_id, session=None, cache=None, rate_limiter=None):
+        fetched.append(player_id)
+        passed.add((cache, rate_limiter))
+        await asyncio.sleep(0)
+        return Career(batting=[], bowling=[], fielding=[])
+
+    monkeypatch.setattr(player_stats_pages, "get_player_career", get_player_career)
+
+    async def run():
+        careers = player_stats_pages.get_player_careers(
+            range(1, 1000), concurrency=2, cache=cache, rate_limiter=rate_limiter
+        )
+        first = await anext(careers)
+        # Without reading the results, the workers fill the queue and then wait for room in it
+        for _ in range(20):
+            await asyncio.sleep(0)
+        fetched_while_unread = len(fetched)
+        await careers.aclose()
+        workers = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        return first, fetched_while_unread, workers
+
+    first, fetched_while_unread, workers = asyncio.run(run())
+
+    assert first.career is not None
+    assert fetched_while_unread <= 5
+    assert workers == []
+    assert passed == {(cache, rate_limiter)}
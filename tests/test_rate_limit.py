@@ -0,0 +1,35 @@
+import asyncio
+import time
+
+from pycricinfo.config import BaseRoute, RateLimit
+from pycricinfo.rate_limit import RateLimiter, TokenBucket
+
+
+def test_bucket_allows_burst_then_queues():
+    bucket = TokenBucket(rate=10, burst=2)
+
+    waits = [bucket.reserve() for _ in range(4)]
+
+    assert waits[:2] == [0.0, 0.0]
+    assert 0.09 < waits[2] <= 0.1
+    assert 0.19 < waits[3] <= 0.2
+
+
+def test_unlimited_bucket_never_waits():
+    bucket = TokenBucket(rate=0, burst=1)
+
+    assert all(bucket.reserve() == 0.0 for _ in range(100))
+
+
+def test_limiter_paces_each_base_route_separately():
+    limiter = RateLimiter({BaseRoute.stats: RateLimit(rate=20, burst=1), BaseRoute.core: RateLimit(rate=20, burst=10)})
+
+    async def run():
+        start = time.monotonic()
+        await asyncio.gather(*[limiter.acquire(BaseRoute.core) for _ in range(3)])
+        assert time.monotonic() - start < 0.05
+
+        await asyncio.gather(*[limiter.acquire(BaseRoute.stats) for _ in range(3)])
+        assert time.monotonic() - start >= 0.09
+
+    asyncio.run(run())
@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+
+from pycricinfo import api_helper
+from pycricinfo.cache import ResponseCache, get_cache_key
+from pycricinfo.config import BaseRoute, get_settings
+from pycricinfo.exceptions import CricinfoAPIException
+from pycricinfo.replay import ReplayArchive
+
+
+def test_archive_stores_identical_responses_once(tmp_path):
+    async def run():
+        archive = ReplayArchive(tmp_path)
+        await archive.record("core:venues/1", b'{"id": 1}')
+        await archive.record("core:venues/2", b'{"id": 1}')
+        await archive.record("page:cricketers/a-1", "<html></html>")
+
+        assert await archive.load("core:venues/1") == b'{"id": 1}'
+        assert await archive.load("core:venues/2") == b'{"id": 1}'
+        assert await archive.load("page:cricketers/a-1", as_text=True) == "<html></html>"
+        assert await archive.load("core:venues/3") is None
+
+    asyncio.run(run())
+    assert len([path for path in (tmp_path / "objects").rglob("*") if path.is_file()]) == 2
+
+
+def test_recorded_responses_are_replayed_without_the_network(tmp_path, monkeypatch):
+    calls = []
+
+    async def fetch(route_template, route, base_route, *args):
+        calls.append(route)
+        return b'{"id": 5}' if base_route == BaseRoute.core else "<html>5</html>"
+
+    archive = ReplayArchive(tmp_path)
+    monkeypatch.setattr(api_helper, "_fetch_response_body", fetch)
+    monkeypatch.setattr(api_helper, "get_replay_archive", lambda: archive)
+    monkeypatch.setattr(get_settings(), "cache_enabled", False)
+
+    async def get(route, base_route):
+        return await api_helper._get_response_body(route, {"id": "5"}, base_route, None, False, None)
+
+    monkeypatch.setattr(get_settings(), "transport_mode", "record")
+    assert asyncio.run(get("venues/{id}", BaseRoute.core)) == b'{"id": 5}'
+    assert asyncio.run(get("cricketers/a-{id}", BaseRoute.page)) == "<html>5</html>"
+
+    monkeypatch.setattr(get_settings(), "transport_mode", "replay")
+    assert asyncio.run(get("venues/{id}", BaseRoute.core)) == b'{"id": 5}'
+    assert asyncio.run(get("cricketers/a-{id}", BaseRoute.page)) == "<html>5</html>"
+    assert calls == ["venues/5", "cricketers/a-5"]
+
+    with pytest.raises(CricinfoAPIException) as ex:
+        asyncio.run(get("teams/{id}", BaseRoute.core))
+    assert ex.value.status_code == 404
+
+
+def test_cache_hits_are_recorded(tmp_path, monkeypatch):
+    async def fail(*_, **__):
+        raise AssertionError("The response should have come from the cache")
+
+    archive = ReplayArchive(tmp_path)
+    cache = ResponseCache(max_memory_bytes=1000)
+    monkeypatch.setattr(api_helper, "_fetch_response_body", fail)
+    monkeypatch.setattr(api_helper, "get_replay_archive", lambda: archive)
+    monkeypatch.setattr(get_settings(), "transport_mode", "record")
+    route_template = get_settings().routes.venue
+    cache_key = get_cache_key(api_helper._format_route(route_template, {"venue_id": 5}), BaseRoute.core)
+
+    async def run():
+        await cache.set(cache_key, b'{"id": 5}', ttl=60)
+        body = await api_helper._get_response_body(
+            route_template, {"venue_id": 5}, BaseRoute.core, None, False, None, cache=cache
+        )
+
+        assert body == b'{"id": 5}'
+        assert await archive.load(cache_key) == b'{"id": 5}'
+
+    asyncio.run(run())
+
+
+def test_concurrent_recordings_of_identical_responses(tmp_path):
+    async def run():
+        archive = ReplayArchive(tmp_path)
+        content = b"x" * 1_000_000
+        results = await asyncio.gather(
+            *(archive.record(f"core:venues/{i}", content) for i in range(32)), return_exceptions=True
+        )
+
+        assert [result for result in results if isinstance(result, Exception)] == []
+        assert await archive.load("core:venues/31") == content
+
+    asyncio.run(run())
+    assert not list(tmp_path.rglob("*.tmp"))
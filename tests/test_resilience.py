@@ -0,0 +1,159 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import aiohttp
+import pytest
+
+from pycricinfo import api_helper, resilience
+from pycricinfo.config import BaseRoute, CircuitBreakerSettings, RateLimit, RetrySettings, get_settings
+from pycricinfo.exceptions import CircuitBreakerOpenException
+from pycricinfo.rate_limit import RateLimiter
+from pycricinfo.resilience import CircuitBreaker, get_retry_delay
+
+
+def test_circuit_opens_after_consecutive_failures():
+    breaker = CircuitBreaker("example.com", failure_threshold=2, reset_timeout=60)
+
+    breaker.record_failure()
+    breaker.check("route")
+    breaker.record_failure()
+
+    with pytest.raises(CircuitBreakerOpenException):
+        breaker.check("route")
+
+
+def test_success_resets_failure_count():
+    breaker = CircuitBreaker("example.com", failure_threshold=2, reset_timeout=60)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    breaker.check("route")
+    assert not breaker.is_open
+
+
+def test_single_trial_request_after_reset_timeout():
+    breaker = CircuitBreaker("example.com", failure_threshold=1, reset_timeout=60)
+    breaker.record_failure()
+    breaker._opened_at -= 61
+
+    breaker.check("route")
+    with pytest.raises(CircuitBreakerOpenException):
+        breaker.check("route")
+
+    breaker.record_success()
+    breaker.check("route")
+
+
+def test_retry_delay_is_capped_and_honours_retry_after():
+    retry_settings = RetrySettings(backoff_base=1, backoff_max=5)
+
+    assert all(0 <= get_retry_delay(10, retry_settings) <= 5 for _ in range(100))
+    assert get_retry_delay(1, retry_settings, retry_after="3") >= 3
+    assert get_retry_delay(1, retry_settings, retry_after="120") <= 5
+
+
+class FakeSession:
+    """Answers each request with the next outcome: a status code, a pair of status code and headers, or an error."""
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.requests = 0
+
+    @asynccontextmanager
+    async def get(self, url, headers=None, timeout=None):
+        self.requests += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        status, response_headers = outcome if isinstance(outcome, tuple) else (outcome, {})
+        yield FakeResponse(status, response_headers)
+
+
+class FakeResponse:
+    def __init__(self, status, headers):
+        self.status = status
+        self.headers = headers
+
+    async def read(self):
+        return f'{{"status": {self.status}}}'.encode()
+
+
+@pytest.fixture
+def send(monkeypatch):
+    """Send a request through ``_send_with_retries``, recording each retry delay rather than sleeping through it."""
+    delays = []
+    sleep = asyncio.sleep
+
+    async def record_delay(delay):
+        delays.append(delay)
+        await sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", record_delay)
+    monkeypatch.setattr(resilience, "_circuit_breakers", {})
+    monkeypatch.setattr(get_settings(), "retry", RetrySettings(max_attempts=3, backoff_base=0.01, backoff_max=5))
+    monkeypatch.setattr(get_settings(), "circuit_breaker", CircuitBreakerSettings(failure_threshold=5))
+    rate_limiter = RateLimiter({BaseRoute.core: RateLimit(rate=1000, burst=1000)})
+
+    def send_with_retries(session):
+        return asyncio.run(
+            api_helper._send_with_retries(
+                session, "https://example.com/route", {}, BaseRoute.core, {}, rate_limiter=rate_limiter
+            )
+        )
+
+    send_with_retries.delays = delays
+    return send_with_retries
+
+
+def test_retries_error_statuses_until_success(send):
+    session = FakeSession([503, (429, {"Retry-After": "3"}), 200])
+
+    assert send(session) == (200, b'{"status": 200}')
+    assert session.requests == 3
+    assert send.delays[0] < 3
+    assert send.delays[1] >= 3
+
+
+def test_retries_connection_errors_and_timeouts(send):
+    session = FakeSession([aiohttp.ClientConnectionError(), asyncio.TimeoutError(), 200])
+
+    assert send(session) == (200, b'{"status": 200}')
+    assert session.requests == 3
+
+
+def test_returns_the_last_response_after_max_attempts(send):
+    session = FakeSession([500, 502, 504])
+
+    assert send(session) == (504, b'{"status": 504}')
+    assert session.requests == 3
+
+
+def test_raises_the_last_connection_error_after_max_attempts(send):
+    session = FakeSession([aiohttp.ClientConnectionError()] * 3)
+
+    with pytest.raises(aiohttp.ClientConnectionError):
+        send(session)
+    assert session.requests == 3
+
+
+def test_does_not_retry_other_statuses(send):
+    session = FakeSession([404])
+
+    assert send(session) == (404, b'{"status": 404}')
+    assert session.requests == 1
+    assert send.delays == []
+
+
+def test_open_circuit_fails_fast(send, monkeypatch):
+    monkeypatch.setattr(get_settings(), "circuit_breaker", CircuitBreakerSettings(failure_threshold=2))
+    session = FakeSession([500, 500, 200])
+
+    with pytest.raises(CircuitBreakerOpenException):
+        send(session)
+    assert session.requests == 2
+
+    with pytest.raises(CircuitBreakerOpenException):
+        send(session)
+    assert session.requests == 2
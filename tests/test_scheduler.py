@@ -0,0 +1,175 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import aiohttp
+import pytest
+
+from pycricinfo import scheduler
+from pycricinfo.config import PollScheduleSettings
+from pycricinfo.models.source import Match
+from pycricinfo.scheduler import MatchPollState, PollScheduler, get_match_poll_state
+
+NOW = datetime(2024, 11, 23, 6, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+def live_match(load_test_file):
+    """Load a match which is live at ``NOW``, with the given status summary and state."""
+
+    def load(summary: str, state: str = "in") -> Match:
+        match = load_test_file("match/1426555.json", Match)
+        competition = match.header.competition
+        competition.date = NOW - timedelta(hours=4)
+        competition.end_date = NOW + timedelta(days=4)
+        competition.status.summary = summary
+        competition.status.type.state = state
+        competition.status.type.description = "In Progress" if state == "in" else "Scheduled"
+        competition.status.type.detail = ""
+        return match
+
+    return load
+
+
+def test_finished_match_is_not_polled(load_test_file):
+    match = load_test_file("match/1426555.json", Match)
+
+    state = get_match_poll_state(match, now=NOW)
+
+    assert state == MatchPollState.FINISHED
+    assert PollScheduler(PollScheduleSettings()).get_interval(state, match, now=NOW) is None
+
+
+@pytest.mark.parametrize(
+    "summary, expected_state",
+    [
+        ("Australia trail by 104 runs", MatchPollState.LIVE),
+        ("Team India need 50 runs", MatchPollState.LIVE),
+        ("Lunch - Day 1", MatchPollState.BREAK),
+        ("Tea", MatchPollState.BREAK),
+        ("Rain stops play", MatchPollState.BREAK),
+        ("Stumps - Day 1", MatchPollState.CLOSE_OF_PLAY),
+    ],
+)
+def test_match_state_from_status(live_match, summary, expected_state):
+    assert get_match_poll_state(live_match(summary), now=NOW) == expected_state
+
+
+def test_not_started_match_waits_until_start(live_match):
+    match = live_match("Match starts in 2 hours", state="pre")
+    match.header.competition.date = NOW + timedelta(hours=2)
+    scheduler = PollScheduler(PollScheduleSettings(not_started_max=3600))
+
+    state = get_match_poll_state(match, now=NOW)
+
+    assert state == MatchPollState.NOT_STARTED
+    assert scheduler.get_interval(state, match, now=NOW) == 3600
+    assert scheduler.get_interval(state, match, now=NOW + timedelta(minutes=110)) == 600
+
+
+def test_completed_innings_is_a_break(live_match, deliveries):
+    match = live_match("Australia trail by 104 runs")
+    delivery = deliveries[-1]
+    delivery.current_innings_score.day = 1
+    delivery.current_innings_score.session = 2
+
+    assert get_match_poll_state(match, delivery, now=NOW) == MatchPollState.LIVE
+
+    delivery.current_innings_score.wickets = 10
+    assert get_match_poll_state(match, delivery, now=NOW) == MatchPollState.BREAK
+
+    delivery.current_innings_score.wickets = 2
+    assert get_match_poll_state(match, delivery, now=NOW + timedelta(days=1)) == MatchPollState.BREAK
+
+
+def test_new_session_with_no_balls_bowled_is_a_break(live_match, deliveries):
+    match = live_match("Australia trail by 104 runs")
+    delivery = deliveries[-1]
+    delivery.current_innings_score.day = 1
+    delivery.current_innings_score.session = 1
+
+    # Four hours after the start of play the second session is due, so a delivery from the first is from before lunch
+    assert get_match_poll_state(match, delivery, now=NOW) == MatchPollState.BREAK
+
+    delivery.current_innings_score.session = 2
+    assert get_match_poll_state(match, delivery, now=NOW) == MatchPollState.LIVE
+
+    delivery.current_innings_score.session = 1
+    assert get_match_poll_state(match, delivery, now=NOW - timedelta(hours=3)) == MatchPollState.LIVE
+
+
+def test_sessions_are_ignored_for_one_day_matches(live_match, deliveries):
+    match = live_match("Australia need 104 runs")
+    match.header.competition.end_date = match.header.competition.date + timedelta(hours=8)
+    delivery = deliveries[-1]
+    delivery.current_innings_score.day = 1
+    delivery.current_innings_score.session = 1
+
+    assert get_match_poll_state(match, delivery, now=NOW) == MatchPollState.LIVE
+
+
+def test_follow_polls_commentary_only_while_live(monkeypatch, live_match, deliveries):
+    statuses = iter(["Lunch", "India lead by 10 runs", "India lead by 12 runs", "India won by 295 runs"])
+    polls = []
+
+    async def get_match(series_id, match_id, session=None):
+        summary = next(statuses)
+        match = live_match(summary, state="post" if "won" in summary else "in")
+        match.header.competition.date = datetime.now(UTC) - timedelta(hours=1)
+        return match
+
+    class FakePoller:
+        def __init__(self, match_id, session=None):
+            self.position = None
+
+        async def poll(self):
+            polls.append(len(polls))
+            self.position = object()
+            return deliveries[len(polls) - 1 : len(polls)]
+
+    monkeypatch.setattr(scheduler, "get_match", get_match)
+    monkeypatch.setattr(scheduler, "LivePoller", FakePoller)
+    settings = PollScheduleSettings(live=0, break_interval=0, status_interval=0)
+
+    async def follow():
+        return [delivery.id async for delivery in PollScheduler(settings).follow(1, 1426555)]
+
+    followed = asyncio.run(follow())
+
+    # Not polled during lunch, then twice while live and once more when the match finishes
+    assert followed == [delivery.id for delivery in deliveries[:3]]
+
+
+def test_follow_survives_connection_errors(monkeypatch, live_match, deliveries):
+    responses = iter(
+        [
+            aiohttp.ClientConnectionError("Connection reset"),
+            "India lead by 10 runs",
+            asyncio.TimeoutError(),
+            "India won",
+        ]
+    )
+
+    async def get_match(series_id, match_id, session=None):
+        response = next(responses)
+        if isinstance(response, Exception):
+            raise response
+        match = live_match(response, state="post" if "won" in response else "in")
+        match.header.competition.date = datetime.now(UTC) - timedelta(hours=1)
+        return match
+
+    class FakePoller:
+        def __init__(self, match_id, session=None):
+            self.position = None
+
+        async def poll(self):
+            self.position = object()
+            return deliveries[:1]
+
+    monkeypatch.setattr(scheduler, "get_match", get_match)
+    monkeypatch.setattr(scheduler, "LivePoller", FakePoller)
+    settings = PollScheduleSettings(live=0, break_interval=0, status_interval=0)
+
+    async def follow():
+        return [delivery.id async for delivery in PollScheduler(settings).follow(1, 1426555)]
+
+    assert asyncio.run(follow()) == [deliveries[0].id] * 2
@@ -0,0 +1,128 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from pycricinfo import api_helper
+from pycricinfo.config import get_settings
+from pycricinfo.models.source import MatchBasic
+from pycricinfo.single_flight import SingleFlight
+
+
+def test_concurrent_calls_with_the_same_key_are_shared():
+    calls = []
+
+    async def fetch(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return object()
+
+    async def run():
+        single_flight = SingleFlight()
+        results = await asyncio.gather(*[single_flight.run(key, lambda key=key: fetch(key)) for key in "aaab"])
+        assert results[0] is results[1] is results[2]
+        assert results[3] is not results[0]
+        assert single_flight.in_flight_count() == 0
+
+    asyncio.run(run())
+    assert calls == ["a", "b"]
+
+
+def test_exceptions_are_shared_and_not_cached():
+    calls = []
+
+    async def fail():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise ValueError("upstream failed")
+
+    async def run():
+        single_flight = SingleFlight()
+        results = await asyncio.gather(*[single_flight.run("a", fail) for _ in range(3)], return_exceptions=True)
+        assert all(isinstance(result, ValueError) for result in results)
+
+        with pytest.raises(ValueError):
+            await single_flight.run("a", fail)
+
+    asyncio.run(run())
+    assert len(calls) == 2
+
+
+def test_cancelled_caller_does_not_cancel_shared_call():
+    async def fetch():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    async def run():
+        single_flight = SingleFlight()
+        first = asyncio.create_task(single_flight.run("a", fetch))
+        second = asyncio.create_task(single_flight.run("a", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "done"
+
+    asyncio.run(run())
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Serve every upstream request slowly with the same basic match, counting the requests by route."""
+    body = (Path(__file__).parent / "test_files" / "match_basic" / "1225249_basic.json").read_bytes()
+    requests = []
+
+    async def fetch(route_template, route, *args):
+        requests.append(route)
+        await asyncio.sleep(0.01)
+        return body
+
+    monkeypatch.setattr(api_helper, "_fetch_response_body", fetch)
+    monkeypatch.setattr(get_settings(), "cache_enabled", False)
+    return requests
+
+
+def test_concurrent_identical_parses_share_one_request_and_parse(upstream):
+    route = get_settings().routes.match_basic
+
+    async def run():
+        return await asyncio.gather(
+            *[api_helper.get_and_parse(route, MatchBasic, params={"match_id": 1225249}) for _ in range(5)]
+        )
+
+    results = asyncio.run(run())
+    assert len(upstream) == 1
+    assert all(result == results[0] for result in results)
+    # Each caller gets its own copy, so one caller's changes aren't seen by the others
+    assert len({id(result) for result in results}) == 5
+    results[1].name = "Changed"
+    assert results[0].name != "Changed"
+
+
+def test_requests_through_different_sessions_or_sub_folders_are_not_shared(upstream):
+    route = get_settings().routes.match_basic
+    params = {"match_id": 1225249}
+
+    async def run():
+        first_session, second_session = object(), object()
+        await asyncio.gather(
+            api_helper.get_and_parse(route, MatchBasic, params=params, session=first_session),
+            api_helper.get_and_parse(route, MatchBasic, params=params, session=second_session),
+            api_helper.get_request(route, params, session=first_session),
+            api_helper.get_request(route, params, session=first_session, response_output_sub_folder="matches"),
+        )
+
+    asyncio.run(run())
+    assert len(upstream) == 3
+
+
+def test_concurrent_identical_requests_share_one_upstream_request(upstream):
+    route = get_settings().routes.match_basic
+
+    async def run():
+        return await asyncio.gather(
+            *[api_helper.get_request(route, params={"match_id": match_id}) for match_id in (1, 1, 1, 2)]
+        )
+
+    results = asyncio.run(run())
+    assert all(result == results[0] for result in results)
+    assert sorted(upstream) == ["events/1", "events/2"]
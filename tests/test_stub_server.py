@@ -0,0 +1,59 @@
+import asyncio
+
+import aiohttp
+import pytest
+
+from benchmarks.stub_server import StubSettings, start_stub_server, stub_base_routes
+from pycricinfo.api_helper import get_request
+from pycricinfo.config import BaseRoute, get_settings
+from pycricinfo.exceptions import CricinfoAPIException
+
+
+@pytest.fixture
+def stub_settings(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "cache_enabled", False)
+    monkeypatch.setattr(settings, "archive_responses", False)
+    monkeypatch.setattr(settings.retry, "max_attempts", 1)
+    return settings
+
+
+def _run_against_stub(settings, monkeypatch, stub: StubSettings, requests):
+    async def run():
+        runner, base_url = await start_stub_server(stub)
+        for setting, value in stub_base_routes(base_url).items():
+            monkeypatch.setattr(settings, setting, value)
+        try:
+            async with aiohttp.ClientSession() as session:
+                return await requests(session)
+        finally:
+            await runner.cleanup()
+
+    return asyncio.run(run())
+
+
+def test_stub_serves_fixtures_on_route_shapes(stub_settings, monkeypatch):
+    async def requests(session):
+        return (
+            await get_request(stub_settings.routes.match_basic, {"match_id": "1"}, BaseRoute.core, session=session),
+            await get_request(
+                stub_settings.page_routes.player_stats,
+                {"player_id": "31158", "stat_type": "bowling"},
+                BaseRoute.stats,
+                session=session,
+            ),
+        )
+
+    match_basic, stats_page = _run_against_stub(stub_settings, monkeypatch, StubSettings(), requests)
+
+    assert match_basic["id"] == "1225249"
+    assert "Bowling" in stats_page
+
+
+def test_stub_injects_errors(stub_settings, monkeypatch):
+    async def requests(session):
+        with pytest.raises(CricinfoAPIException) as ex:
+            await get_request(stub_settings.routes.match_basic, {"match_id": "1"}, BaseRoute.core, session=session)
+        return ex.value.status_code
+
+    assert _run_against_stub(stub_settings, monkeypatch, StubSettings(error_rate=1), requests) == 503